@@ -0,0 +1,189 @@
+"""
+Benchmark Game.update and Game.draw at scaled entity counts.
+
+Builds headless games holding N enemies and N sonic waves and times:
+
+- update: one full Game.update
+- collision: Game.resolve_wave_collisions
+- offscreen: Game.remove_offscreen_enemies
+- draw: Game.draw onto the offscreen surface
+
+Each measurement runs against a freshly restored, seeded scene so every call
+does the same work. Results are written as JSON; --compare flags entries
+that got slower than a stored baseline.
+
+Usage:
+    uv run python benchmarks/bench_game.py --output bench.json
+    uv run python benchmarks/bench_game.py --compare bench.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+import pygame
+
+from main import Game, KeyState, SCREEN_WIDTH
+
+DEFAULT_COUNTS = (1, 10, 100, 1000, 10000)
+BENCHMARKS = ('update', 'collision', 'offscreen', 'draw')
+
+
+class Scene:
+    def __init__(self, count, seed=0):
+        """
+        Headless game in the playing state holding count enemies on the ground
+        and count waves spread over the play area.
+
+        Pool capacities are raised to fit; the player is made invulnerable so
+        the game cannot end mid-measurement.
+        """
+        game_class = type('BenchGame', (Game,), {'MAX_ENEMIES': count, 'WAVE_POOL_CAPACITY': count})
+        self.game = game_class(headless=True, seed=seed)
+        self.seed = seed
+        rng = random.Random(seed)
+        ground_y = self.game.ground_y
+        self.enemy_positions = [(rng.randint(0, SCREEN_WIDTH - 50), ground_y - 50) for _ in range(count)]
+        self.wave_positions = [
+            (rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, ground_y), rng.choice((-1, 1)))
+            for _ in range(count)
+        ]
+
+    def restore(self):
+        """Put the game back into the initial scene, drawing the same random numbers again"""
+        game = self.game
+        game.rng.reseed(self.seed)
+        game.state = 'playing'
+        game.invulnerable = True
+        game.invulnerable_timer = 10 ** 9
+        game.spawn_timer = 1
+        game.enemy_pool.reset()
+        game.wave_pool.reset()
+        game.enemies = [
+            game.enemy_pool.acquire(x, y, game.pumpkin_image, game.rng.ai)
+            for x, y in self.enemy_positions
+        ]
+        game.sonic_waves = [game.wave_pool.acquire(x, y, d) for x, y, d in self.wave_positions]
+        return game
+
+
+def time_call(scene, call, min_time, max_repeat):
+    """
+    Time call(game) against a freshly restored scene until min_time has been spent.
+
+    Returns:
+        Median seconds per call
+    """
+    samples = []
+    spent = 0.0
+    while not samples or (spent < min_time and len(samples) < max_repeat):
+        game = scene.restore()
+        start = time.perf_counter()
+        call(game)
+        elapsed = time.perf_counter() - start
+        samples.append(elapsed)
+        spent += elapsed
+    return statistics.median(samples)
+
+
+def run_benchmarks(counts=DEFAULT_COUNTS, min_time=0.2, max_repeat=1000):
+    """
+    Returns:
+        Dict of benchmark -> {count (str): {'seconds', 'calls_per_sec'}}
+    """
+    keys = KeyState()
+    calls = {
+        'update': lambda game: game.update(keys),
+        'collision': lambda game: game.resolve_wave_collisions(),
+        'offscreen': lambda game: game.remove_offscreen_enemies(),
+        'draw': lambda game: game.draw(),
+    }
+    results = {name: {} for name in BENCHMARKS}
+    for count in counts:
+        scene = Scene(count)
+        for name in BENCHMARKS:
+            seconds = time_call(scene, calls[name], min_time, max_repeat)
+            results[name][str(count)] = {
+                'seconds': seconds,
+                'calls_per_sec': 1 / seconds if seconds > 0 else float('inf'),
+            }
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare results against a baseline.
+
+    Returns:
+        List of (benchmark, count, baseline seconds, current seconds, ratio, regressed)
+    """
+    rows = []
+    for name, by_count in results.items():
+        for count, current in by_count.items():
+            before = baseline.get(name, {}).get(count)
+            if before is None:
+                continue
+            ratio = current['seconds'] / before['seconds'] if before['seconds'] > 0 else 1.0
+            rows.append((name, count, before['seconds'], current['seconds'], ratio, ratio > 1 + threshold))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--counts', type=int, nargs='+', default=list(DEFAULT_COUNTS),
+                        help="entity counts to benchmark")
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help="seconds to spend measuring each benchmark/count pair")
+    parser.add_argument('--output', metavar='FILE', help="write results as JSON to FILE")
+    parser.add_argument('--compare', metavar='BASELINE', help="flag regressions against a results file")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="allowed slowdown before a result counts as a regression (0.10 = 10%%)")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    results = run_benchmarks(args.counts, args.min_time)
+    pygame.quit()
+
+    for name in BENCHMARKS:
+        for count, result in results[name].items():
+            print(f"{name:<10}{count:>7} entities {result['seconds'] * 1000:10.3f} ms "
+                  f"{result['calls_per_sec']:12.0f} calls/s")
+
+    if args.output:
+        document = {
+            'meta': {
+                'python': platform.python_version(),
+                'pygame': pygame.version.ver,
+                'platform': platform.platform(),
+                'cpu_count': os.cpu_count(),
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            },
+            'results': results,
+        }
+        with open(args.output, 'w') as f:
+            json.dump(document, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        regressions = 0
+        for name, count, before, current, ratio, regressed in compare(results, baseline, args.threshold):
+            flag = 'REGRESSION' if regressed else 'ok'
+            print(f"{name:<10}{count:>7} {before * 1000:10.3f} -> {current * 1000:10.3f} ms "
+                  f"({ratio:5.2f}x) {flag}")
+            regressions += regressed
+        if regressions:
+            print(f"{regressions} regression(s) over {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,177 @@
+"""
+Pre-decoded asset pack.
+
+One file holds every image the game draws as raw pixel rows, already scaled
+to its in-game size and stored in both orientations. The game maps the file
+and wraps each image's bytes in a Surface with pygame.image.frombuffer, so
+launching decodes no PNGs and reads only the pages it touches.
+
+Layout (little-endian):
+
+    header: magic b'KSAP', version (uint16), entry count (uint16)
+    index:  ENTRY per image (name, flipped, channels, width, height, pixel
+            offset, source file size and mtime)
+    pixels: each image's rows, RGB or RGBA, starting on an ALIGN boundary
+
+The source file stamp lets the game notice a PNG that changed after the pack
+was built and load that file instead.
+
+    python src/assetpack.py            # packs Game.ASSETS into Game.ASSET_PACK
+"""
+import argparse
+import mmap
+import os
+import struct
+import sys
+
+import pygame
+
+MAGIC = b'KSAP'
+VERSION = 1
+HEADER = struct.Struct('<4sHH')
+# name, flipped, channels, width, height, offset, source size, source mtime (ns)
+ENTRY = struct.Struct('<24sBBHHQQq')
+NAME_SIZE = 24
+ALIGN = 64
+FORMATS = {3: 'RGB', 4: 'RGBA'}
+
+
+def _source_stamp(path):
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def build_pack(assets, output):
+    """
+    Decode, scale and flip every asset and write them into one pack.
+
+    Args:
+        assets: List of (name, path, size) tuples; missing files are skipped
+        output: Path of the pack, replaced atomically
+
+    Returns:
+        Names of the assets packed
+
+    Raises:
+        ValueError: If a name does not fit the index
+    """
+    images = []
+    for name, path, size in assets:
+        encoded = name.encode()
+        if len(encoded) > NAME_SIZE:
+            raise ValueError(f"asset name too long for the pack index: {name!r}")
+        try:
+            source = pygame.image.load(path)
+        except (pygame.error, FileNotFoundError):
+            continue
+        channels = 4 if source.get_flags() & pygame.SRCALPHA else 3
+        scaled = pygame.transform.scale(source, size)
+        flipped = pygame.transform.flip(scaled, True, False)
+        stamp = _source_stamp(path)
+        for flip, image in ((False, scaled), (True, flipped)):
+            images.append((encoded, flip, channels, size,
+                           pygame.image.tobytes(image, FORMATS[channels]), stamp))
+
+    index = []
+    offsets = []
+    offset = HEADER.size + ENTRY.size * len(images)
+    for encoded, flip, channels, (width, height), pixels, (source_size, mtime) in images:
+        offset = -(-offset // ALIGN) * ALIGN
+        index.append(ENTRY.pack(encoded, flip, channels, width, height, offset, source_size, mtime))
+        offsets.append(offset)
+        offset += len(pixels)
+
+    partial = f"{output}.partial"
+    with open(partial, 'wb') as stream:
+        stream.write(HEADER.pack(MAGIC, VERSION, len(images)))
+        stream.writelines(index)
+        for offset, image in zip(offsets, images):
+            stream.write(b'\0' * (offset - stream.tell()))
+            stream.write(image[4])
+    os.replace(partial, output)
+    return list(dict.fromkeys(image[0].decode() for image in images))
+
+
+class AssetPack:
+    def __init__(self, path):
+        """
+        Map a pack built by build_pack.
+
+        Raises:
+            OSError: If the file cannot be opened
+            ValueError: If it is not a valid pack
+        """
+        with open(path, 'rb') as stream:
+            if os.fstat(stream.fileno()).st_size < HEADER.size:
+                raise ValueError(f"{path} is not an asset pack (too short)")
+            self._map = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        # Surfaces share this view's memory, so the map stays open for as
+        # long as the pack object (and the game holding it) lives
+        self._view = memoryview(self._map)
+        magic, version, count = HEADER.unpack_from(self._view, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not an asset pack")
+        if version != VERSION:
+            raise ValueError(f"unsupported asset pack version {version}")
+
+        self.entries = {}
+        try:
+            for i in range(count):
+                encoded, flip, channels, width, height, offset, source_size, mtime = \
+                    ENTRY.unpack_from(self._view, HEADER.size + i * ENTRY.size)
+                if channels not in FORMATS or offset + width * height * channels > len(self._view):
+                    raise ValueError(f"corrupt asset pack entry {i}")
+                name = encoded.rstrip(b'\0').decode()
+                self.entries[name, bool(flip)] = (channels, width, height, offset, (source_size, mtime))
+        except struct.error as error:
+            raise ValueError(f"corrupt asset pack: {error}") from None
+
+    def __contains__(self, name):
+        return (name, False) in self.entries
+
+    def is_fresh(self, name, path):
+        """
+        Check the pack still matches the loose file it was built from.
+
+        Returns:
+            False if the file at path changed since packing; True if it is
+            unchanged or absent (a pack can ship without the loose files)
+        """
+        try:
+            return _source_stamp(path) == self.entries[name, False][4]
+        except OSError:
+            return True
+
+    def surface(self, name, flip=False):
+        """
+        Wrap a packed image in a Surface without copying its pixels.
+
+        Raises:
+            KeyError: If the pack has no such image
+        """
+        channels, width, height, offset, _ = self.entries[name, flip]
+        pixels = self._view[offset:offset + width * height * channels]
+        return pygame.image.frombuffer(pixels, (width, height), FORMATS[channels])
+
+
+def open_pack(path):
+    """Map the pack at path, or get None if it is missing or unreadable"""
+    try:
+        return AssetPack(path)
+    except (OSError, ValueError):
+        return None
+
+
+def main(argv=None):
+    from main import Game
+
+    parser = argparse.ArgumentParser(description="Build the pre-decoded asset pack")
+    parser.add_argument('--output', default=Game.ASSET_PACK, help="pack to write")
+    args = parser.parse_args(argv)
+    packed = build_pack(Game.ASSETS, args.output)
+    print(f"Packed {', '.join(packed)} into {args.output} ({os.path.getsize(args.output)} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""
+Asset loading that converts surfaces to the display pixel format once.
+
+Blitting a surface whose format differs from the destination makes SDL
+convert every pixel on every blit. Converting at load time moves that cost
+out of the frame loop.
+"""
+import time
+
+import pygame
+
+
+def convert_surface(surface, target=None):
+    """
+    Convert a surface to the pixel format it will be blitted onto.
+
+    Uses the display surface when a window exists. Without one (headless
+    mode) opaque surfaces are converted to match target instead, and
+    per-pixel alpha surfaces are left as loaded, since convert_alpha()
+    needs a video mode.
+
+    Args:
+        surface: Surface to convert
+        target: Fallback surface whose format to match when there is no display
+
+    Returns:
+        Converted surface (or the original when no conversion is possible)
+    """
+    has_alpha = surface.get_flags() & pygame.SRCALPHA
+    if pygame.display.get_surface() is not None:
+        return surface.convert_alpha() if has_alpha else surface.convert()
+    if target is not None and not has_alpha:
+        return surface.convert(target)
+    return surface
+
+
+def load_image(path, target=None):
+    """Load an image file and convert it for fast blitting"""
+    return convert_surface(pygame.image.load(path), target)
+
+
+def measure_blit_rate(surface, target, duration=0.2):
+    """
+    Measure how many times per second surface can be blitted onto target.
+
+    Returns:
+        Blits per second
+    """
+    position = (0, 0)
+    blits = 0
+    batch = 100
+    start = time.perf_counter()
+    deadline = start + duration
+    while True:
+        for _ in range(batch):
+            target.blit(surface, position)
+        blits += batch
+        now = time.perf_counter()
+        if now >= deadline:
+            return blits / (now - start)
+
+
+def blit_report(assets, target, duration=0.2):
+    """
+    Compare blit throughput of raw and converted assets.
+
+    Args:
+        assets: List of (name, path, size) tuples; size is the in-game size
+        target: Surface the game draws onto
+        duration: Seconds to measure each variant for
+
+    Returns:
+        List of (name, raw blits/s, converted blits/s) tuples; missing files are skipped
+    """
+    results = []
+    for name, path, size in assets:
+        try:
+            raw = pygame.image.load(path)
+        except (pygame.error, FileNotFoundError):
+            continue
+        raw = pygame.transform.scale(raw, size)
+        converted = convert_surface(raw, target)
+        results.append((
+            name,
+            measure_blit_rate(raw, target, duration),
+            measure_blit_rate(converted, target, duration),
+        ))
+    return results
@@ -0,0 +1,151 @@
+"""
+Collision broadphase between sonic waves and enemies.
+
+Waves only move horizontally, so a sweep over enemies sorted by their left
+edge narrows each wave down to the few enemies overlapping it on x before the
+exact circle-rectangle test runs.
+
+The batch kernels at the bottom evaluate the same test for whole arrays of
+waves and rects in NumPy, for callers that keep entities in arrays. NumPy is
+imported on their first use, so the per-frame path starts without it.
+"""
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+
+np = None  # numpy is optional (the 'fast' extra); see _require_numpy
+
+# One overlapping (wave, enemy) pair, as indices into the lists passed in
+WaveHit = namedtuple('WaveHit', ['wave_index', 'enemy_index'])
+
+
+def find_wave_hits(waves, rects):
+    """
+    Find every wave/enemy pair that collides this frame.
+
+    Args:
+        waves: Sequence of SonicWave objects
+        rects: Sequence of enemy Rects
+
+    Returns:
+        List of WaveHit events, ordered by wave index then enemy index
+    """
+    if not waves or not rects:
+        return []
+
+    order = sorted(range(len(rects)), key=lambda i: rects[i].left)
+    lefts = [rects[i].left for i in order]
+    max_width = max(rect.width for rect in rects)
+
+    hits = []
+    for wave_index, wave in enumerate(waves):
+        # Any rect touching the circle has its left edge in this window
+        start = bisect_left(lefts, wave.x - wave.radius - max_width)
+        end = bisect_right(lefts, wave.x + wave.radius)
+        candidates = sorted(order[start:end])
+        for enemy_index in candidates:
+            if wave.collides_with(rects[enemy_index]):
+                hits.append(WaveHit(wave_index, enemy_index))
+    return hits
+
+
+def split_hits(hits):
+    """
+    Collapse hit events into the sets of waves and enemies to remove.
+
+    Returns:
+        Tuple of (wave indices, enemy indices) as sets
+    """
+    return {hit.wave_index for hit in hits}, {hit.enemy_index for hit in hits}
+
+
+def _require_numpy():
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("the batch collision kernels need numpy (install the 'fast' extra)") from None
+        np = numpy
+
+
+def wave_arrays(waves):
+    """Pack SonicWave objects into (x, y, radius) float arrays"""
+    _require_numpy()
+    x = np.fromiter((wave.x for wave in waves), dtype=np.float64, count=len(waves))
+    y = np.fromiter((wave.y for wave in waves), dtype=np.float64, count=len(waves))
+    radius = np.fromiter((wave.radius for wave in waves), dtype=np.float64, count=len(waves))
+    return x, y, radius
+
+
+def rect_arrays(rects):
+    """Pack Rects into (x, y, width, height) int arrays"""
+    _require_numpy()
+    packed = np.array([(rect.x, rect.y, rect.width, rect.height) for rect in rects],
+                      dtype=np.int64).reshape(-1, 4)
+    return packed[:, 0], packed[:, 1], packed[:, 2], packed[:, 3]
+
+
+def circle_rect_hit_matrix(wave_x, wave_y, radius, rect_x, rect_y, rect_w, rect_h):
+    """
+    Test every circle against every rect in one NumPy call.
+
+    Same semantics as SonicWave.collides_with: clamp the centre onto the rect
+    (right/bottom edges inclusive) and compare the squared distance with a
+    strict < radius**2.
+
+    Returns:
+        Boolean array of shape (waves, rects)
+    """
+    _require_numpy()
+    cx = np.asarray(wave_x, dtype=np.float64)[:, None]
+    cy = np.asarray(wave_y, dtype=np.float64)[:, None]
+    r = np.asarray(radius, dtype=np.float64)[:, None]
+    left = np.asarray(rect_x)[None, :]
+    top = np.asarray(rect_y)[None, :]
+    right = left + np.asarray(rect_w)[None, :]
+    bottom = top + np.asarray(rect_h)[None, :]
+
+    dx = cx - np.clip(cx, left, right)
+    dy = cy - np.clip(cy, top, bottom)
+    return dx * dx + dy * dy < r * r
+
+
+def circle_rect_hits(wave_x, wave_y, radius, rect_x, rect_y, rect_w, rect_h, chunk=2048):
+    """
+    Sparse form of circle_rect_hit_matrix.
+
+    Waves are processed in chunks so memory stays bounded at chunk * rects.
+
+    Returns:
+        Tuple of (wave indices, rect indices) arrays, ordered by wave then rect
+    """
+    _require_numpy()
+    wave_x = np.asarray(wave_x, dtype=np.float64)
+    wave_y = np.asarray(wave_y, dtype=np.float64)
+    radius = np.broadcast_to(np.asarray(radius, dtype=np.float64), wave_x.shape)
+    wave_parts = []
+    rect_parts = []
+    for start in range(0, len(wave_x), chunk):
+        stop = start + chunk
+        matrix = circle_rect_hit_matrix(wave_x[start:stop], wave_y[start:stop], radius[start:stop],
+                                        rect_x, rect_y, rect_w, rect_h)
+        waves, rects = np.nonzero(matrix)
+        wave_parts.append(waves + start)
+        rect_parts.append(rects)
+    if not wave_parts:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+    return np.concatenate(wave_parts), np.concatenate(rect_parts)
+
+
+def find_wave_hits_batch(waves, rects):
+    """
+    Vectorized drop-in for find_wave_hits.
+
+    Returns:
+        List of WaveHit events, ordered by wave index then enemy index
+    """
+    if not waves or not rects:
+        return []
+    wave_index, enemy_index = circle_rect_hits(*wave_arrays(waves), *rect_arrays(rects))
+    return [WaveHit(int(w), int(e)) for w, e in zip(wave_index, enemy_index)]
@@ -0,0 +1,21 @@
+"""Shared game constants, kept free of pygame so simulation modules can import them"""
+
+# Screen
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 600
+FPS = 60
+
+# Colors (Kiro brand colors)
+BLACK_900 = (13, 13, 13)
+PURPLE_500 = (121, 14, 203)
+WHITE = (255, 255, 255)
+PREY_300 = (156, 163, 175)
+SPOOKY_GREEN = (50, 205, 50)  # Lime green for spooky enemies
+
+# Physics
+GRAVITY = 0.3
+JUMP_POWER = -6
+MOVE_SPEED = 3
+
+# Shooting
+SHOOT_COOLDOWN = 30  # frames (0.5 seconds at 60 FPS)
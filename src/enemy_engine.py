@@ -0,0 +1,252 @@
+"""
+Struct-of-arrays enemy backend.
+
+Keeps every enemy's state in contiguous NumPy arrays and advances all of them
+with one vectorized step. Behaviour matches Enemy.update frame for frame when
+both are fed the same random draws.
+"""
+import random
+
+import numpy as np
+
+from constants import SCREEN_WIDTH, GRAVITY, JUMP_POWER, MOVE_SPEED
+
+ENEMY_SIZE = 50
+BOUNDARY_FRAMES = 60  # 1 second at 60 FPS, same as Enemy.update
+MIN_DIRECTION_INTERVAL = 30
+MAX_DIRECTION_INTERVAL = 90
+
+# Index order matches the action list Enemy.update chooses from
+ACTIONS = ['left', 'right', 'still', 'jump']
+ACTION_LEFT, ACTION_RIGHT, ACTION_STILL, ACTION_JUMP = range(4)
+
+
+def round_half_away(values):
+    """Round like pygame.Rect does when assigned a float (half away from zero)"""
+    truncated = np.trunc(values)
+    fraction = values - truncated
+    truncated += fraction >= 0.5
+    truncated -= fraction <= -0.5
+    return truncated
+
+
+class EnemyEngine:
+    # Names of the per-enemy state arrays, in the order they are stored
+    FIELDS = (
+        ('x', np.int64),
+        ('y', np.int64),
+        ('vel_y', np.float64),
+        ('move_direction', np.int64),
+        ('direction_timer', np.int64),
+        ('direction_change_interval', np.int64),
+        ('boundary_timer', np.int64),
+        ('boundary_direction', np.int64),
+        ('on_ground', np.bool_),
+        ('facing_right', np.bool_),
+    )
+
+    def __init__(self, capacity=1024):
+        """
+        Create an empty engine.
+
+        Args:
+            capacity: Initial number of enemy slots; grows automatically
+        """
+        self.count = 0
+        self.capacity = max(1, capacity)
+        for name, dtype in self.FIELDS:
+            setattr(self, '_' + name, np.zeros(self.capacity, dtype=dtype))
+
+    def __len__(self):
+        return self.count
+
+    def __getattr__(self, name):
+        # Expose each field as a view over the live enemies only
+        storage = self.__dict__.get('_' + name)
+        if storage is None:
+            raise AttributeError(name)
+        return storage[:self.count]
+
+    def _grow(self, needed):
+        capacity = self.capacity
+        while capacity < needed:
+            capacity *= 2
+        for name, dtype in self.FIELDS:
+            grown = np.zeros(capacity, dtype=dtype)
+            grown[:self.count] = getattr(self, '_' + name)[:self.count]
+            setattr(self, '_' + name, grown)
+        self.capacity = capacity
+
+    def spawn(self, x, y, rng=random):
+        """
+        Add an enemy, drawing its initial direction and interval like Enemy.__init__.
+
+        Returns:
+            Index of the new enemy
+        """
+        if self.count >= self.capacity:
+            self._grow(self.count + 1)
+        i = self.count
+        self.count += 1
+
+        self._x[i] = x
+        self._y[i] = y
+        self._vel_y[i] = 0
+        self._on_ground[i] = False
+        self._facing_right[i] = True
+        self._move_direction[i] = rng.choice([-1, 0, 1])
+        self._direction_timer[i] = 0
+        self._direction_change_interval[i] = rng.randint(MIN_DIRECTION_INTERVAL, MAX_DIRECTION_INTERVAL)
+        self._boundary_timer[i] = 0
+        self._boundary_direction[i] = 0
+        return i
+
+    def remove(self, mask):
+        """
+        Remove enemies where mask is True, keeping the survivors in order.
+
+        Args:
+            mask: Boolean array with one entry per live enemy
+        """
+        keep = np.flatnonzero(~np.asarray(mask, dtype=bool))
+        kept = len(keep)
+        for name, _ in self.FIELDS:
+            storage = getattr(self, '_' + name)
+            storage[:kept] = storage[keep]
+        self.count = kept
+
+    def remove_offscreen(self):
+        """Remove enemies whose rect is completely beyond the screen edges"""
+        x = self.x
+        self.remove((x + ENEMY_SIZE < 0) | (x > SCREEN_WIDTH))
+
+    def step(self, ground_y, rng=random):
+        """
+        Advance every enemy by one frame.
+
+        Args:
+            ground_y: Y-coordinate of the ground surface
+            rng: random.Random-like source (draws happen per enemy in index
+                order, exactly like calling Enemy.update on each enemy) or a
+                numpy Generator (draws are vectorized)
+        """
+        if self.count == 0:
+            return
+        step_enemies({name: getattr(self, name) for name, _ in self.FIELDS}, ground_y, rng)
+
+    @classmethod
+    def from_enemies(cls, enemies):
+        """Build an engine holding the state of a list of Enemy objects"""
+        engine = cls(capacity=len(enemies))
+        engine.count = len(enemies)
+        for i, enemy in enumerate(enemies):
+            engine._x[i] = enemy.rect.x
+            engine._y[i] = enemy.rect.y
+            engine._vel_y[i] = enemy.vel_y
+            engine._move_direction[i] = enemy.move_direction
+            engine._direction_timer[i] = enemy.direction_timer
+            engine._direction_change_interval[i] = enemy.direction_change_interval
+            engine._boundary_timer[i] = enemy.boundary_timer
+            engine._boundary_direction[i] = enemy.boundary_direction
+            engine._on_ground[i] = enemy.on_ground
+            engine._facing_right[i] = enemy.facing_right
+        return engine
+
+    def write_back(self, enemies):
+        """Copy engine state into a matching list of Enemy objects"""
+        for i, enemy in enumerate(enemies[:self.count]):
+            enemy.rect.x = int(self._x[i])
+            enemy.rect.y = int(self._y[i])
+            enemy.vel_y = float(self._vel_y[i])
+            enemy.move_direction = int(self._move_direction[i])
+            enemy.direction_timer = int(self._direction_timer[i])
+            enemy.direction_change_interval = int(self._direction_change_interval[i])
+            enemy.boundary_timer = int(self._boundary_timer[i])
+            enemy.boundary_direction = int(self._boundary_direction[i])
+            enemy.on_ground = bool(self._on_ground[i])
+            enemy.set_facing(bool(self._facing_right[i]))
+
+
+def step_enemies(fields, ground_y, rng=random):
+    """
+    Advance enemies held in arrays by one frame, in place.
+
+    Args:
+        fields: Mapping from every EnemyEngine.FIELDS name to an array; the
+            arrays share one shape, any number of dimensions, and enemies
+            take their random draws in C order
+        ground_y: Y-coordinate of the ground surface
+        rng: random.Random-like source or numpy Generator, as for EnemyEngine.step
+    """
+    x = fields['x']
+    y = fields['y']
+    vel_y = fields['vel_y']
+    move_direction = fields['move_direction']
+    direction_timer = fields['direction_timer']
+    interval = fields['direction_change_interval']
+    boundary_timer = fields['boundary_timer']
+    boundary_direction = fields['boundary_direction']
+    on_ground = fields['on_ground']
+    facing_right = fields['facing_right']
+
+    # Boundary hits force movement away from the edge for a while. Hits are
+    # rare, so masked copies are cheap here; dense updates below use
+    # arithmetic or logic ops instead
+    idle = boundary_timer == 0
+    hit_left = idle & (x <= 0)
+    hit_right = idle & ~hit_left & (x >= SCREEN_WIDTH - ENEMY_SIZE)
+    np.copyto(boundary_timer, BOUNDARY_FRAMES, where=hit_left | hit_right)
+    np.copyto(boundary_direction, 1, where=hit_left)
+    np.copyto(boundary_direction, -1, where=hit_right)
+
+    forced = boundary_timer > 0
+    boundary_timer -= forced
+    move_direction += (boundary_direction - move_direction) * forced
+
+    # Normal random movement for everyone else
+    direction_timer += ~forced
+    changing = np.flatnonzero(~forced & (direction_timer >= interval))
+    if len(changing):
+        actions, intervals = _draw_actions(rng, len(changing))
+        changing = np.unravel_index(changing, x.shape)
+        current = move_direction[changing]
+        current[actions == ACTION_LEFT] = -1
+        current[actions == ACTION_RIGHT] = 1
+        current[actions == ACTION_STILL] = 0
+        move_direction[changing] = current
+        jumping = (actions == ACTION_JUMP) & on_ground[changing]
+        jumping = tuple(index[jumping] for index in changing)
+        vel_y[jumping] = JUMP_POWER
+        on_ground[jumping] = False
+        direction_timer[changing] = 0
+        interval[changing] = intervals
+
+    # Facing follows movement; standing still keeps the last facing
+    facing_right &= move_direction == 0
+    facing_right |= move_direction > 0
+
+    # Horizontal movement, clamped to the screen
+    x += move_direction * MOVE_SPEED
+    np.maximum(x, 0, out=x)
+    np.minimum(x, SCREEN_WIDTH - ENEMY_SIZE, out=x)
+
+    # Gravity and ground collision
+    vel_y += GRAVITY
+    np.copyto(y, round_half_away(y + vel_y), casting='unsafe')
+    np.greater_equal(y, ground_y - ENEMY_SIZE, out=on_ground)
+    np.minimum(y, ground_y - ENEMY_SIZE, out=y)
+    vel_y *= ~on_ground
+
+
+def _draw_actions(rng, count):
+    if isinstance(rng, np.random.Generator):
+        actions = rng.integers(0, len(ACTIONS), count)
+        intervals = rng.integers(MIN_DIRECTION_INTERVAL, MAX_DIRECTION_INTERVAL + 1, count)
+        return actions, intervals
+
+    actions = np.empty(count, dtype=np.int64)
+    intervals = np.empty(count, dtype=np.int64)
+    for i in range(count):
+        actions[i] = ACTIONS.index(rng.choice(ACTIONS))
+        intervals[i] = rng.randint(MIN_DIRECTION_INTERVAL, MAX_DIRECTION_INTERVAL)
+    return actions, intervals
@@ -0,0 +1,111 @@
+"""
+Input sources that stand in for the keyboard and event queue.
+
+An input source has poll(frame) -> (keys, events), where keys behaves like
+pygame.key.get_pressed() and events is a list of pygame events (or
+keycodes.Event objects), or returns None once it has no more input. The
+sources here build their input from keycodes, so they work without pygame.
+"""
+from keycodes import Event, KEYDOWN, KEYUP, K_LEFT, K_RIGHT, K_SPACE, K_UP, K_x, K_z
+
+
+class KeyState:
+    """Stand-in for pygame.key.get_pressed() built from a set of held keys."""
+
+    def __init__(self, held=()):
+        self.held = frozenset(held)
+
+    def __getitem__(self, key):
+        return key in self.held
+
+
+class ScriptedInput:
+    def __init__(self, steps):
+        """
+        Scripted input source for headless runs.
+
+        Args:
+            steps: List of (frames, held_keys, tapped_keys) tuples. Held keys are
+                reported as pressed for every frame of the step. Tapped keys emit a
+                KEYDOWN on the first frame of the step and a KEYUP on its last frame.
+                The script loops once the last step finishes.
+        """
+        self.steps = []
+        for frames, held, tapped in steps:
+            self.steps.append((max(1, frames), KeyState(held), tuple(tapped)))
+        self.cycle_length = sum(frames for frames, _, _ in self.steps)
+
+    @classmethod
+    def demo(cls):
+        """Simple bot that starts the game, walks back and forth and keeps shooting"""
+        return cls([
+            (1, (), (K_SPACE,)),
+            (20, (K_RIGHT,), (K_x,)),
+            (20, (K_RIGHT, K_SPACE), (K_z,)),
+            (20, (K_LEFT,), (K_x,)),
+            (20, (K_LEFT, K_UP), (K_z,)),
+        ])
+
+    def poll(self, frame):
+        """
+        Get the input state for a frame.
+
+        Returns:
+            Tuple of (keys, events) where keys behaves like pygame.key.get_pressed()
+            and events is a list of events for handle_events
+        """
+        offset = frame % self.cycle_length
+        for frames, keys, tapped in self.steps:
+            if offset < frames:
+                events = []
+                if offset == 0:
+                    events.extend(Event(KEYDOWN, key=key) for key in tapped)
+                if offset == frames - 1:
+                    events.extend(Event(KEYUP, key=key) for key in tapped)
+                return keys, events
+            offset -= frames
+
+
+class BotInput:
+    def __init__(self, game, jump_distance=80):
+        """
+        Reactive bot that plays a live Game.
+
+        It starts the game, turns to face the nearest enemy, taps shoot
+        every other frame (the cooldown decides when a wave actually
+        fires) and jumps when an enemy gets close.
+
+        Args:
+            game: Game whose state the bot reads each frame
+            jump_distance: Horizontal distance at which it jumps an enemy
+        """
+        self.game = game
+        self.jump_distance = jump_distance
+        self._shoot_down = False
+
+    def poll(self, frame):
+        """
+        Get the input for a frame from the current game state.
+
+        Returns:
+            Tuple of (keys, events)
+        """
+        game = self.game
+        if game.state == 'start':
+            return KeyState(), [Event(KEYDOWN, key=K_SPACE)]
+        if game.state != 'playing':
+            return KeyState(), []
+
+        held = []
+        player = game.player.rect
+        nearest = min(game.enemies, key=lambda enemy: abs(enemy.rect.centerx - player.centerx), default=None)
+        if nearest is not None:
+            dx = nearest.rect.centerx - player.centerx
+            if (dx > 0) != game.player.facing_right:
+                held.append(K_RIGHT if dx > 0 else K_LEFT)
+            if abs(dx) < self.jump_distance:
+                held.append(K_UP)
+
+        self._shoot_down = not self._shoot_down
+        shoot_type = KEYDOWN if self._shoot_down else KEYUP
+        return KeyState(held), [Event(shoot_type, key=K_x)]
@@ -0,0 +1,40 @@
+"""
+Key and event codes the simulation reads, without importing pygame.
+
+The values are SDL2's, identical to the pygame constants of the same name,
+so pygame's key state and events can be passed straight to the simulation
+and Event objects built here can be handed to code that expects pygame's.
+"""
+
+# Event types
+QUIT = 0x100
+KEYDOWN = 0x300
+KEYUP = 0x301
+MOUSEBUTTONDOWN = 0x401
+
+# Keys (printable keys are their character code, the rest are scancode | 1 << 30)
+K_SPACE = ord(' ')
+K_a = ord('a')
+K_d = ord('d')
+K_r = ord('r')
+K_t = ord('t')
+K_w = ord('w')
+K_x = ord('x')
+K_z = ord('z')
+K_F3 = (1 << 30) | 60
+K_RIGHT = (1 << 30) | 79
+K_LEFT = (1 << 30) | 80
+K_DOWN = (1 << 30) | 81
+K_UP = (1 << 30) | 82
+
+
+class Event:
+    """Stand-in for pygame.event.Event: a type plus keyword attributes such as key"""
+
+    def __init__(self, type, **attributes):
+        self.type = type
+        self.__dict__.update(attributes)
+
+    def __repr__(self):
+        attributes = ', '.join(f"{name}={value!r}" for name, value in vars(self).items() if name != 'type')
+        return f"Event({self.type:#x}{', ' if attributes else ''}{attributes})"
@@ -1,275 +1,168 @@
+import time
+
+# Start of the startup report; everything below, imports included, is timed
+LAUNCHED = time.perf_counter()
+
 import pygame
 import sys
 import random
+import argparse
 
-# Initialize Pygame
-pygame.init()
-
-# Constants
-SCREEN_WIDTH = 800
-SCREEN_HEIGHT = 600
-FPS = 60
+from constants import (
+    SCREEN_WIDTH, SCREEN_HEIGHT,
+    BLACK_900, PURPLE_500, WHITE, PREY_300, SPOOKY_GREEN,
+)
+from sprites import sprite_cache
+from assets import convert_surface, load_image, blit_report
+from assetpack import open_pack
+from renderer import DirtyRectRenderer, FontCache, ScreenCache, SpriteBatch
+from inputs import KeyState, ScriptedInput
+from replay import InputRecorder, InputReplay
+from profiler import FrameProfiler
+from timestep import FixedTimestep
+from startup import StartupTimer
+from pipeline import FrameSnapshot, InputMailbox, SimulationThread, SnapshotBuffer
+import simulation
+from simulation import Simulation, SPRITE_SIZE
 
-# Colors (Kiro brand colors)
-BLACK_900 = (13, 13, 13)
-PURPLE_500 = (121, 14, 203)
-WHITE = (255, 255, 255)
-PREY_300 = (156, 163, 175)
-SPOOKY_GREEN = (50, 205, 50)  # Lime green for spooky enemies
 
-# Physics
-GRAVITY = 0.3
-JUMP_POWER = -6
-MOVE_SPEED = 3
+def interpolate(previous, current, alpha):
+    """Pixel position alpha of the way from the previous tick's value to the current one"""
+    return round(previous + (current - previous) * alpha)
 
-# Shooting
-SHOOT_COOLDOWN = 30  # frames (0.5 seconds at 60 FPS)
 
-class SonicWave:
-    def __init__(self, x, y, direction):
-        """
-        Initialize a sonic wave at the given position.
-        
-        Args:
-            x: Center x-coordinate (player center)
-            y: Center y-coordinate (player center)
-            direction: 1 for right, -1 for left (player's facing direction)
-        """
-        self.x = x
-        self.y = y
-        self.direction = direction  # 1 for right, -1 for left
-        self.speed = 8  # pixels per frame
-        self.radius = 15  # Fixed radius for the projectile
-        
-    def update(self):
-        """
-        Move the wave horizontally.
-        
-        Returns:
-            True if wave should continue existing, False if off-screen
-        """
-        self.x += self.speed * self.direction
-        
-        # Check if wave is off-screen
-        if self.x < -self.radius or self.x > SCREEN_WIDTH + self.radius:
-            return False
-        return True
+class SonicWave(simulation.SonicWave):
+    __slots__ = ()
         
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         """
         Render the sonic wave as a circle.
         
         Args:
             screen: Pygame surface to draw on
+            alpha: Position between the previous (0) and current (1) update
         """
+        x = int(self.x) if alpha >= 1.0 else interpolate(self.prev_x, self.x, alpha)
         # Draw circle with PURPLE_500 color
-        pygame.draw.circle(screen, PURPLE_500, (int(self.x), int(self.y)), self.radius, 3)
-        
-    def collides_with(self, rect):
-        """
-        Check if wave overlaps with a rectangular enemy.
-        
-        Uses circle-rectangle collision detection:
-        Find the closest point on the rectangle to the circle center,
-        then check if that point is within the circle's radius.
-        
-        Args:
-            rect: Pygame Rect object representing enemy bounds
-            
-        Returns:
-            True if circle overlaps rectangle, False otherwise
-        """
-        # Find the closest point on the rectangle to the circle center
-        closest_x = max(rect.left, min(self.x, rect.right))
-        closest_y = max(rect.top, min(self.y, rect.bottom))
-        
-        # Calculate distance from circle center to this closest point
-        distance_x = self.x - closest_x
-        distance_y = self.y - closest_y
-        distance_squared = distance_x ** 2 + distance_y ** 2
-        
-        # Check if distance is less than radius (collision detected)
-        return distance_squared < self.radius ** 2
+        return pygame.draw.circle(screen, PURPLE_500, (x, int(self.y)), self.radius, 3)
 
-class Player:
+class Player(simulation.Player):
     def __init__(self, x, y, image):
-        self.original_image = pygame.transform.scale(image, (50, 50))
-        self.image = self.original_image
-        self.facing_right = True
-        self.rect = self.image.get_rect()
-        self.rect.x = x
-        self.rect.y = y
-        self.vel_y = 0
-        self.on_ground = False
-        
-    def update(self, keys, ground_y):
-        # Horizontal movement and sprite flipping
-        moving_left = keys[pygame.K_LEFT] or keys[pygame.K_a]
-        moving_right = keys[pygame.K_RIGHT] or keys[pygame.K_d]
-        
-        if moving_left:
-            self.rect.x -= MOVE_SPEED
-            if self.facing_right:
-                self.facing_right = False
-                self.image = pygame.transform.flip(self.original_image, True, False)
-                
-        if moving_right:
-            self.rect.x += MOVE_SPEED
-            if not self.facing_right:
-                self.facing_right = True
-                self.image = self.original_image
-            
-        # Keep player on screen
-        if self.rect.x < 0:
-            self.rect.x = 0
-        if self.rect.x > SCREEN_WIDTH - self.rect.width:
-            self.rect.x = SCREEN_WIDTH - self.rect.width
-            
-        # Jumping
-        if (keys[pygame.K_SPACE] or keys[pygame.K_UP] or keys[pygame.K_w]) and self.on_ground:
-            self.vel_y = JUMP_POWER
-            self.on_ground = False
+        super().__init__(x, y, image)
+        self.original_image, self.flipped_image = sprite_cache.pair(image, (SPRITE_SIZE, SPRITE_SIZE))
+        
+    @property
+    def image(self):
+        """Sprite for the current facing, from the shared cache"""
+        return self.original_image if self.facing_right else self.flipped_image
             
-        # Apply gravity
-        self.vel_y += GRAVITY
-        self.rect.y += self.vel_y
-        
-        # Ground collision
-        if self.rect.bottom >= ground_y:
-            self.rect.bottom = ground_y
-            self.vel_y = 0
-            self.on_ground = True
-        else:
-            self.on_ground = False
+    def position(self, alpha=1.0):
+        """Top-left corner alpha of the way from the previous to the current position"""
+        if alpha >= 1.0:
+            return self.rect.topleft
+        return (interpolate(self.prev_x, self.rect.x, alpha),
+                interpolate(self.prev_y, self.rect.y, alpha))
             
-    def draw(self, screen):
-        screen.blit(self.image, self.rect)
+    def draw(self, screen, alpha=1.0):
+        """Blit the sprite alpha of the way from its previous to its current position"""
+        return screen.blit(self.image, self.position(alpha))
 
-class Enemy:
-    def __init__(self, x, y, image):
-        # Scale the enemy sprite to standard size
-        self.original_image = pygame.transform.scale(image, (50, 50))
-        self.image = self.original_image
-        self.facing_right = True
-        self.rect = self.image.get_rect()
-        self.rect.x = x
-        self.rect.y = y
-        
-        # Physics attributes (same as Player)
-        self.vel_y = 0
-        self.on_ground = False
-        
-        # Random movement AI attributes
-        self.move_direction = random.choice([-1, 0, 1])  # -1 = left, 0 = still, 1 = right
-        self.direction_timer = 0
-        self.direction_change_interval = random.randint(30, 90)
-        
-        # Boundary behavior attributes
-        self.boundary_timer = 0
-        self.boundary_direction = 0
-        
-    def update(self, ground_y):
-        """Update enemy position with physics-based random movement"""
-        # Check for boundary collision and set forced direction
-        if self.rect.x <= 0 and self.boundary_timer == 0:
-            # Hit left boundary - force movement right
-            self.boundary_timer = 60  # 1 second at 60 FPS
-            self.boundary_direction = 1
-        elif self.rect.x >= SCREEN_WIDTH - self.rect.width and self.boundary_timer == 0:
-            # Hit right boundary - force movement left
-            self.boundary_timer = 60
-            self.boundary_direction = -1
-        
-        # Decrement boundary timer
-        if self.boundary_timer > 0:
-            self.boundary_timer -= 1
-            # Override move_direction with boundary_direction
-            self.move_direction = self.boundary_direction
-        else:
-            # Normal random movement logic (only when timer is 0)
-            # Update direction change timer
-            self.direction_timer += 1
-            
-            # Change direction at random intervals
-            if self.direction_timer >= self.direction_change_interval:
-                # Choose new horizontal movement direction or jump
-                action = random.choice(['left', 'right', 'still', 'jump'])
-                
-                if action == 'left':
-                    self.move_direction = -1
-                elif action == 'right':
-                    self.move_direction = 1
-                elif action == 'still':
-                    self.move_direction = 0
-                elif action == 'jump' and self.on_ground:
-                    self.vel_y = JUMP_POWER
-                    self.on_ground = False
-                
-                self.direction_timer = 0
-                self.direction_change_interval = random.randint(30, 90)
-        
-        # Sprite flipping based on movement direction
-        if self.move_direction < 0:  # Moving left
-            if self.facing_right:
-                self.facing_right = False
-                self.image = pygame.transform.flip(self.original_image, True, False)
-        elif self.move_direction > 0:  # Moving right
-            if not self.facing_right:
-                self.facing_right = True
-                self.image = self.original_image
-        
-        # Apply horizontal movement
-        self.rect.x += self.move_direction * MOVE_SPEED
-        
-        # Keep enemy on screen horizontally
-        if self.rect.x < 0:
-            self.rect.x = 0
-        if self.rect.x > SCREEN_WIDTH - self.rect.width:
-            self.rect.x = SCREEN_WIDTH - self.rect.width
-        
-        # Apply gravity (same as player)
-        self.vel_y += GRAVITY
-        self.rect.y += self.vel_y
-        
-        # Ground collision
-        if self.rect.bottom >= ground_y:
-            self.rect.bottom = ground_y
-            self.vel_y = 0
-            self.on_ground = True
-        else:
-            self.on_ground = False
+class Enemy(simulation.Enemy):
+    __slots__ = ('original_image', 'flipped_image')
+
+    def reset(self, x, y, image, rng=random):
+        """Re-initialize this enemy in place (used when recycled from a pool)
         
-    def draw(self, screen):
-        screen.blit(self.image, self.rect)
+        Args:
+            image: Source image; the sprite is its cached 50x50 copy
+            rng: random.Random-like source for the movement AI
+        """
+        super().reset(x, y, image, rng)
+        # Standard-size sprite in both orientations, shared through the cache
+        self.original_image, self.flipped_image = sprite_cache.pair(image, (SPRITE_SIZE, SPRITE_SIZE))
+        
+    @property
+    def image(self):
+        """Sprite for the current facing, from the shared cache"""
+        return self.original_image if self.facing_right else self.flipped_image
+        
+    def position(self, alpha=1.0):
+        """Top-left corner alpha of the way from the previous to the current position"""
+        if alpha >= 1.0:
+            return self.rect.topleft
+        return (interpolate(self.prev_x, self.rect.x, alpha),
+                interpolate(self.prev_y, self.rect.y, alpha))
+            
+    def draw(self, screen, alpha=1.0):
+        """Blit the sprite alpha of the way from its previous to its current position"""
+        return screen.blit(self.image, self.position(alpha))
 
-class Game:
-    # Spawn system constants
-    MAX_ENEMIES = 5
-    MIN_SPAWN_INTERVAL = 30  # frames (0.5 seconds at 60 FPS)
-    MAX_SPAWN_INTERVAL = 90  # frames (1.5 seconds at 60 FPS)
-    EMPTY_SPAWN_INTERVAL = 10  # frames (immediate spawn when no enemies)
-    MIN_SPAWN_DISTANCE = 100  # pixels
+class Game(Simulation):
+    """Pygame front end: loads the images, draws the simulation and runs the window loop"""
+    
+    # Entities that can draw themselves
+    Player = Player
+    Enemy = Enemy
+    SonicWave = SonicWave
+    
+    # Simulation runs at TICK_RATE; rendering runs as often as this cap allows
+    # (0 = uncapped) and interpolates between the last two ticks
+    RENDER_FPS_CAP = 240
     
-    def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Kiro Shmup")
+    # Fast-forward multipliers the T key cycles through (0 = as fast as possible)
+    TURBO_SPEEDS = (1, 2, 4, 8, 0)
+    # Most real time spent simulating per rendered frame in turbo mode
+    TURBO_FRAME_BUDGET = 1 / 30
+    
+    # Point sizes of the fonts, each created the first time it is drawn with
+    FONT_SIZES = {'large': 72, 'medium': 48, 'small': 36, 'profiler': 22}
+    
+    # Pre-decoded copy of ASSETS, built by src/assetpack.py; loose files are
+    # the fallback when it is missing or older than them
+    ASSET_PACK = 'assets/assets.pack'
+    
+    # Image assets as (name, path, in-game size), packed into ASSET_PACK and
+    # used by --blit-report
+    ASSETS = [
+        ('player', 'assets/kiro-logo.png', (50, 50)),
+        ('enemy', 'assets/enemy.png', (50, 50)),
+        ('pumpkin', 'assets/pumpkin.png', (50, 50)),
+        ('heart', 'assets/heart.png', (30, 30)),
+    ]
+    
+    def __init__(self, headless=False, dirty_rects=False, seed=None, render_fps=None, rewind_seconds=0,
+                 turbo=1, startup=None):
+        """
+        Args:
+            startup: StartupTimer to record startup phases in (default: a new
+                one started now)
+        """
+        self.startup = StartupTimer() if startup is None else startup
+        self.report_startup = False  # Print the startup report after the first frame
+        self.headless = headless
+        self.render_fps = self.RENDER_FPS_CAP if render_fps is None else render_fps
+        self.turbo = turbo
+        self.turbo_rate = 1.0  # Measured game speed while in turbo
+        self.turbo_label = None  # (text, rendered surface)
+        self.pending_events = []  # Events waiting for the next tick
+        # Only the subsystems the game uses are started: video (with its event
+        # queue) for a window, fonts on first use, never audio or joysticks
+        if headless:
+            # No window: draw() still works against an offscreen surface
+            self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        else:
+            pygame.display.init()
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            pygame.display.set_caption("Kiro Shmup")
         self.clock = pygame.time.Clock()
-        self.running = True
-        self.state = 'start'  # 'start', 'playing', 'gameOver'
+        self.startup.lap('display')
         
-        # Enemy pool and spawn management
-        self.enemies = []
-        self.spawn_timer = 0
-        self.spawn_interval = random.randint(self.MIN_SPAWN_INTERVAL, self.MAX_SPAWN_INTERVAL)
+        self.asset_pack = open_pack(self.ASSET_PACK)
         
-        # Sonic wave attributes
-        self.sonic_waves = []  # List of active sonic wave projectiles
-        self.shoot_key_pressed = False
-        self.shoot_cooldown_timer = 0
-        
-        # Load Kiro logo for player
+        # Load Kiro logo for player (every asset is converted to the screen's
+        # pixel format on load so blits don't convert per pixel)
         try:
-            self.kiro_image = pygame.image.load('assets/kiro-logo.png')
+            self.kiro_image = self.load_asset('player')
         except:
             # Create a placeholder if image not found
             self.kiro_image = pygame.Surface((50, 50))
@@ -277,14 +170,14 @@ class Game:
         
         # Load enemy sprite
         try:
-            self.enemy_image = pygame.image.load('assets/enemy.png')
+            self.enemy_image = self.load_asset('enemy')
         except:
             # Fallback to Kiro logo if enemy sprite not found
             self.enemy_image = self.kiro_image
         
         # Load pumpkin sprite for spawned enemies
         try:
-            self.pumpkin_image = pygame.image.load('assets/pumpkin.png')
+            self.pumpkin_image = self.load_asset('pumpkin')
         except:
             # Fallback to orange placeholder surface if not found
             self.pumpkin_image = pygame.Surface((50, 50))
@@ -295,336 +188,546 @@ class Game:
         
         # Load heart icon for health display
         try:
-            heart_loaded = pygame.image.load('assets/heart.png')
-            self.heart_image = pygame.transform.scale(heart_loaded, (30, 30))
+            self.heart_image = self.load_asset('heart')
+            if self.heart_image.get_size() != (30, 30):
+                self.heart_image = pygame.transform.scale(self.heart_image, (30, 30))
         except:
             # Create a red circle fallback if image not found
             self.heart_image = pygame.Surface((30, 30), pygame.SRCALPHA)
             pygame.draw.circle(self.heart_image, (255, 0, 0), (15, 15), 15)
         
-        # Ground
-        self.ground_y = SCREEN_HEIGHT - 100
-        
-        # Font
-        self.font_large = pygame.font.Font(None, 72)
-        self.font_medium = pygame.font.Font(None, 48)
-        self.font_small = pygame.font.Font(None, 36)
-        
-        self.init_game()
-        
-    def init_game(self):
-        """Initialize/reset game objects"""
-        self.player = Player(100, self.ground_y - 50, self.kiro_image)
-        self.enemy = Enemy(600, self.ground_y - 50, self.enemy_image)
-        self.player_health = 3
-        self.invulnerable = False
-        self.invulnerable_timer = 0
-        self.invulnerable_duration = 60  # frames (1 second at 60 FPS)
-        
-        # Initialize empty enemy pool and spawn timer
-        self.enemies = []
-        self.spawn_timer = 0
-        self.spawn_interval = random.randint(self.MIN_SPAWN_INTERVAL, self.MAX_SPAWN_INTERVAL)
-        
-        # Reset sonic wave attributes
-        self.sonic_waves = []  # Clear all active sonic waves
-        self.shoot_key_pressed = False
-        self.shoot_cooldown_timer = 0
-    
-    def is_valid_spawn_position(self, x):
-        """Check if spawn position is far enough from player
-        
-        Args:
-            x: The x-coordinate to validate
-            
-        Returns:
-            True if distance >= MIN_SPAWN_DISTANCE, False otherwise
-        """
-        horizontal_distance = abs(x - self.player.rect.x)
-        return horizontal_distance >= self.MIN_SPAWN_DISTANCE
-    
-    def get_random_spawn_position(self):
-        """Generate random spawn position with validation
+        # Precompute both orientations of every entity sprite once
+        sprite_cache.pair(self.kiro_image, (SPRITE_SIZE, SPRITE_SIZE))
+        sprite_cache.pair(self.enemy_image, (SPRITE_SIZE, SPRITE_SIZE))
+        sprite_cache.pair(self.pumpkin_image, (SPRITE_SIZE, SPRITE_SIZE))
+        self.startup.lap('images')
         
-        Returns:
-            Valid x-coordinate for spawn, or None if no valid position found after 10 attempts
-        """
-        for _ in range(10):
-            # Generate random x-coordinate within screen bounds
-            # Account for enemy width (50 pixels) to keep fully on screen
-            x = random.randint(0, SCREEN_WIDTH - 50)
-            
-            if self.is_valid_spawn_position(x):
-                return x
+        self.fonts = FontCache()
+        self.screen_cache = ScreenCache()
+        # Sprites of one layer are submitted to SDL in a single call
+        self.sprite_batch = SpriteBatch()
         
-        # No valid position found after 10 attempts
-        return None
-    
-    def attempt_spawn(self):
-        """Attempt to spawn a new enemy if conditions are met
+        super().__init__(seed, rewind_seconds)
         
-        Checks:
-        - Game state is 'playing'
-        - Enemy pool size < MAX_ENEMIES
-        - Valid spawn position exists
+        # Dirty-rect rendering restores sprite areas from a cached background
+        self.dirty_renderer = None
+        if dirty_rects:
+            self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self.draw_background(self.background)
+            self.dirty_renderer = DirtyRectRenderer(self.screen, self.background)
+        self.startup.lap('simulation')
         
-        If all conditions met, creates new Enemy and adds to pool
+    def load_asset(self, name):
         """
-        # Check if game state is 'playing'
-        if self.state != 'playing':
-            return
-        
-        # Check if enemy pool size < MAX_ENEMIES
-        if len(self.enemies) >= self.MAX_ENEMIES:
-            return
-        
-        # Get valid spawn position
-        spawn_x = self.get_random_spawn_position()
-        if spawn_x is None:
-            return
+        Load one of ASSETS, converted for fast blitting.
         
-        # Create new Enemy instance at spawn position (on ground)
-        spawn_y = self.ground_y - 50  # Position enemy on ground (50 is enemy height)
-        new_enemy = Enemy(spawn_x, spawn_y, self.pumpkin_image)
+        The asset pack's copy is used when it has a current one: it is
+        already at the in-game size, and its flipped copy goes straight into
+        the sprite cache. Otherwise the loose file is decoded.
         
-        # Add enemy to pool
-        self.enemies.append(new_enemy)
-    
-    def update_spawn_timer(self):
-        """Update spawn timer and trigger spawn attempts
-        
-        Decrements spawn_timer each frame.
-        When timer reaches 0, calls attempt_spawn.
-        If no enemies exist, uses faster spawn interval.
+        Raises:
+            pygame.error, FileNotFoundError: If neither source has the asset
         """
-        # Decrement spawn_timer each frame
-        self.spawn_timer -= 1
+        path = next(path for asset, path, _ in self.ASSETS if asset == name)
+        pack = self.asset_pack
+        if pack is None or name not in pack or not pack.is_fresh(name, path):
+            return load_image(path, self.screen)
+        image = convert_surface(pack.surface(name), self.screen)
+        size = image.get_size()
+        sprite_cache.put(image, size, image)
+        sprite_cache.put(image, size, convert_surface(pack.surface(name, flip=True), self.screen), flip=True)
+        return image
+        
+    @property
+    def font_large(self):
+        return self.fonts.get(self.FONT_SIZES['large'])
+        
+    @property
+    def font_medium(self):
+        return self.fonts.get(self.FONT_SIZES['medium'])
+        
+    @property
+    def font_small(self):
+        return self.fonts.get(self.FONT_SIZES['small'])
+        
+    @property
+    def font_profiler(self):
+        return self.fonts.get(self.FONT_SIZES['profiler'])
+        
+    def first_frame_presented(self):
+        """Close the startup report once the first frame is on screen"""
+        self.startup.lap('first frame')
+        if self.report_startup:
+            print(self.startup.report())
+        
+    def sprite_images(self):
+        """Source images entities are created from, in a fixed order (used by save states)"""
+        return (self.kiro_image, self.enemy_image, self.pumpkin_image)
         
-        # Call attempt_spawn when timer reaches 0
-        if self.spawn_timer <= 0:
-            self.attempt_spawn()
-            
-            # If no enemies left, use faster spawn interval
-            if len(self.enemies) == 0:
-                self.spawn_timer = self.EMPTY_SPAWN_INTERVAL
-                self.spawn_interval = self.EMPTY_SPAWN_INTERVAL
-            else:
-                # Normal spawn interval
-                self.spawn_timer = self.spawn_interval
-                self.spawn_interval = random.randint(self.MIN_SPAWN_INTERVAL, self.MAX_SPAWN_INTERVAL)
     
-    def remove_offscreen_enemies(self):
-        """Remove enemies that have moved completely off-screen
-        
-        Checks if enemy's entire rect is beyond screen boundaries:
-        - Left boundary: x + width < 0
-        - Right boundary: x > SCREEN_WIDTH
-        
-        Removes off-screen enemies from the pool.
-        """
-        # Use list comprehension to keep only on-screen enemies
-        self.enemies = [
-            enemy for enemy in self.enemies
-            if not (enemy.rect.x + enemy.rect.width < 0 or enemy.rect.x > SCREEN_WIDTH)
-        ]
-        
-    def handle_events(self):
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE:
-                    if self.state == 'start':
-                        self.state = 'playing'
-                    elif self.state == 'gameOver':
-                        self.state = 'start'
-                        self.init_game()
-                # Shoot key handling (X or Z)
-                elif event.key in (pygame.K_x, pygame.K_z):
-                    if self.state == 'playing' and not self.shoot_key_pressed and self.shoot_cooldown_timer <= 0:
-                        # Create new SonicWave at player center position
-                        center_x = self.player.rect.centerx
-                        center_y = self.player.rect.centery
-                        # Pass player's facing direction (1 for right, -1 for left)
-                        direction = 1 if self.player.facing_right else -1
-                        new_wave = SonicWave(center_x, center_y, direction)
-                        self.sonic_waves.append(new_wave)  # Add to list of active waves
-                        self.shoot_key_pressed = True
-                        # Start cooldown timer
-                        self.shoot_cooldown_timer = SHOOT_COOLDOWN
-            elif event.type == pygame.KEYUP:
-                # Reset shoot key flag when key is released
-                if event.key in (pygame.K_x, pygame.K_z):
-                    self.shoot_key_pressed = False
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if self.state == 'start':
-                    self.state = 'playing'
-                elif self.state == 'gameOver':
-                    self.state = 'start'
-                    self.init_game()
+    def handle_events(self, events=None):
+        """Handle front-end keys (profiler, turbo), then pass events to the simulation"""
+        if events is None:
+            events = pygame.event.get()
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_F3:
+                    self.profiler.toggle()
+                elif event.key == pygame.K_t:
+                    self.cycle_turbo()
+        super().handle_events(events)
+                    
+    def cycle_turbo(self):
+        """Switch to the next fast-forward speed in TURBO_SPEEDS"""
+        speeds = self.TURBO_SPEEDS
+        index = speeds.index(self.turbo) if self.turbo in speeds else -1
+        self.turbo = speeds[(index + 1) % len(speeds)]
+        self.turbo_rate = 1.0
                     
-    def update(self):
-        if self.state == 'playing':
+    def update(self, keys=None):
+        if keys is None:
             keys = pygame.key.get_pressed()
-            self.player.update(keys, self.ground_y)
-            
-            # Update spawn timer and manage spawning
-            self.update_spawn_timer()
-            
-            # Update shoot cooldown timer
-            if self.shoot_cooldown_timer > 0:
-                self.shoot_cooldown_timer -= 1
-            
-            # Update all enemies in pool
-            for enemy in self.enemies:
-                enemy.update(self.ground_y)
-            
-            # Remove off-screen enemies after updates
-            self.remove_offscreen_enemies()
-            
-            # Update all sonic waves
-            waves_to_remove = []
-            for wave in self.sonic_waves:
-                # Call update() and mark wave for removal if it returns False (off-screen)
-                if not wave.update():
-                    waves_to_remove.append(wave)
-            
-            # Remove off-screen waves
-            for wave in waves_to_remove:
-                self.sonic_waves.remove(wave)
-            
-            # Collision detection between sonic waves and enemies
-            waves_to_remove = []
-            for wave in self.sonic_waves:
-                # Check if this wave hits any enemy
-                hit_enemy = False
-                for enemy in self.enemies:
-                    if wave.collides_with(enemy.rect):
-                        hit_enemy = True
-                        break
-                
-                # Mark wave for removal if it hit an enemy
-                if hit_enemy:
-                    waves_to_remove.append(wave)
-            
-            # Remove enemies that collide with any sonic wave
-            enemies_to_remove = []
-            for enemy in self.enemies:
-                for wave in self.sonic_waves:
-                    if wave.collides_with(enemy.rect):
-                        enemies_to_remove.append(enemy)
-                        break
-            
-            # Remove hit enemies
-            for enemy in enemies_to_remove:
-                if enemy in self.enemies:
-                    self.enemies.remove(enemy)
-            
-            # Remove waves that hit enemies
-            for wave in waves_to_remove:
-                if wave in self.sonic_waves:
-                    self.sonic_waves.remove(wave)
-            
-            # Update invulnerability timer
-            if self.invulnerable:
-                self.invulnerable_timer -= 1
-                if self.invulnerable_timer <= 0:
-                    self.invulnerable = False
-                    self.invulnerable_timer = 0
-            
-            # Check collision with all enemies in pool
-            for enemy in self.enemies:
-                if self.player.rect.colliderect(enemy.rect):
-                    # Only take damage if not invulnerable
-                    if not self.invulnerable:
-                        self.player_health -= 1
-                        
-                        # Check if game over
-                        if self.player_health <= 0:
-                            self.state = 'gameOver'
-                        else:
-                            # Set invulnerability after taking damage
-                            self.invulnerable = True
-                            self.invulnerable_timer = self.invulnerable_duration
-                        
-                        # Break after first collision to avoid multiple damage in same frame
-                        break
+        super().update(keys)
                 
-    def draw(self):
-        self.screen.fill(BLACK_900)
+    def draw(self, alpha=1.0):
+        """
+        Render one frame.
+        
+        Args:
+            alpha: How far past the previous tick to draw moving sprites
+                (0 = previous state, 1 = current state)
+        """
+        if self.dirty_renderer is not None:
+            self.draw_dirty(alpha)
+            return
+        
+        if self.state != 'start':
+            # The cached start screen already includes the background
+            self.draw_background(self.screen)
+        self.draw_state(alpha)
+        self.present()
+        
+    def draw_background(self, surface):
+        """Draw the static scene (backdrop and ground) onto surface"""
+        surface.fill(BLACK_900)
         
         # Draw ground platform
-        pygame.draw.rect(self.screen, PREY_300, 
+        pygame.draw.rect(surface, PREY_300, 
                         (0, self.ground_y, SCREEN_WIDTH, SCREEN_HEIGHT - self.ground_y))
         
+    def draw_state(self, alpha=1.0):
+        """Draw the current state on top of the background
+        
+        Only the playing state interpolates; elsewhere nothing moves.
+        
+        Returns:
+            List of rects covered by moving sprites
+        """
+        drawn = []
+        if self.rewinding:
+            # Saved positions interpolate forwards; don't blend them while going backwards
+            alpha = 1.0
         if self.state == 'start':
             self.draw_start_screen()
         elif self.state == 'playing':
-            self.player.draw(self.screen)
-            # Draw all enemies in pool
-            for enemy in self.enemies:
-                enemy.draw(self.screen)
+            # Only the dirty-rect renderer needs to know where sprites landed
+            rects = self.dirty_renderer is not None
+            drawn.extend(self.draw_sprites(alpha, rects))
             # Draw all sonic waves
             for wave in self.sonic_waves:
-                wave.draw(self.screen)
-            self.draw_health()
+                drawn.append(wave.draw(self.screen, alpha))
+            drawn.extend(self.draw_health(rects))
         elif self.state == 'gameOver':
-            self.player.draw(self.screen)
-            # Draw all enemies in pool
-            for enemy in self.enemies:
-                enemy.draw(self.screen)
+            self.draw_sprites(rects=False)
             self.draw_game_over_screen()
-            
-        pygame.display.flip()
+        if self.turbo != 1 and self.state == 'playing':
+            drawn.append(self.draw_turbo_label())
+        if self.profiler.enabled:
+            drawn.append(self.profiler.draw_overlay(self.screen, self.font_profiler, WHITE))
+        return drawn
+        
+    def draw_sprites(self, alpha=1.0, rects=True):
+        """Draw the player and every enemy in one batch
+        
+        Returns:
+            List of rects covered, if rects is set
+        """
+        batch = self.sprite_batch
+        player = self.player
+        batch.add(player.image, player.position(alpha))
+        batch.extend([(enemy.image, enemy.position(alpha)) for enemy in self.enemies])
+        return batch.draw(self.screen, rects)
+        
+    def draw_turbo_label(self, turbo=None, rate=None):
+        """Show the selected and the achieved fast-forward speed at the top of the screen
+        
+        Args:
+            turbo: Selected speed (default: the live setting)
+            rate: Measured speed (default: the live measurement)
+        
+        Returns:
+            Rect covered by the label
+        """
+        turbo = self.turbo if turbo is None else turbo
+        rate = self.turbo_rate if rate is None else rate
+        selected = "MAX" if turbo == 0 else f"{turbo}x"
+        text = f">> {selected} ({rate:.1f}x)"
+        if self.turbo_label is None or self.turbo_label[0] != text:
+            self.turbo_label = (text, self.font_small.render(text, True, SPOOKY_GREEN))
+        surface = self.turbo_label[1]
+        return self.screen.blit(surface, surface.get_rect(midtop=(SCREEN_WIDTH // 2, 10)))
+        
+    def draw_dirty(self, alpha=1.0):
+        """Redraw only the areas sprites moved through since the last frame"""
+        renderer = self.dirty_renderer
+        if renderer.state != self.state:
+            # State changed: draw the whole screen once
+            self.screen.blit(self.background, (0, 0))
+            renderer.reset(self.state, self.draw_state(alpha))
+            self.present()
+        elif self.state == 'playing':
+            renderer.erase()
+            self.present(renderer.commit(self.draw_state(alpha)))
+        # Start and game over screens are static, so there is nothing to redraw
+        
+    def present(self, rects=None):
+        """Push the frame to the display: the whole screen, or only rects"""
+        profiler = self.profiler if self.profiler.enabled else None
+        if profiler is not None:
+            profiler.lap('draw')
+        if not self.headless:
+            if rects is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(rects)
+        if profiler is not None:
+            profiler.lap('flip')
         
     def draw_start_screen(self):
-        title = self.font_large.render("KIRO SHMUP", True, PURPLE_500)
-        title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3))
-        self.screen.blit(title, title_rect)
-        
-        instruction = self.font_small.render("Press SPACE or click to start!", True, WHITE)
-        instruction_rect = instruction.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        self.screen.blit(instruction, instruction_rect)
-        
-        controls = self.font_small.render("Arrow Keys/WASD to move, SPACE to jump", True, PREY_300)
-        controls_rect = controls.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
-        self.screen.blit(controls, controls_rect)
-        
-        shoot_controls = self.font_small.render("Press X or Z to shoot sonic waves", True, PREY_300)
-        shoot_controls_rect = shoot_controls.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 90))
-        self.screen.blit(shoot_controls, shoot_controls_rect)
-        
-    def draw_health(self):
-        """Render hearts in top left corner to show player health"""
-        for i in range(self.player_health):
-            x_pos = 10 + (i * 40)
-            y_pos = 10
-            self.screen.blit(self.heart_image, (x_pos, y_pos))
+        lines = (
+            (self.font_large, "KIRO SHMUP", PURPLE_500, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3)),
+            (self.font_small, "Press SPACE or click to start!", WHITE, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)),
+            (self.font_small, "Arrow Keys/WASD to move, SPACE to jump", PREY_300, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50)),
+            (self.font_small, "Press X or Z to shoot sonic waves", PREY_300, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 90)),
+        )
+        # The whole frame (scene and text) is composed once, opaque, and
+        # reused until the text or resolution changes
+        screen = self.screen_cache.get('start', self.screen.get_size(), lines, backdrop=self.draw_background)
+        self.screen.blit(screen, (0, 0))
+        
+    def draw_health(self, rects=True):
+        """Render hearts in top left corner to show player health
+        
+        Returns:
+            List of rects covered by the hearts, if rects is set
+        """
+        batch = self.sprite_batch
+        batch.extend([(self.heart_image, (10 + i * 40, 10)) for i in range(self.player_health)])
+        return batch.draw(self.screen, rects)
     
     def draw_game_over_screen(self):
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(180)
-        overlay.fill(BLACK_900)
+        lines = (
+            (self.font_large, "GAME OVER", PURPLE_500, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50)),
+            (self.font_small, "Press SPACE or click to restart", WHITE, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50)),
+        )
+        # Translucent overlay and text pre-rendered into one surface
+        overlay = self.screen_cache.get('gameOver', self.screen.get_size(), lines,
+                                        fill=BLACK_900 + (180,))
         self.screen.blit(overlay, (0, 0))
         
-        game_over = self.font_large.render("GAME OVER", True, PURPLE_500)
-        game_over_rect = game_over.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
-        self.screen.blit(game_over, game_over_rect)
+    def snapshot(self, profile=None):
+        """
+        Capture what the renderer needs from the current tick.
+        
+        Args:
+            profile: Profiler stats to show in the overlay, or None
+        
+        Returns:
+            Immutable FrameSnapshot
+        """
+        player = self.player
+        return FrameSnapshot(
+            tick=self.ticks,
+            time=time.perf_counter(),
+            state=self.state,
+            player=(player.image, player.rect.x, player.rect.y, player.prev_x, player.prev_y),
+            enemies=tuple((enemy.image, enemy.rect.x, enemy.rect.y, enemy.prev_x, enemy.prev_y)
+                          for enemy in self.enemies),
+            waves=tuple((wave.x, wave.prev_x, wave.y, wave.radius) for wave in self.sonic_waves),
+            health=self.player_health,
+            rewinding=self.rewinding,
+            turbo=(self.turbo, self.turbo_rate) if self.turbo != 1 else None,
+            profile=profile,
+        )
+        
+    def draw_snapshot(self, snapshot, alpha=1.0):
+        """
+        Render a FrameSnapshot and flip; used by the render side of run_pipelined.
+        
+        Reads nothing from the live simulation except images, which are
+        never modified after loading.
+        """
+        screen = self.screen
+        if snapshot.state == 'start':
+            self.draw_start_screen()
+        else:
+            self.draw_background(screen)
+            if snapshot.state != 'playing' or snapshot.rewinding:
+                # Saved positions interpolate forwards; don't blend them while going backwards
+                alpha = 1.0
+            batch = self.sprite_batch
+            batch.extend([(image, (interpolate(prev_x, x, alpha), interpolate(prev_y, y, alpha)))
+                          for image, x, y, prev_x, prev_y in (snapshot.player,) + snapshot.enemies])
+            batch.draw(screen, rects=False)
+            if snapshot.state == 'playing':
+                for x, prev_x, y, radius in snapshot.waves:
+                    pygame.draw.circle(screen, PURPLE_500, (interpolate(prev_x, x, alpha), int(y)), radius, 3)
+                batch.extend([(self.heart_image, (10 + i * 40, 10)) for i in range(snapshot.health)])
+                batch.draw(screen, rects=False)
+            else:
+                self.draw_game_over_screen()
+        if snapshot.turbo is not None and snapshot.state == 'playing':
+            self.draw_turbo_label(*snapshot.turbo)
+        if snapshot.profile is not None:
+            self.profiler.draw_overlay(screen, self.font_profiler, WHITE, stats=snapshot.profile)
+        if not self.headless:
+            pygame.display.flip()
+        
+
+    def run_frame(self, timestep, elapsed, keys, events, recorder=None):
+        """
+        Run the simulation ticks owed for one rendered frame.
+        
+        In turbo mode real time is multiplied before it is paid out in ticks,
+        and at most TURBO_FRAME_BUDGET seconds go to simulating per frame.
+        Ticks still owed when the budget runs out are dropped, so the speed
+        settles at what the CPU can sustain instead of rendering falling
+        behind. Every tick is a full update, so frame-counted timers behave
+        exactly as at normal speed.
+        
+        Args:
+            timestep: FixedTimestep shared by every frame of the session
+            elapsed: Real seconds since the previous frame
+            keys: Held-key state sampled this frame
+            events: Events received this frame; they go to the next tick
+            recorder: Optional InputRecorder that captures every tick's input
+        
+        Returns:
+            Number of ticks run
+        """
+        self.pending_events.extend(events)
+        turbo = self.turbo
+        scale = turbo if turbo else 1
+        if timestep.scale != scale:
+            # Time owed at the old speed is not carried over
+            timestep.scale = scale
+            timestep.reset()
+        ticks = timestep.advance(elapsed)
+        if turbo == 0:
+            ticks = sys.maxsize
+        deadline = time.perf_counter() + self.TURBO_FRAME_BUDGET if turbo != 1 else None
+        run = 0
+        while run < ticks and self.running:
+            self.step(keys, self.pending_events, recorder)
+            self.pending_events = []
+            run += 1
+            if deadline is not None and time.perf_counter() >= deadline:
+                if run < ticks:
+                    timestep.reset()
+                break
+        if turbo != 1:
+            self.measure_turbo(run, elapsed)
+        return run
+        
+    def measure_turbo(self, ticks, elapsed):
+        """Fold the speed achieved by ticks run in elapsed real seconds into turbo_rate"""
+        if elapsed > 0:
+            # Smoothed achieved speed, shown next to the selected one
+            rate = ticks / (elapsed * self.TICK_RATE)
+            self.turbo_rate += (rate - self.turbo_rate) * 0.1
+        
+    def run(self, recorder=None):
+        """
+        Play interactively.
         
-        restart = self.font_small.render("Press SPACE or click to restart", True, WHITE)
-        restart_rect = restart.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
-        self.screen.blit(restart, restart_rect)
+        The simulation advances in fixed ticks of 1/TICK_RATE seconds however
+        long frames take to draw; each frame is drawn interpolated between the
+        last two ticks.
         
-    def run(self):
+        Args:
+            recorder: Optional InputRecorder that captures every tick's input
+        """
+        profiler = self.profiler
+        timestep = FixedTimestep(self.TICK_RATE)
+        last = time.perf_counter()
+        presented = False
         while self.running:
-            self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(FPS)
+            if profiler.enabled:
+                profiler.begin_frame()
+            now = time.perf_counter()
+            # Held keys are sampled once per frame and apply to all its ticks
+            self.run_frame(timestep, now - last, pygame.key.get_pressed(), pygame.event.get(), recorder)
+            last = now
+            self.draw(timestep.alpha)
+            if not presented:
+                presented = True
+                self.first_frame_presented()
+            if profiler.enabled:
+                profiler.end_frame()
+            self.clock.tick(self.render_fps)
             
+        if recorder is not None:
+            recorder.close()
+        profiler.close()
+        pygame.quit()
+        sys.exit()
+
+    def snapshot_alpha(self, snapshot, now):
+        """
+        How far past a snapshot's previous tick to draw it.
+        
+        The time since the snapshot was published, as a fraction of one tick
+        at the current turbo speed. Unlimited turbo has no tick length to
+        interpolate over, so it draws the newest positions.
+        """
+        if self.turbo == 0:
+            return 1.0
+        return min((now - snapshot.time) * self.TICK_RATE * self.turbo, 1.0)
+        
+    def run_pipelined(self, recorder=None):
+        """
+        Play interactively with simulation and rendering on separate threads.
+        
+        The simulation thread runs fixed ticks and publishes a snapshot after
+        each; this thread pumps events and draws the newest snapshot,
+        interpolated by the time elapsed since it was published. With the
+        profiler on, its phases time the simulation thread.
+        
+        Args:
+            recorder: Optional InputRecorder that captures every tick's input
+        """
+        mailbox = InputMailbox()
+        buffer = SnapshotBuffer()
+        simulation = SimulationThread(self, mailbox, buffer, recorder)
+        simulation.start()
+        presented = False
+        while self.running and simulation.is_alive():
+            mailbox.post(pygame.key.get_pressed(), pygame.event.get())
+            snapshot = buffer.latest()
+            if snapshot is not None:
+                self.draw_snapshot(snapshot, self.snapshot_alpha(snapshot, time.perf_counter()))
+                simulation.frame_drawn()
+                if not presented:
+                    presented = True
+                    self.first_frame_presented()
+            self.clock.tick(self.render_fps)
+        
+        simulation.stop()
+        simulation.join()
+        if recorder is not None:
+            recorder.close()
+        self.profiler.close()
         pygame.quit()
         sys.exit()
 
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Kiro Shmup")
+    parser.add_argument('--headless', action='store_true',
+                        help="run the simulation without a window and report simulated FPS")
+    parser.add_argument('--frames', type=int, default=100000,
+                        help="number of frames to simulate in headless mode")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="seed for all game randomness (reproducible runs)")
+    parser.add_argument('--record', metavar='FILE',
+                        help="record this session's input (and seed) to FILE")
+    parser.add_argument('--replay', metavar='FILE',
+                        help="replay a recorded session headlessly at full speed")
+    parser.add_argument('--render-fps', type=int, default=Game.RENDER_FPS_CAP,
+                        help="cap on rendered frames per second (0 = uncapped); "
+                             f"the simulation always runs at {Game.TICK_RATE} ticks/s")
+    parser.add_argument('--pipelined', action='store_true',
+                        help="simulate on a worker thread while the main thread renders "
+                             "(not with --dirty-rects)")
+    parser.add_argument('--turbo', choices=['1', '2', '4', '8', 'max'], default='1',
+                        help="start fast-forwarded (T cycles speeds while playing)")
+    parser.add_argument('--rewind-seconds', type=float, default=10,
+                        help="seconds of history kept for rewinding with R (0 disables; "
+                             "replays use the length they were recorded with)")
+    parser.add_argument('--dirty-rects', action='store_true',
+                        help="only redraw and update the screen areas that changed")
+    parser.add_argument('--profile', action='store_true',
+                        help="start with the frame profiler on (F3 toggles it while playing)")
+    parser.add_argument('--profile-jsonl', metavar='FILE',
+                        help="write per-frame phase timings to FILE as JSON Lines (implies --profile)")
+    parser.add_argument('--startup-report', action='store_true',
+                        help="print the time spent in each startup phase, up to the first "
+                             "frame on screen (--headless and --replay: up to the game being built, before any "
+                             "frame is simulated)")
+    parser.add_argument('--blit-report', action='store_true',
+                        help="compare blit throughput of raw and display-format assets")
+    args = parser.parse_args(argv)
+    if args.pipelined and args.dirty_rects:
+        # Snapshots are always drawn in full; there is no dirty-rect path for them
+        parser.error("--dirty-rects cannot be combined with --pipelined")
+    return args
+
+
+def print_profile(profiler):
+    """Print the profiler's rolling percentiles as a table"""
+    print(f"{'phase':<10}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for phase, stats in profiler.stats().items():
+        print(f"{phase:<10}{stats['p50']:9.3f}{stats['p95']:9.3f}{stats['p99']:9.3f}")
+
+
 if __name__ == "__main__":
-    game = Game()
-    game.run()
+    args = parse_args()
+    startup = StartupTimer(LAUNCHED)
+    startup.lap('imports')
+    profiling = args.profile or args.profile_jsonl is not None
+    turbo = 0 if args.turbo == 'max' else int(args.turbo)
+    if args.blit_report:
+        game = Game(headless=args.headless)
+        for name, raw, converted in blit_report(Game.ASSETS, game.screen):
+            print(f"{name:8} raw {raw:10.0f} blits/s   converted {converted:10.0f} blits/s "
+                  f"  ({converted / raw:.1f}x)")
+        pygame.quit()
+    elif args.replay:
+        with InputReplay(args.replay) as replay:
+            game = Game(headless=True, seed=replay.seed, rewind_seconds=replay.rewind_seconds,
+                        startup=startup)
+            if args.startup_report:
+                print(startup.report())
+            game.profiler = FrameProfiler(enabled=profiling, jsonl_path=args.profile_jsonl)
+            result = game.run_headless(input_source=replay)
+            game.profiler.close()
+        print(f"Replayed {result['frames']} frames in {result['seconds']:.2f}s "
+              f"({result['fps']:.0f} frames/s, seed {game.rng.seed})")
+        if profiling:
+            print_profile(game.profiler)
+        pygame.quit()
+    elif args.headless:
+        game = Game(headless=True, seed=args.seed, startup=startup)
+        if args.startup_report:
+            print(startup.report())
+        game.profiler = FrameProfiler(enabled=profiling, jsonl_path=args.profile_jsonl)
+        recorder = InputRecorder(args.record, game.rng.seed, game.rewind_seconds) if args.record else None
+        result = game.run_headless(args.frames, recorder=recorder)
+        if recorder is not None:
+            recorder.close()
+        game.profiler.close()
+        print(f"Simulated {result['frames']} frames in {result['seconds']:.2f}s "
+              f"({result['fps']:.0f} frames/s, seed {game.rng.seed})")
+        if profiling:
+            print_profile(game.profiler)
+        pygame.quit()
+    else:
+        game = Game(dirty_rects=args.dirty_rects, seed=args.seed, render_fps=args.render_fps,
+                    rewind_seconds=args.rewind_seconds, turbo=turbo, startup=startup)
+        game.report_startup = args.startup_report
+        game.profiler = FrameProfiler(enabled=profiling, jsonl_path=args.profile_jsonl)
+        recorder = InputRecorder(args.record, game.rng.seed, game.rewind_seconds) if args.record else None
+        if args.pipelined:
+            game.run_pipelined(recorder)
+        else:
+            game.run(recorder)
@@ -0,0 +1,171 @@
+"""
+Pipelined mode: simulation on a worker thread, rendering on the main thread.
+
+The simulation thread advances the game on a fixed timestep and publishes an
+immutable FrameSnapshot after every tick. The main thread keeps everything
+SDL needs (event pump, drawing, flip) and draws the newest snapshot, so
+drawing one tick overlaps simulating the next. Surface blits release the GIL,
+which is where the overlap comes from.
+
+Snapshots are never modified once published, so the buffer only has to hand
+over references: the renderer never waits for the simulation and the
+simulation never waits for the renderer.
+"""
+import sys
+import threading
+import time
+from collections import deque, namedtuple
+
+from inputs import KeyState
+from timestep import FixedTimestep
+
+# Sprites are (image, x, y, prev_x, prev_y) and waves (x, prev_x, y, radius),
+# with prev_* the position one tick earlier. time is the perf_counter() value
+# at publication, rewinding is set while R steps back through history (prev_*
+# then lies ahead of the current frame), turbo is (selected speed, measured
+# speed) outside normal speed and None at 1x, and profile holds the
+# profiler's stats or None.
+FrameSnapshot = namedtuple('FrameSnapshot', [
+    'tick', 'time', 'state', 'player', 'enemies', 'waves', 'health', 'rewinding', 'turbo', 'profile',
+])
+
+
+class SnapshotBuffer:
+    def __init__(self, slots=3):
+        """
+        Args:
+            slots: Number of recent snapshots kept alive (2 = double, 3 = triple buffering)
+        """
+        self.slots = deque(maxlen=slots)
+        self._published = threading.Condition()
+
+    def publish(self, snapshot):
+        with self._published:
+            self.slots.append(snapshot)
+            self._published.notify_all()
+
+    def latest(self):
+        """Newest snapshot, or None before the first one is published"""
+        with self._published:
+            return self.slots[-1] if self.slots else None
+
+    def wait(self, predicate, timeout=None):
+        """
+        Block until the newest snapshot satisfies predicate.
+
+        Returns:
+            The newest snapshot, which may not satisfy predicate if timeout expired
+        """
+        with self._published:
+            self._published.wait_for(lambda: self.slots and predicate(self.slots[-1]), timeout)
+            return self.slots[-1] if self.slots else None
+
+
+class InputMailbox:
+    """Hands input from the main thread (which owns the event pump) to the simulation"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._keys = KeyState()
+        self._events = []
+
+    def post(self, keys, events):
+        """Replace the held keys and queue events for the next tick"""
+        with self._lock:
+            self._keys = keys
+            self._events.extend(events)
+
+    def take(self):
+        """
+        Get the input for one tick; each event is delivered exactly once.
+
+        Returns:
+            Tuple of (keys, events)
+        """
+        with self._lock:
+            events = self._events
+            self._events = []
+            return self._keys, events
+
+
+class SimulationThread(threading.Thread):
+    # Ticks between refreshes of the profiler stats carried in snapshots
+    PROFILE_REFRESH = 30
+
+    def __init__(self, game, mailbox, buffer, recorder=None):
+        """
+        Args:
+            game: Game to advance; only this thread touches its simulation state
+            mailbox: InputMailbox the main thread posts input to
+            buffer: SnapshotBuffer receiving a snapshot per tick
+            recorder: Optional InputRecorder that captures every tick's input
+        """
+        super().__init__(name='simulation', daemon=True)
+        self.game = game
+        self.mailbox = mailbox
+        self.buffer = buffer
+        self.recorder = recorder
+        self.stopping = threading.Event()
+        self.drawn = threading.Event()
+
+    def stop(self):
+        self.stopping.set()
+        self.drawn.set()
+
+    def frame_drawn(self):
+        """Called by the render thread after it has drawn a snapshot"""
+        self.drawn.set()
+
+    def run(self):
+        game = self.game
+        profiler = game.profiler
+        timestep = FixedTimestep(game.TICK_RATE)
+        profile = None
+        self.buffer.publish(game.snapshot())
+        last = time.perf_counter()
+        while game.running and not self.stopping.is_set():
+            # Turbo scales game time, as in Game.run_frame
+            turbo = game.turbo
+            scale = turbo if turbo else 1
+            if timestep.scale != scale:
+                timestep.scale = scale
+                timestep.reset()
+            now = time.perf_counter()
+            elapsed = now - last
+            last = now
+            ticks = timestep.advance(elapsed)
+            if turbo == 0:
+                ticks = sys.maxsize
+            # Outside 1x at most TURBO_FRAME_BUDGET seconds go to one batch of
+            # ticks; ticks still owed when it runs out are dropped
+            deadline = now + game.TURBO_FRAME_BUDGET if turbo != 1 else None
+            self.drawn.clear()
+            run = 0
+            while run < ticks:
+                if profiler.enabled:
+                    profiler.begin_frame()
+                keys, events = self.mailbox.take()
+                game.step(keys, events, self.recorder)
+                if profiler.enabled:
+                    profiler.end_frame()
+                    # Stats are computed here, where the samples are recorded
+                    if profile is None or profiler.frame % self.PROFILE_REFRESH == 0:
+                        profile = profiler.stats()
+                else:
+                    profile = None
+                run += 1
+                self.buffer.publish(game.snapshot(profile))
+                if not game.running:
+                    break
+                if deadline is not None and time.perf_counter() >= deadline:
+                    if run < ticks:
+                        timestep.reset()
+                    break
+            if turbo != 1:
+                game.measure_turbo(run, elapsed)
+            if turbo == 0:
+                # Unlimited turbo: let the renderer show this batch before the next
+                self.drawn.wait(game.TURBO_FRAME_BUDGET)
+            else:
+                # Sleep until the next tick is due (or until stopped)
+                self.stopping.wait((timestep.dt - timestep.accumulator) / timestep.scale)
@@ -0,0 +1,126 @@
+"""
+Fixed-capacity object pools for short-lived entities.
+
+Objects are allocated once up front and recycled through a free list, so the
+game loop stops creating garbage for every shot and spawn. Pooled classes use
+__slots__ and provide reset(*args) to re-initialise a recycled instance.
+
+A pool is either a hard cap (acquire gives None when it is full) or, with
+grow=True, a starting size that doubles whenever it runs out.
+"""
+
+
+class EntityPool:
+    def __init__(self, cls, capacity, grow=False):
+        """
+        Preallocate a pool of entities.
+
+        Args:
+            cls: Entity class with __slots__ including 'pool_slot' and a reset() method
+            capacity: Maximum number of live entities (the initial number if grow is set)
+            grow: Allocate more entities when the pool runs out instead of refusing
+        """
+        self.cls = cls
+        self.capacity = 0
+        self.grow = grow
+        self.objects = []
+        self.generations = []
+        self.in_use = []
+        self.free = []
+        self._extend(capacity)
+
+    def _extend(self, count):
+        start = self.capacity
+        for slot in range(start, start + count):
+            obj = self.cls.__new__(self.cls)
+            obj.pool_slot = slot
+            self.objects.append(obj)
+        self.generations.extend([0] * count)
+        self.in_use.extend([False] * count)
+        self.capacity += count
+        # Pop from the end so low slots are handed out first
+        self.free[:0] = range(self.capacity - 1, start - 1, -1)
+
+    def __len__(self):
+        """Number of live entities"""
+        return self.capacity - len(self.free)
+
+    def acquire(self, *args):
+        """
+        Take an entity from the free list and reset it with args.
+
+        Returns:
+            The entity, or None if the pool is exhausted and cannot grow
+        """
+        if not self.free:
+            if not self.grow:
+                return None
+            self._extend(max(1, self.capacity))
+        slot = self.free.pop()
+        self.in_use[slot] = True
+        obj = self.objects[slot]
+        obj.reset(*args)
+        return obj
+
+    def release(self, obj):
+        """Return an entity to the free list; objects not owned by this pool are ignored"""
+        slot = getattr(obj, 'pool_slot', -1)
+        if slot < 0 or slot >= self.capacity or self.objects[slot] is not obj:
+            return
+        if not self.in_use[slot]:
+            return
+        self.in_use[slot] = False
+        self.generations[slot] += 1
+        self.free.append(slot)
+
+    def reset(self):
+        """Release every entity at once"""
+        for slot in range(self.capacity):
+            if self.in_use[slot]:
+                self.in_use[slot] = False
+                self.generations[slot] += 1
+        self.free = list(range(self.capacity - 1, -1, -1))
+
+    def remove_indices(self, live, indices):
+        """
+        Swap-remove entries from a list of live entities and release them.
+
+        The last entry fills each hole, so removal is O(1) per entity but does
+        not preserve the order of the survivors.
+
+        Args:
+            live: List of live entities, modified in place
+            indices: Positions in live to remove
+        """
+        for index in sorted(set(indices), reverse=True):
+            obj = live[index]
+            last = live.pop()
+            if index < len(live):
+                live[index] = last
+            self.release(obj)
+
+    def handle(self, obj):
+        """
+        Get a (slot, generation) handle that goes stale once the entity is released.
+
+        Returns:
+            Handle tuple, or None for objects not owned by this pool
+        """
+        slot = getattr(obj, 'pool_slot', -1)
+        if slot < 0 or slot >= self.capacity or self.objects[slot] is not obj:
+            return None
+        return slot, self.generations[slot]
+
+    def resolve(self, handle):
+        """
+        Look up the entity behind a handle.
+
+        Returns:
+            The entity, or None if the handle is stale
+        """
+        if handle is None:
+            return None
+        slot, generation = handle
+        if self.in_use[slot] and self.generations[slot] == generation:
+            return self.objects[slot]
+        return None
@@ -0,0 +1,138 @@
+"""
+Per-phase frame profiler.
+
+The game calls lap(phase) after each phase of a frame; the time since the
+previous lap is charged to that phase. Callers check `enabled` before
+lapping, so a disabled profiler costs one attribute test per phase.
+"""
+import json
+import math
+import time
+from collections import deque
+
+# Frame phases in the order they run
+PHASES = ('events', 'player', 'spawn', 'enemies', 'waves', 'collision', 'draw', 'flip')
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class FrameProfiler:
+    def __init__(self, window=300, enabled=False, jsonl_path=None):
+        """
+        Args:
+            window: Number of recent frames the rolling percentiles cover
+            enabled: Start timing immediately
+            jsonl_path: Optional file that receives one JSON line of timings per frame
+        """
+        self.window = window
+        self.enabled = enabled
+        self.samples = {phase: deque(maxlen=window) for phase in PHASES + ('total',)}
+        self.frame = 0
+        self.jsonl = open(jsonl_path, 'w') if jsonl_path else None
+        self._current = {}
+        self._frame_start = 0.0
+        self._last = 0.0
+        self._overlay = None
+        self._overlay_age = 0
+
+    def toggle(self):
+        """Switch timing on or off; statistics restart when switched on"""
+        self.enabled = not self.enabled
+        if self.enabled:
+            for values in self.samples.values():
+                values.clear()
+            self._overlay = None
+            # Toggled mid-frame: time the rest of this frame from here
+            self.begin_frame()
+
+    def begin_frame(self):
+        self._current = {}
+        self._frame_start = self._last = time.perf_counter()
+
+    def lap(self, phase):
+        """Charge the time since the previous lap to phase"""
+        now = time.perf_counter()
+        self._current[phase] = self._current.get(phase, 0.0) + (now - self._last)
+        self._last = now
+
+    def end_frame(self):
+        """Fold this frame's timings into the rolling windows"""
+        total = time.perf_counter() - self._frame_start
+        current = self._current
+        for phase in PHASES:
+            self.samples[phase].append(current.get(phase, 0.0))
+        self.samples['total'].append(total)
+        if self.jsonl is not None:
+            record = {'frame': self.frame}
+            for phase in PHASES:
+                record[phase] = round(current.get(phase, 0.0) * 1000, 4)
+            record['total'] = round(total * 1000, 4)
+            self.jsonl.write(json.dumps(record) + '\n')
+        self.frame += 1
+
+    def stats(self):
+        """
+        Rolling percentiles per phase.
+
+        Returns:
+            Dict of phase -> {'p50', 'p95', 'p99'} in milliseconds
+        """
+        result = {}
+        for phase, values in self.samples.items():
+            ordered = sorted(values)
+            result[phase] = {
+                name: percentile(ordered, fraction) * 1000
+                for name, fraction in (('p50', 0.50), ('p95', 0.95), ('p99', 0.99))
+            }
+        return result
+
+    def draw_overlay(self, screen, font, color, refresh=30, stats=None):
+        """
+        Draw the percentile table in the top-right corner.
+
+        The table is re-rendered every `refresh` frames and blitted from a
+        cached surface in between.
+
+        Args:
+            stats: Precomputed stats() result, for callers drawing on another
+                thread than the one recording samples
+
+        Returns:
+            Rect covered by the overlay
+        """
+        self._overlay_age += 1
+        overlay = self._overlay
+        if overlay is None or self._overlay_age >= refresh:
+            self._overlay_age = 0
+            if stats is None:
+                stats = self.stats()
+            lines = ["phase       p50   p95   p99 ms"]
+            for phase in PHASES + ('total',):
+                s = stats[phase]
+                lines.append(f"{phase:<9}{s['p50']:6.2f}{s['p95']:6.2f}{s['p99']:6.2f}")
+            rendered = [font.render(line, True, color) for line in lines]
+            height = sum(surface.get_height() for surface in rendered)
+            width = max(surface.get_width() for surface in rendered)
+            # Only the overlay needs pygame; the simulation core uses the
+            # profiler without it
+            import pygame
+            overlay = pygame.Surface((width + 8, height + 8), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, 160))
+            y = 4
+            for surface in rendered:
+                overlay.blit(surface, (4, y))
+                y += surface.get_height()
+            self._overlay = overlay
+        position = (screen.get_width() - overlay.get_width() - 10, 10)
+        return screen.blit(overlay, position)
+
+    def close(self):
+        if self.jsonl is not None:
+            self.jsonl.close()
+            self.jsonl = None
@@ -0,0 +1,121 @@
+"""
+Pure-Python axis-aligned rectangle for the simulation.
+
+Covers the part of pygame.Rect the game logic uses. Coordinates are ints;
+pygame.Rect rounds a float assigned to them half away from zero, and code
+moving a Rect by a float velocity does the same through round_half_away,
+so physics lands on the same pixels with or without pygame.
+"""
+
+
+def round_half_away(value):
+    """Round a float half away from zero, like pygame.Rect attribute assignment"""
+    truncated = int(value)
+    fraction = value - truncated
+    if fraction >= 0.5:
+        return truncated + 1
+    if fraction <= -0.5:
+        return truncated - 1
+    return truncated
+
+
+class Rect:
+    # Plain slots: the game reads and writes x and y many times per entity
+    # per tick, and a property would double the cost of each access
+    __slots__ = ('x', 'y', 'width', 'height')
+
+    def __init__(self, x, y, width, height):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+
+    @property
+    def left(self):
+        return self.x
+
+    @left.setter
+    def left(self, value):
+        self.x = value
+
+    @property
+    def top(self):
+        return self.y
+
+    @top.setter
+    def top(self, value):
+        self.y = value
+
+    @property
+    def right(self):
+        return self.x + self.width
+
+    @right.setter
+    def right(self, value):
+        self.x = value - self.width
+
+    @property
+    def bottom(self):
+        return self.y + self.height
+
+    @bottom.setter
+    def bottom(self, value):
+        self.y = value - self.height
+
+    @property
+    def centerx(self):
+        return self.x + self.width // 2
+
+    @property
+    def centery(self):
+        return self.y + self.height // 2
+
+    @property
+    def center(self):
+        return self.centerx, self.centery
+
+    @property
+    def topleft(self):
+        return self.x, self.y
+
+    @property
+    def size(self):
+        return self.width, self.height
+
+    def copy(self):
+        return Rect(self.x, self.y, self.width, self.height)
+
+    def colliderect(self, other):
+        """True if the rects overlap; touching edges and empty rects don't count"""
+        # Called for every enemy every tick: read each attribute once, and
+        # test overlap first since most pairs are far apart
+        x = self.x
+        width = self.width
+        other_x = other.x
+        other_width = other.width
+        if not (x < other_x + other_width and other_x < x + width):
+            return False
+        y = self.y
+        height = self.height
+        other_y = other.y
+        other_height = other.height
+        return bool(y < other_y + other_height and other_y < y + height
+                    and width and height and other_width and other_height)
+
+    def __iter__(self):
+        return iter((self.x, self.y, self.width, self.height))
+
+    def __len__(self):
+        return 4
+
+    def __getitem__(self, index):
+        return (self.x, self.y, self.width, self.height)[index]
+
+    def __eq__(self, other):
+        try:
+            return tuple(self) == tuple(other)
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        return f"<Rect({self.x}, {self.y}, {self.width}, {self.height})>"
@@ -0,0 +1,188 @@
+"""
+Dirty-rectangle rendering.
+
+Instead of clearing and flipping the whole screen every frame, only the
+areas covered by moving sprites last frame and this frame are restored from
+a cached background and pushed to the display.
+
+Static screens (start screen, game over overlay) are composed once into a
+single surface and reused until their text or the resolution changes. A
+screen with a backdrop is composed opaque and in the display format, so it
+costs one plain copy per frame; only overlays keep per-pixel alpha.
+
+Sprites are collected into a SpriteBatch and submitted with one blits call
+per frame rather than one blit per sprite.
+"""
+import pygame
+
+
+class DirtyRectRenderer:
+    def __init__(self, screen, background):
+        """
+        Args:
+            screen: Surface the game draws onto
+            background: Surface holding the static scene (same size as screen)
+        """
+        self.screen = screen
+        self.background = background
+        self.state = None  # Game state the screen was last fully drawn for
+        self.previous = []  # Rects covered by sprites last frame
+
+    def invalidate(self):
+        """Force a full redraw on the next frame"""
+        self.state = None
+
+    def reset(self, state, drawn):
+        """Record a full redraw of state with sprites covering drawn"""
+        self.state = state
+        self.previous = list(drawn)
+
+    def erase(self):
+        """Restore the background under last frame's sprites"""
+        for rect in self.previous:
+            self.screen.blit(self.background, rect, rect)
+
+    def commit(self, drawn):
+        """
+        Record this frame's sprite rects.
+
+        Returns:
+            Rects to push with pygame.display.update (last frame's and this frame's)
+        """
+        dirty = self.previous + drawn
+        self.previous = drawn
+        return dirty
+
+
+class SpriteBatch:
+    def __init__(self):
+        """
+        Sprite blits collected over a frame and submitted together.
+
+        Positions are grouped by source surface, so every sprite sharing an
+        image goes to SDL back to back. Groups are drawn in the order their
+        surface was first added: layers added one after another keep their
+        stacking, but sprites within a layer stack by image rather than by
+        the order they were added.
+        """
+        self._groups = {}  # surface -> [position, ...]
+
+    def add(self, surface, position):
+        positions = self._groups.get(surface)
+        if positions is None:
+            self._groups[surface] = [position]
+        else:
+            positions.append(position)
+
+    def extend(self, sprites):
+        """Add (surface, position) pairs"""
+        groups = self._groups
+        for surface, position in sprites:
+            positions = groups.get(surface)
+            if positions is None:
+                groups[surface] = [position]
+            else:
+                positions.append(position)
+
+    def __len__(self):
+        return sum(len(positions) for positions in self._groups.values())
+
+    def draw(self, target, rects=True):
+        """
+        Blit every collected sprite onto target and empty the batch.
+
+        Uses Surface.fblits where pygame provides it and rects are not
+        wanted, Surface.blits otherwise.
+
+        Args:
+            target: Surface to draw onto
+            rects: Whether to return the covered rects (the dirty-rect
+                renderer needs them; a full-screen flip does not)
+
+        Returns:
+            List of rects covered, clipped to target, or an empty list
+        """
+        sequence = [(surface, position) for surface, positions in self._groups.items()
+                    for position in positions]
+        self._groups.clear()
+        if not sequence:
+            return []
+        if rects:
+            return target.blits(sequence)
+        if hasattr(target, 'fblits'):
+            target.fblits(sequence)
+        else:
+            target.blits(sequence, doreturn=False)
+        return []
+
+
+class ScreenCache:
+    def __init__(self):
+        # name -> (key, surface)
+        self._screens = {}
+
+    def get(self, name, size, lines, fill=None, backdrop=None):
+        """
+        Get a pre-rendered full-screen surface, composing it on first use.
+
+        Args:
+            name: Cache slot, e.g. 'start' or 'gameOver'
+            size: (width, height) of the screen
+            lines: Tuple of (font, text, color, center) entries
+            fill: Optional RGBA backdrop, e.g. a translucent overlay color
+            backdrop: Optional function drawing the scene behind the text
+                onto a surface; the result then replaces the whole screen
+
+        Returns:
+            Surface rebuilt only when any argument changes: opaque when
+            there is a backdrop, with per-pixel alpha otherwise
+        """
+        key = (size, lines, fill, backdrop)
+        cached = self._screens.get(name)
+        if cached is None or cached[0] != key:
+            cached = (key, self._compose(size, lines, fill, backdrop))
+            self._screens[name] = cached
+        return cached[1]
+
+    def clear(self):
+        self._screens.clear()
+
+    @staticmethod
+    def _compose(size, lines, fill, backdrop):
+        if backdrop is None:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+        else:
+            surface = pygame.Surface(size)
+            backdrop(surface)
+        if fill is not None:
+            surface.fill(fill)
+        for font, text, color, center in lines:
+            rendered = font.render(text, True, color)
+            surface.blit(rendered, rendered.get_rect(center=center))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha() if backdrop is None else surface.convert()
+        return surface
+
+
+class FontCache:
+    def __init__(self, name=None):
+        """
+        Fonts by point size, created on first use.
+
+        The font module is initialized by the first lookup, so sessions
+        that never draw text (headless runs) never load it.
+
+        Args:
+            name: Font file, or None for pygame's default font
+        """
+        self.name = name
+        self._fonts = {}
+
+    def get(self, size):
+        font = self._fonts.get(size)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.Font(self.name, size)
+            self._fonts[size] = font
+        return font
@@ -0,0 +1,222 @@
+"""
+Recording and replaying the per-frame input a Game reads.
+
+File layout (little-endian):
+
+    header: magic b'KSRP', version (uint16), seed (int64),
+            rewind seconds (float64)
+    runs:   run length (LEB128 varint), held-key mask (uint8),
+            event count (uint8), event codes (uint8 each)
+
+Each run covers consecutive frames with identical input, so idle stretches
+and held keys cost a few bytes no matter how long they last. Runs are
+written as soon as the input changes and read back lazily, so neither side
+keeps the whole session in memory.
+"""
+import struct
+
+import keycodes
+
+from inputs import KeyState
+
+MAGIC = b'KSRP'
+VERSION = 2
+HEADER = struct.Struct('<4sHqd')
+
+# Keys the game reads from pygame.key.get_pressed(), one bit each
+HELD_KEYS = (
+    keycodes.K_LEFT, keycodes.K_RIGHT, keycodes.K_a, keycodes.K_d,
+    keycodes.K_SPACE, keycodes.K_UP, keycodes.K_w, keycodes.K_r,
+)
+
+# Events the game reacts to, as (type, key) pairs; key is None when unused
+EVENT_CODES = {
+    (keycodes.KEYDOWN, keycodes.K_SPACE): 1,
+    (keycodes.KEYDOWN, keycodes.K_x): 2,
+    (keycodes.KEYDOWN, keycodes.K_z): 3,
+    (keycodes.KEYUP, keycodes.K_x): 4,
+    (keycodes.KEYUP, keycodes.K_z): 5,
+    (keycodes.MOUSEBUTTONDOWN, None): 6,
+    (keycodes.QUIT, None): 7,
+}
+EVENTS_BY_CODE = {code: event for event, code in EVENT_CODES.items()}
+
+
+def encode_keys(keys):
+    """Pack the held state of HELD_KEYS into a bitmask"""
+    mask = 0
+    for bit, key in enumerate(HELD_KEYS):
+        if keys[key]:
+            mask |= 1 << bit
+    return mask
+
+
+def decode_keys(mask):
+    return KeyState(key for bit, key in enumerate(HELD_KEYS) if mask & (1 << bit))
+
+
+def encode_events(events):
+    """Map events to codes, in order, dropping events the game ignores"""
+    codes = []
+    for event in events:
+        key = getattr(event, 'key', None) if event.type in (keycodes.KEYDOWN, keycodes.KEYUP) else None
+        code = EVENT_CODES.get((event.type, key))
+        if code is not None:
+            codes.append(code)
+    return tuple(codes)
+
+
+def decode_events(codes):
+    events = []
+    for code in codes:
+        event_type, key = EVENTS_BY_CODE[code]
+        if key is None:
+            events.append(keycodes.Event(event_type))
+        else:
+            events.append(keycodes.Event(event_type, key=key))
+    return events
+
+
+def _write_varint(stream, value):
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            stream.write(bytes((byte | 0x80,)))
+        else:
+            stream.write(bytes((byte,)))
+            return
+
+
+def _read_varint(stream):
+    """Returns the decoded value, or None at a clean end of stream"""
+    value = 0
+    shift = 0
+    while True:
+        byte = stream.read(1)
+        if not byte:
+            if shift:
+                raise ValueError("truncated replay run")
+            return None
+        value |= (byte[0] & 0x7F) << shift
+        if not byte[0] & 0x80:
+            return value
+        shift += 7
+
+
+class InputRecorder:
+    def __init__(self, path, seed, rewind_seconds=0):
+        """
+        Start recording to a file.
+
+        Args:
+            path: Output file path
+            seed: Game seed, stored in the header so the replay can reproduce the run
+            rewind_seconds: The game's rewind history length; holding R
+                replays the same only with the same history
+        """
+        self.stream = open(path, 'wb')
+        self.stream.write(HEADER.pack(MAGIC, VERSION, seed, rewind_seconds))
+        self.frames = 0
+        self._record = None
+        self._run_length = 0
+
+    def record(self, keys, events):
+        """Record the input of one frame"""
+        record = (encode_keys(keys), encode_events(events))
+        if record == self._record:
+            self._run_length += 1
+        else:
+            self._flush()
+            self._record = record
+            self._run_length = 1
+        self.frames += 1
+
+    def _flush(self):
+        if not self._run_length:
+            return
+        mask, codes = self._record
+        _write_varint(self.stream, self._run_length)
+        self.stream.write(bytes((mask, len(codes))) + bytes(codes))
+        self._run_length = 0
+
+    def close(self):
+        """Write the pending run and close the file"""
+        if self.stream.closed:
+            return
+        self._flush()
+        self.stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class InputReplay:
+    def __init__(self, path):
+        """
+        Open a recording for playback.
+
+        Raises:
+            ValueError: If the file is not a replay or has an unsupported version
+        """
+        self.stream = open(path, 'rb')
+        header = self.stream.read(HEADER.size)
+        if len(header) != HEADER.size:
+            self.stream.close()
+            raise ValueError("not a replay file (header too short)")
+        magic, version, seed, rewind_seconds = HEADER.unpack(header)
+        if magic != MAGIC:
+            self.stream.close()
+            raise ValueError("not a replay file")
+        if version != VERSION:
+            self.stream.close()
+            raise ValueError(f"unsupported replay version {version}")
+        self.version = version
+        self.seed = seed
+        self.rewind_seconds = rewind_seconds
+        self._keys = None
+        self._codes = ()
+        self._remaining = 0
+
+    def _next_run(self):
+        run_length = _read_varint(self.stream)
+        if run_length is None:
+            return False
+        head = self.stream.read(2)
+        if len(head) != 2:
+            raise ValueError("truncated replay run")
+        mask, count = head
+        codes = self.stream.read(count)
+        if len(codes) != count:
+            raise ValueError("truncated replay run")
+        self._keys = decode_keys(mask)
+        self._codes = tuple(codes)
+        self._remaining = run_length
+        return True
+
+    def poll(self, frame=None):
+        """
+        Get the next frame's input; frames are returned in recording order.
+
+        Returns:
+            Tuple of (keys, events), or None once the recording is exhausted
+        """
+        if self._remaining == 0:
+            if self.stream.closed or not self._next_run():
+                self.close()
+                return None
+        self._remaining -= 1
+        # Rebuild events every frame so callers never share event objects
+        return self._keys, decode_events(self._codes)
+
+    def close(self):
+        self.stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
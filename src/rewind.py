@@ -0,0 +1,126 @@
+"""
+Bounded history of save states for rewinding.
+
+Every frame is stored as the XOR of its save state with the previous
+frame's, zlib-compressed: consecutive frames differ in a few bytes per
+moving entity, so the zero runs compress away and a frame costs a small
+fraction of a full snapshot. Every keyframe_interval frames a full
+compressed snapshot is stored as well.
+
+XOR deltas work in both directions, so stepping back from the newest state
+is one XOR per frame. Keyframes give random access to any frame and let the
+oldest frames be dropped a whole keyframe group at a time, which bounds
+memory to capacity plus one group however long the session runs.
+"""
+import zlib
+from collections import deque
+
+
+def _xor(a, b):
+    """XOR two byte strings, the shorter one padded with zero bytes"""
+    length = max(len(a), len(b))
+    return (int.from_bytes(a, 'little') ^ int.from_bytes(b, 'little')).to_bytes(length, 'little')
+
+
+class RewindBuffer:
+    def __init__(self, capacity, keyframe_interval=60, level=1):
+        """
+        Args:
+            capacity: Number of frames of history to keep at least
+            keyframe_interval: Frames between full snapshots
+            level: zlib compression level
+        """
+        self.capacity = max(1, capacity)
+        self.keyframe_interval = max(1, keyframe_interval)
+        self.level = level
+        # Per frame: [keyframe or None, delta from previous frame or None,
+        # previous frame length, frame length]
+        self.entries = deque()
+        self._current = None
+        self._since_keyframe = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    @property
+    def nbytes(self):
+        """Bytes of history held, compressed frames plus the newest state"""
+        total = len(self._current) if self._current is not None else 0
+        for keyframe, delta, _, _ in self.entries:
+            total += (len(keyframe) if keyframe else 0) + (len(delta) if delta else 0)
+        return total
+
+    def clear(self):
+        self.entries.clear()
+        self._current = None
+        self._since_keyframe = 0
+
+    def push(self, blob):
+        """Append the newest frame's save state"""
+        current = self._current
+        delta = None
+        if current is not None:
+            delta = zlib.compress(_xor(current, blob), self.level)
+        keyframe = None
+        if current is None or self._since_keyframe + 1 >= self.keyframe_interval:
+            keyframe = zlib.compress(blob, self.level)
+            self._since_keyframe = 0
+        else:
+            self._since_keyframe += 1
+        previous_length = len(current) if current is not None else 0
+        self.entries.append([keyframe, delta, previous_length, len(blob)])
+        self._current = blob
+        self._evict()
+
+    def _evict(self):
+        entries = self.entries
+        while len(entries) > self.capacity:
+            # The oldest frame is always a keyframe; drop its whole group if
+            # what remains still covers the capacity
+            group = 1
+            while group < len(entries) and entries[group][0] is None:
+                group += 1
+            if group == len(entries) or len(entries) - group < self.capacity:
+                return
+            for _ in range(group):
+                entries.popleft()
+            # Its delta points at a frame that no longer exists
+            entries[0][1] = None
+
+    def step_back(self):
+        """
+        Drop the newest frame and return the one before it.
+
+        Returns:
+            The previous frame's save state, or None if no older frame is held
+        """
+        if len(self.entries) < 2:
+            return None
+        _, delta, previous_length, _ = self.entries.pop()
+        self._current = _xor(self._current, zlib.decompress(delta))[:previous_length]
+        self._since_keyframe = 0
+        for keyframe, _, _, _ in reversed(self.entries):
+            if keyframe is not None:
+                break
+            self._since_keyframe += 1
+        return self._current
+
+    def frame(self, index):
+        """
+        Reconstruct any held frame, oldest first (negative indices count from the newest).
+
+        Returns:
+            That frame's save state
+        """
+        if index < 0:
+            index += len(self.entries)
+        if not 0 <= index < len(self.entries):
+            raise IndexError("rewind frame out of range")
+        start = index
+        while self.entries[start][0] is None:
+            start -= 1
+        blob = zlib.decompress(self.entries[start][0])
+        for position in range(start + 1, index + 1):
+            _, delta, _, length = self.entries[position]
+            blob = _xor(blob, zlib.decompress(delta))[:length]
+        return blob
@@ -0,0 +1,188 @@
+"""
+Packed binary snapshots of a Game's simulation state.
+
+Layout (little-endian):
+
+    header:  magic b'KSST', version (uint16)
+    game:    GAME struct (state, tick, seed, spawn and shoot timers, health,
+             invulnerability, kills)
+    player:  SPRITE struct
+    rng:     per GameRandom stream: MT state (625 uint32), gauss flag (uint8),
+             gauss value (float64)
+    enemies: count (uint16), then SPRITE + ENEMY_AI per enemy
+    waves:   count (uint16), then WAVE per wave
+
+Only simulation state is stored; enemies record which of the game's
+sprite_images() they use, and images, fonts and the screen stay with the
+game the snapshot is loaded into. Packing is a handful of
+struct.pack calls plus one per entity, cheap enough to run every frame.
+"""
+import struct
+
+MAGIC = b'KSST'
+VERSION = 1
+HEADER = struct.Struct('<4sH')
+
+STATES = ('start', 'playing', 'gameOver')
+
+# state, tick, seed, spawn_timer, spawn_interval, shoot_key_pressed,
+# shoot_cooldown_timer, player_health, invulnerable, invulnerable_timer,
+# invulnerable_duration, kills
+GAME = struct.Struct('<BqqiiBibBiii')
+# x, y, prev_x, prev_y, vel_y, on_ground, facing_right
+SPRITE = struct.Struct('<iiiidBB')
+# move_direction, direction_timer, direction_change_interval,
+# boundary_timer, boundary_direction, index into sprite_images()
+ENEMY_AI = struct.Struct('<biiibB')
+# x, y, prev_x, direction
+WAVE = struct.Struct('<iiib')
+COUNT = struct.Struct('<H')
+
+# MT19937 keeps 624 words plus the position in them
+MT_WORDS = 625
+MT_STATE = struct.Struct(f'<{MT_WORDS}I')
+GAUSS = struct.Struct('<Bd')
+MT_VERSION = 3  # random.Random.getstate() format
+
+
+def _pack_sprite(sprite):
+    rect = sprite.rect
+    return SPRITE.pack(rect.x, rect.y, sprite.prev_x, sprite.prev_y,
+                       sprite.vel_y, sprite.on_ground, sprite.facing_right)
+
+
+def save_state(game):
+    """
+    Serialize a Game's simulation state.
+
+    Returns:
+        bytes snapshot for load_state()
+    """
+    parts = [
+        HEADER.pack(MAGIC, VERSION),
+        GAME.pack(STATES.index(game.state), game.ticks, game.rng.seed,
+                  game.spawn_timer, game.spawn_interval, game.shoot_key_pressed,
+                  game.shoot_cooldown_timer, game.player_health, game.invulnerable,
+                  game.invulnerable_timer, game.invulnerable_duration, game.kills),
+        _pack_sprite(game.player),
+    ]
+    for _, words, gauss in game.rng.getstate():
+        parts.append(MT_STATE.pack(*words))
+        parts.append(GAUSS.pack(gauss is not None, gauss or 0.0))
+
+    parts.append(COUNT.pack(len(game.enemies)))
+    images = game.sprite_images()
+    for enemy in game.enemies:
+        parts.append(_pack_sprite(enemy))
+        parts.append(ENEMY_AI.pack(enemy.move_direction, enemy.direction_timer,
+                                   enemy.direction_change_interval, enemy.boundary_timer,
+                                   enemy.boundary_direction, images.index(enemy.sprite)))
+
+    parts.append(COUNT.pack(len(game.sonic_waves)))
+    for wave in game.sonic_waves:
+        parts.append(WAVE.pack(wave.x, wave.y, wave.prev_x, wave.direction))
+    return b''.join(parts)
+
+
+def _unpack_sprite(sprite, values):
+    x, y, sprite.prev_x, sprite.prev_y, sprite.vel_y, on_ground, facing_right = values
+    sprite.rect.x = x
+    sprite.rect.y = y
+    sprite.on_ground = bool(on_ground)
+    return bool(facing_right)
+
+
+def _check_count(pool, count, what):
+    if count > pool.capacity and not pool.grow:
+        raise ValueError(f"snapshot has {count} {what}, the game holds at most {pool.capacity}")
+
+
+def load_state(game, blob):
+    """
+    Restore a Game to the state captured by save_state().
+
+    Raises:
+        ValueError: If blob is not a snapshot, has an unsupported version or
+            holds more entities than the game's pools can take; the game is
+            left unchanged
+    """
+    view = memoryview(blob)
+    if len(view) < HEADER.size:
+        raise ValueError("not a game snapshot (too short)")
+    magic, version = HEADER.unpack_from(view, 0)
+    if magic != MAGIC:
+        raise ValueError("not a game snapshot")
+    if version != VERSION:
+        raise ValueError(f"unsupported snapshot version {version}")
+    offset = HEADER.size
+
+    # Parse everything first so a corrupt snapshot leaves the game untouched
+    try:
+        scalars = GAME.unpack_from(view, offset)
+        offset += GAME.size
+        state = STATES[scalars[0]]
+        player = SPRITE.unpack_from(view, offset)
+        offset += SPRITE.size
+
+        rng_state = []
+        for _ in game.rng.STREAMS:
+            words = MT_STATE.unpack_from(view, offset)
+            offset += MT_STATE.size
+            has_gauss, gauss = GAUSS.unpack_from(view, offset)
+            offset += GAUSS.size
+            rng_state.append((MT_VERSION, words, gauss if has_gauss else None))
+
+        images = game.sprite_images()
+        (count,) = COUNT.unpack_from(view, offset)
+        offset += COUNT.size
+        _check_count(game.enemy_pool, count, "enemies")
+        enemies = []
+        for _ in range(count):
+            sprite = SPRITE.unpack_from(view, offset)
+            ai = ENEMY_AI.unpack_from(view, offset + SPRITE.size)
+            offset += SPRITE.size + ENEMY_AI.size
+            enemies.append((sprite, ai[:5], images[ai[5]]))
+
+        (count,) = COUNT.unpack_from(view, offset)
+        offset += COUNT.size
+        _check_count(game.wave_pool, count, "sonic waves")
+        waves = [WAVE.unpack_from(view, offset + i * WAVE.size) for i in range(count)]
+        offset += count * WAVE.size
+    except (struct.error, IndexError) as error:
+        raise ValueError(f"corrupt game snapshot: {error}") from None
+    if offset != len(view):
+        raise ValueError(f"corrupt game snapshot: {len(view) - offset} trailing bytes")
+
+    (_, game.ticks, seed, game.spawn_timer, game.spawn_interval, shoot_key_pressed,
+     game.shoot_cooldown_timer, game.player_health, invulnerable,
+     game.invulnerable_timer, game.invulnerable_duration, game.kills) = scalars
+    game.state = state
+    game.shoot_key_pressed = bool(shoot_key_pressed)
+    game.invulnerable = bool(invulnerable)
+
+    game.player.facing_right = _unpack_sprite(game.player, player)
+
+    # Entities come back from the pools; acquiring one draws from the AI
+    # stream, so the RNG state is restored after them
+    game.enemy_pool.reset()
+    game.wave_pool.reset()
+    game.enemies = []
+    for sprite, (move_direction, direction_timer, interval,
+                 boundary_timer, boundary_direction), image in enemies:
+        enemy = game.enemy_pool.acquire(sprite[0], sprite[1], image, game.rng.ai)
+        enemy.set_facing(_unpack_sprite(enemy, sprite))
+        enemy.move_direction = move_direction
+        enemy.direction_timer = direction_timer
+        enemy.direction_change_interval = interval
+        enemy.boundary_timer = boundary_timer
+        enemy.boundary_direction = boundary_direction
+        game.enemies.append(enemy)
+
+    game.sonic_waves = []
+    for x, y, prev_x, direction in waves:
+        wave = game.wave_pool.acquire(x, y, direction)
+        wave.prev_x = prev_x
+        game.sonic_waves.append(wave)
+
+    game.rng.seed = seed
+    game.rng.setstate(rng_state)
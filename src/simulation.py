@@ -0,0 +1,706 @@
+"""
+Game simulation core, independent of pygame.
+
+Everything that decides what happens in a game lives here: entity physics
+and AI, spawning, shooting, collisions, health, rewind and save states.
+Input arrives as (keys, events) in the keycodes vocabulary, and entities
+carry an opaque sprite handle instead of an image, so a headless worker can
+import this module (and sweep.py, replay.py, inputs.py) without pygame and
+without SDL being installed.
+
+main.py is the pygame front end: it subclasses these classes to load
+images, draw and run the window loop.
+"""
+import random
+import time
+
+from constants import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS,
+    GRAVITY, JUMP_POWER, MOVE_SPEED,
+    SHOOT_COOLDOWN,
+)
+from keycodes import (
+    QUIT, KEYDOWN, KEYUP, MOUSEBUTTONDOWN,
+    K_LEFT, K_RIGHT, K_UP, K_SPACE, K_a, K_d, K_w, K_r, K_x, K_z,
+)
+from collision import find_wave_hits, split_hits
+from pool import EntityPool
+from profiler import FrameProfiler
+from rect import Rect, round_half_away
+from rewind import RewindBuffer
+from rng import GameRandom
+from inputs import ScriptedInput
+import savestate
+
+# Width and height of the player and enemy sprites
+SPRITE_SIZE = 50
+
+# Top of the ground platform
+GROUND_Y = SCREEN_HEIGHT - 100
+
+# Sprite handles of a simulation without a front end: player, first enemy,
+# spawned enemies
+SPRITES = ('player', 'enemy', 'pumpkin')
+
+
+class SonicWave:
+    __slots__ = ('x', 'y', 'prev_x', 'direction', 'speed', 'radius', 'pool_slot')
+
+    SPEED = 8  # pixels per frame
+    RADIUS = 15
+
+    def __init__(self, x, y, direction):
+        """
+        Initialize a sonic wave at the given position.
+
+        Args:
+            x: Center x-coordinate (player center)
+            y: Center y-coordinate (player center)
+            direction: 1 for right, -1 for left (player's facing direction)
+        """
+        self.pool_slot = -1  # Not owned by an EntityPool
+        self.reset(x, y, direction)
+
+    def reset(self, x, y, direction):
+        """Re-initialize this wave in place (used when recycled from a pool)"""
+        self.x = x
+        self.y = y
+        self.prev_x = x  # x before the latest update, for interpolated drawing
+        self.direction = direction  # 1 for right, -1 for left
+        self.speed = self.SPEED
+        self.radius = self.RADIUS  # Fixed radius for the projectile
+
+    def update(self):
+        """
+        Move the wave horizontally.
+
+        Returns:
+            True if wave should continue existing, False if off-screen
+        """
+        self.prev_x = self.x
+        self.x += self.speed * self.direction
+
+        # Check if wave is off-screen
+        if self.x < -self.radius or self.x > SCREEN_WIDTH + self.radius:
+            return False
+        return True
+
+    def collides_with(self, rect):
+        """
+        Check if wave overlaps with a rectangular enemy.
+
+        Uses circle-rectangle collision detection:
+        Find the closest point on the rectangle to the circle center,
+        then check if that point is within the circle's radius.
+
+        Args:
+            rect: Rect (or pygame.Rect) representing enemy bounds
+
+        Returns:
+            True if circle overlaps rectangle, False otherwise
+        """
+        # Find the closest point on the rectangle to the circle center
+        # (x/width rather than left/right: plain attributes are cheaper
+        # than properties on the pure-Python Rect)
+        x = self.x
+        y = self.y
+        left = rect.x
+        top = rect.y
+        closest_x = max(left, min(x, left + rect.width))
+        closest_y = max(top, min(y, top + rect.height))
+
+        # Calculate distance from circle center to this closest point
+        distance_x = x - closest_x
+        distance_y = y - closest_y
+        distance_squared = distance_x * distance_x + distance_y * distance_y
+
+        # Check if distance is less than radius (collision detected)
+        return distance_squared < self.radius * self.radius
+
+class Player:
+    def __init__(self, x, y, sprite=None):
+        """
+        Args:
+            sprite: Opaque handle the front end draws the player with
+        """
+        self.sprite = sprite
+        self.facing_right = True
+        self.rect = Rect(x, y, SPRITE_SIZE, SPRITE_SIZE)
+        self.prev_x = x  # Position before the latest update, for interpolated drawing
+        self.prev_y = y
+        self.vel_y = 0
+        self.on_ground = False
+
+    def update(self, keys, ground_y):
+        rect = self.rect
+        x = rect.x
+        self.prev_x = x
+        self.prev_y = rect.y
+
+        # Horizontal movement and facing
+        moving_left = keys[K_LEFT] or keys[K_a]
+        moving_right = keys[K_RIGHT] or keys[K_d]
+
+        if moving_left:
+            x -= MOVE_SPEED
+            self.facing_right = False
+
+        if moving_right:
+            x += MOVE_SPEED
+            self.facing_right = True
+
+        # Keep player on screen
+        if x < 0:
+            x = 0
+        if x > SCREEN_WIDTH - rect.width:
+            x = SCREEN_WIDTH - rect.width
+        rect.x = x
+
+        # Jumping
+        if (keys[K_SPACE] or keys[K_UP] or keys[K_w]) and self.on_ground:
+            self.vel_y = JUMP_POWER
+            self.on_ground = False
+
+        # Apply gravity
+        self.vel_y += GRAVITY
+        y = round_half_away(rect.y + self.vel_y)
+
+        # Ground collision
+        if y + rect.height >= ground_y:
+            rect.y = ground_y - rect.height
+            self.vel_y = 0
+            self.on_ground = True
+        else:
+            rect.y = y
+            self.on_ground = False
+
+class Enemy:
+    __slots__ = (
+        'sprite', 'facing_right', 'rect',
+        'prev_x', 'prev_y', 'vel_y', 'on_ground',
+        'move_direction', 'direction_timer', 'direction_change_interval',
+        'boundary_timer', 'boundary_direction',
+        'rng', 'pool_slot',
+    )
+
+    def __init__(self, x, y, sprite=None, rng=random):
+        self.pool_slot = -1  # Not owned by an EntityPool
+        self.reset(x, y, sprite, rng)
+
+    def reset(self, x, y, sprite=None, rng=random):
+        """Re-initialize this enemy in place (used when recycled from a pool)
+
+        Args:
+            sprite: Opaque handle the front end draws the enemy with
+            rng: random.Random-like source for the movement AI
+        """
+        self.rng = rng
+        self.sprite = sprite
+        self.facing_right = True
+        self.rect = Rect(x, y, SPRITE_SIZE, SPRITE_SIZE)
+        self.prev_x = x  # Position before the latest update, for interpolated drawing
+        self.prev_y = y
+
+        # Physics attributes (same as Player)
+        self.vel_y = 0
+        self.on_ground = False
+
+        # Random movement AI attributes
+        self.move_direction = rng.choice([-1, 0, 1])  # -1 = left, 0 = still, 1 = right
+        self.direction_timer = 0
+        self.direction_change_interval = rng.randint(30, 90)
+
+        # Boundary behavior attributes
+        self.boundary_timer = 0
+        self.boundary_direction = 0
+
+    def update(self, ground_y):
+        """Update enemy position with physics-based random movement"""
+        x = self.rect.x
+        self.prev_x = x
+        self.prev_y = self.rect.y
+
+        # Check for boundary collision and set forced direction
+        if x <= 0 and self.boundary_timer == 0:
+            # Hit left boundary - force movement right
+            self.boundary_timer = 60  # 1 second at 60 FPS
+            self.boundary_direction = 1
+        elif x >= SCREEN_WIDTH - self.rect.width and self.boundary_timer == 0:
+            # Hit right boundary - force movement left
+            self.boundary_timer = 60
+            self.boundary_direction = -1
+
+        # Decrement boundary timer
+        if self.boundary_timer > 0:
+            self.boundary_timer -= 1
+            # Override move_direction with boundary_direction
+            self.move_direction = self.boundary_direction
+        else:
+            # Normal random movement logic (only when timer is 0)
+            # Update direction change timer
+            self.direction_timer += 1
+
+            # Change direction at random intervals
+            if self.direction_timer >= self.direction_change_interval:
+                # Choose new horizontal movement direction or jump
+                action = self.rng.choice(['left', 'right', 'still', 'jump'])
+
+                if action == 'left':
+                    self.move_direction = -1
+                elif action == 'right':
+                    self.move_direction = 1
+                elif action == 'still':
+                    self.move_direction = 0
+                elif action == 'jump' and self.on_ground:
+                    self.vel_y = JUMP_POWER
+                    self.on_ground = False
+
+                self.direction_timer = 0
+                self.direction_change_interval = self.rng.randint(30, 90)
+
+        # Sprite flipping based on movement direction
+        if self.move_direction < 0:  # Moving left
+            self.set_facing(False)
+        elif self.move_direction > 0:  # Moving right
+            self.set_facing(True)
+
+        # Apply horizontal movement
+        rect = self.rect
+        x = rect.x + self.move_direction * MOVE_SPEED
+
+        # Keep enemy on screen horizontally
+        if x < 0:
+            x = 0
+        if x > SCREEN_WIDTH - rect.width:
+            x = SCREEN_WIDTH - rect.width
+        rect.x = x
+
+        # Apply gravity (same as player)
+        self.vel_y += GRAVITY
+        y = round_half_away(rect.y + self.vel_y)
+
+        # Ground collision
+        if y + rect.height >= ground_y:
+            rect.y = ground_y - rect.height
+            self.vel_y = 0
+            self.on_ground = True
+        else:
+            rect.y = y
+            self.on_ground = False
+
+    def set_facing(self, facing_right):
+        self.facing_right = facing_right
+
+class Simulation:
+    # Spawn system constants
+    MAX_ENEMIES = 5
+    MIN_SPAWN_INTERVAL = 30  # frames (0.5 seconds at 60 FPS)
+    MAX_SPAWN_INTERVAL = 90  # frames (1.5 seconds at 60 FPS)
+    EMPTY_SPAWN_INTERVAL = 10  # frames (immediate spawn when no enemies)
+    MIN_SPAWN_DISTANCE = 100  # pixels
+    SPAWN_ATTEMPTS = 10  # random positions tried per spawn
+
+    # Combat tuning
+    SHOOT_COOLDOWN = SHOOT_COOLDOWN  # frames between shots
+    INVULNERABLE_DURATION = 60  # frames (1 second at 60 FPS)
+    MAX_HEALTH = 3
+    PLAYER_START_X = 100
+
+    # Simulation ticks per second
+    TICK_RATE = FPS
+
+    # Sonic waves preallocated; None sizes the pool from SHOOT_COOLDOWN (see
+    # wave_capacity). The pool grows past this rather than drop a shot
+    WAVE_POOL_CAPACITY = None
+
+    # Entity classes; a front end substitutes subclasses that can draw themselves
+    Player = Player
+    Enemy = Enemy
+    SonicWave = SonicWave
+
+    def __init__(self, seed=None, rewind_seconds=0):
+        """
+        Args:
+            seed: Seed for all game randomness; None picks a fresh one
+            rewind_seconds: Seconds of history kept for rewinding with R (0 disables)
+        """
+        # All randomness comes from per-subsystem streams derived from one seed
+        self.rng = GameRandom(seed)
+        self.running = True
+        self.ticks = 0  # Simulation ticks since start
+
+        # Holding R steps back through the last rewind_seconds of play
+        self.rewind_seconds = rewind_seconds
+        self.rewind = None
+        if rewind_seconds > 0:
+            self.rewind = RewindBuffer(int(rewind_seconds * self.TICK_RATE), keyframe_interval=self.TICK_RATE)
+        self.rewinding = False
+        self.state = 'start'  # 'start', 'playing', 'gameOver'
+
+        # Preallocated entity storage, recycled instead of garbage collected
+        self.enemy_pool = EntityPool(self.Enemy, self.MAX_ENEMIES)
+        self.wave_pool = EntityPool(self.SonicWave, self.WAVE_POOL_CAPACITY or self.wave_capacity(), grow=True)
+
+        # Enemy pool and spawn management
+        self.enemies = []
+        self.spawn_timer = 0
+        self.spawn_interval = self.rng.spawn.randint(self.MIN_SPAWN_INTERVAL, self.MAX_SPAWN_INTERVAL)
+
+        # Sonic wave attributes
+        self.sonic_waves = []  # List of active sonic wave projectiles
+        self.shoot_key_pressed = False
+        self.shoot_cooldown_timer = 0
+
+        # Ground
+        self.ground_y = GROUND_Y
+
+        # Frame profiler; phases are only timed while it is enabled
+        self.profiler = FrameProfiler()
+
+        self.init_game()
+
+    @classmethod
+    def wave_capacity(cls):
+        """
+        Most sonic waves that can be alive at once.
+
+        One wave can be fired every SHOOT_COOLDOWN ticks and each lives until
+        it has crossed the whole screen.
+        """
+        wave = cls.SonicWave
+        lifetime = -(-(SCREEN_WIDTH + 2 * wave.RADIUS) // wave.SPEED)
+        return -(-lifetime // max(1, cls.SHOOT_COOLDOWN)) + 1
+
+    def init_game(self):
+        """Initialize/reset game objects"""
+        player_sprite, enemy_sprite, _ = self.sprite_images()
+        self.player = self.Player(self.PLAYER_START_X, self.ground_y - 50, player_sprite)
+        self.enemy = self.Enemy(600, self.ground_y - 50, enemy_sprite, self.rng.ai)
+        self.player_health = self.MAX_HEALTH
+        self.invulnerable = False
+        self.invulnerable_timer = 0
+        self.invulnerable_duration = self.INVULNERABLE_DURATION
+        self.kills = 0  # Enemies destroyed by sonic waves this game
+
+        # A new game can't rewind into the previous one
+        if self.rewind is not None:
+            self.rewind.clear()
+
+        # Initialize empty enemy pool and spawn timer
+        self.enemy_pool.reset()
+        self.wave_pool.reset()
+        self.enemies = []
+        self.spawn_timer = 0
+        self.spawn_interval = self.rng.spawn.randint(self.MIN_SPAWN_INTERVAL, self.MAX_SPAWN_INTERVAL)
+
+        # Reset sonic wave attributes
+        self.sonic_waves = []  # Clear all active sonic waves
+        self.shoot_key_pressed = False
+        self.shoot_cooldown_timer = 0
+
+    def sprite_images(self):
+        """Sprite handles entities are created with, in a fixed order (player,
+        enemy, spawned enemy); save states store positions in this tuple"""
+        return SPRITES
+
+    def save_state(self):
+        """
+        Pack the whole simulation state (entities, timers, health, RNG) into bytes.
+
+        Returns:
+            Snapshot for load_state(); see savestate for the layout
+        """
+        return savestate.save_state(self)
+
+    def load_state(self, blob):
+        """
+        Restore the simulation state from save_state() bytes.
+
+        Raises:
+            ValueError: If blob is not a valid snapshot
+        """
+        savestate.load_state(self, blob)
+
+    def is_valid_spawn_position(self, x):
+        """Check if spawn position is far enough from player
+
+        Args:
+            x: The x-coordinate to validate
+
+        Returns:
+            True if distance >= MIN_SPAWN_DISTANCE, False otherwise
+        """
+        horizontal_distance = abs(x - self.player.rect.x)
+        return horizontal_distance >= self.MIN_SPAWN_DISTANCE
+
+    def get_random_spawn_position(self):
+        """Generate random spawn position with validation
+
+        Returns:
+            Valid x-coordinate for spawn, or None if no valid position found after SPAWN_ATTEMPTS tries
+        """
+        for _ in range(self.SPAWN_ATTEMPTS):
+            # Generate random x-coordinate within screen bounds
+            # Account for enemy width (50 pixels) to keep fully on screen
+            x = self.rng.spawn.randint(0, SCREEN_WIDTH - 50)
+
+            if self.is_valid_spawn_position(x):
+                return x
+
+        # No valid position found after SPAWN_ATTEMPTS tries
+        return None
+
+    def attempt_spawn(self):
+        """Attempt to spawn a new enemy if conditions are met
+
+        Checks:
+        - Game state is 'playing'
+        - Enemy pool size < MAX_ENEMIES
+        - Valid spawn position exists
+
+        If all conditions met, creates new Enemy and adds to pool
+        """
+        # Check if game state is 'playing'
+        if self.state != 'playing':
+            return
+
+        # Check if enemy pool size < MAX_ENEMIES
+        if len(self.enemies) >= self.MAX_ENEMIES:
+            return
+
+        # Get valid spawn position
+        spawn_x = self.get_random_spawn_position()
+        if spawn_x is None:
+            return
+
+        # Take an Enemy from the pool at spawn position (on ground)
+        spawn_y = self.ground_y - 50  # Position enemy on ground (50 is enemy height)
+        new_enemy = self.enemy_pool.acquire(spawn_x, spawn_y, self.sprite_images()[2], self.rng.ai)
+        if new_enemy is None:
+            return
+
+        # Add enemy to pool
+        self.enemies.append(new_enemy)
+
+    def update_spawn_timer(self):
+        """Update spawn timer and trigger spawn attempts
+
+        Decrements spawn_timer each frame.
+        When timer reaches 0, calls attempt_spawn.
+        If no enemies exist, uses faster spawn interval.
+        """
+        # Decrement spawn_timer each frame
+        self.spawn_timer -= 1
+
+        # Call attempt_spawn when timer reaches 0
+        if self.spawn_timer <= 0:
+            self.attempt_spawn()
+
+            # If no enemies left, use faster spawn interval
+            if len(self.enemies) == 0:
+                self.spawn_timer = self.EMPTY_SPAWN_INTERVAL
+                self.spawn_interval = self.EMPTY_SPAWN_INTERVAL
+            else:
+                # Normal spawn interval
+                self.spawn_timer = self.spawn_interval
+                self.spawn_interval = self.rng.spawn.randint(self.MIN_SPAWN_INTERVAL, self.MAX_SPAWN_INTERVAL)
+
+    def remove_offscreen_enemies(self):
+        """Remove enemies that have moved completely off-screen
+
+        Checks if enemy's entire rect is beyond screen boundaries:
+        - Left boundary: x + width < 0
+        - Right boundary: x > SCREEN_WIDTH
+
+        Removes off-screen enemies from the pool.
+        """
+        offscreen = [
+            i for i, enemy in enumerate(self.enemies)
+            if enemy.rect.x + enemy.rect.width < 0 or enemy.rect.x > SCREEN_WIDTH
+        ]
+        if offscreen:
+            self.enemy_pool.remove_indices(self.enemies, offscreen)
+
+    def resolve_wave_collisions(self):
+        """Remove every sonic wave that hit an enemy and every enemy that was hit
+
+        Hit pairs are found once per frame; both removals are then swap-removes
+        that hand the entities back to their pools.
+
+        Returns:
+            List of WaveHit events for this frame
+        """
+        hits = find_wave_hits(self.sonic_waves, [enemy.rect for enemy in self.enemies])
+        if hits:
+            hit_waves, hit_enemies = split_hits(hits)
+            self.wave_pool.remove_indices(self.sonic_waves, hit_waves)
+            self.enemy_pool.remove_indices(self.enemies, hit_enemies)
+            self.kills += len(hit_enemies)
+        return hits
+
+    def handle_events(self, events):
+        for event in events:
+            if event.type == QUIT:
+                self.running = False
+            elif event.type == KEYDOWN:
+                if event.key == K_SPACE:
+                    if self.state == 'start':
+                        self.state = 'playing'
+                    elif self.state == 'gameOver':
+                        self.state = 'start'
+                        self.init_game()
+                # Shoot key handling (X or Z)
+                elif event.key in (K_x, K_z):
+                    if self.state == 'playing' and not self.shoot_key_pressed and self.shoot_cooldown_timer <= 0:
+                        # Create new SonicWave at player center position
+                        center_x = self.player.rect.centerx
+                        center_y = self.player.rect.centery
+                        # Pass player's facing direction (1 for right, -1 for left)
+                        direction = 1 if self.player.facing_right else -1
+                        new_wave = self.wave_pool.acquire(center_x, center_y, direction)
+                        self.sonic_waves.append(new_wave)  # Add to list of active waves
+                        self.shoot_key_pressed = True
+                        # Start cooldown timer
+                        self.shoot_cooldown_timer = self.SHOOT_COOLDOWN
+            elif event.type == KEYUP:
+                # Reset shoot key flag when key is released
+                if event.key in (K_x, K_z):
+                    self.shoot_key_pressed = False
+            elif event.type == MOUSEBUTTONDOWN:
+                if self.state == 'start':
+                    self.state = 'playing'
+                elif self.state == 'gameOver':
+                    self.state = 'start'
+                    self.init_game()
+
+    def update(self, keys):
+        if self.state == 'playing':
+            # Phase timing only when the profiler is on
+            profiler = self.profiler if self.profiler.enabled else None
+            self.player.update(keys, self.ground_y)
+            if profiler is not None:
+                profiler.lap('player')
+
+            # Update spawn timer and manage spawning
+            self.update_spawn_timer()
+
+            # Update shoot cooldown timer
+            if self.shoot_cooldown_timer > 0:
+                self.shoot_cooldown_timer -= 1
+            if profiler is not None:
+                profiler.lap('spawn')
+
+            # Update all enemies in pool
+            for enemy in self.enemies:
+                enemy.update(self.ground_y)
+
+            # Remove off-screen enemies after updates
+            self.remove_offscreen_enemies()
+            if profiler is not None:
+                profiler.lap('enemies')
+
+            # Update all sonic waves, dropping those that left the screen
+            offscreen = [i for i, wave in enumerate(self.sonic_waves) if not wave.update()]
+            if offscreen:
+                self.wave_pool.remove_indices(self.sonic_waves, offscreen)
+            if profiler is not None:
+                profiler.lap('waves')
+
+            # Collision detection between sonic waves and enemies
+            self.resolve_wave_collisions()
+
+            # Update invulnerability timer
+            if self.invulnerable:
+                self.invulnerable_timer -= 1
+                if self.invulnerable_timer <= 0:
+                    self.invulnerable = False
+                    self.invulnerable_timer = 0
+
+            # Check collision with all enemies in pool
+            for enemy in self.enemies:
+                if self.player.rect.colliderect(enemy.rect):
+                    # Only take damage if not invulnerable
+                    if not self.invulnerable:
+                        self.player_health -= 1
+
+                        # Check if game over
+                        if self.player_health <= 0:
+                            self.state = 'gameOver'
+                        else:
+                            # Set invulnerability after taking damage
+                            self.invulnerable = True
+                            self.invulnerable_timer = self.invulnerable_duration
+
+                        # Break after first collision to avoid multiple damage in same frame
+                        break
+            if profiler is not None:
+                profiler.lap('collision')
+
+    def step(self, keys, events, recorder=None):
+        """
+        Advance the simulation by one tick.
+
+        Args:
+            keys: Held-key state for this tick
+            events: Events delivered on this tick
+            recorder: Optional InputRecorder that captures the tick's input
+        """
+        if recorder is not None:
+            recorder.record(keys, events)
+        self.handle_events(events)
+        if self.profiler.enabled:
+            self.profiler.lap('events')
+        rewind = self.rewind
+        if rewind is not None and keys[K_r] and self.state != 'start':
+            # Run backwards instead of simulating; stays put once history runs out
+            self.rewinding = True
+            previous = rewind.step_back()
+            if previous is not None:
+                self.load_state(previous)
+            return
+        self.rewinding = False
+        self.update(keys)
+        self.ticks += 1
+        if rewind is not None and self.state == 'playing':
+            rewind.push(self.save_state())
+
+    def run_headless(self, frames=None, input_source=None, recorder=None):
+        """
+        Step the simulation as fast as possible without drawing.
+
+        Args:
+            frames: Number of frames to simulate; None runs until the input
+                source is exhausted
+            input_source: Object with poll(frame) -> (keys, events), returning
+                None when it runs out; defaults to ScriptedInput.demo()
+            recorder: Optional InputRecorder that captures every frame's input
+
+        Returns:
+            Dict with simulated frame count, elapsed seconds and frames per second
+        """
+        if input_source is None:
+            input_source = ScriptedInput.demo()
+
+        profiler = self.profiler
+        simulated = 0
+        start = time.perf_counter()
+        while frames is None or simulated < frames:
+            if profiler.enabled:
+                profiler.begin_frame()
+            polled = input_source.poll(simulated)
+            if polled is None:
+                break
+            keys, events = polled
+            self.step(keys, events, recorder)
+            if profiler.enabled:
+                profiler.end_frame()
+            simulated += 1
+            if not self.running:
+                break
+        elapsed = time.perf_counter() - start
+
+        return {
+            'frames': simulated,
+            'seconds': elapsed,
+            'fps': simulated / elapsed if elapsed > 0 else float('inf'),
+        }
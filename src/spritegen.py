@@ -0,0 +1,349 @@
+"""
+Procedural sprite generation.
+
+A spec file lists sprite variants (colours, face, size, animation frame
+count). Each variant is rendered to RGBA frames across a process pool and
+packed into one atlas PNG, with a metadata file giving every frame's rect
+and the hash of the spec it came from. On a rerun, variants whose hash
+matches the metadata are copied out of the existing atlas instead of being
+drawn again, so only new or edited variants cost anything.
+
+Spec format (JSON):
+
+    {"defaults": {"size": 100, "face": "grin", ...},
+     "variants": [{"name": "pumpkin"}, {"name": "pumpkin_bob", "frames": 4}]}
+
+Variant fields and their defaults are in DEFAULTS. Frame 0 of an animation
+is the resting pose; later frames bob the body and dim the eyes.
+
+    python src/spritegen.py                   # assets/sprite_spec.json -> assets/sprite_atlas.*
+    python src/spritegen.py --export pumpkin=assets/enemy.png
+"""
+import argparse
+import hashlib
+import json
+import math
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import pygame
+
+# Bump when drawing code changes so every variant is redrawn
+RENDERER_VERSION = 1
+FACES = ('grin', 'smile', 'surprised')
+DEFAULTS = {
+    'size': 100,
+    'frames': 1,
+    'face': 'grin',
+    'body': [255, 140, 0],
+    'outline': [200, 100, 0],
+    'stem': [34, 139, 34],
+    'stem_outline': [20, 100, 20],
+    'eyes': [255, 255, 0],
+    'bob': 3,
+}
+COLOURS = ('body', 'outline', 'stem', 'stem_outline', 'eyes')
+# Sprites are drawn in a 100x100 design space and scaled to their size
+DESIGN_SIZE = 100
+ATLAS_WIDTH = 1024
+PADDING = 1
+BLACK = (0, 0, 0)
+
+
+def _check_variant(variant):
+    name = variant.get('name')
+    if not isinstance(name, str) or not name:
+        raise ValueError(f"variant without a name: {variant!r}")
+    unknown = set(variant) - set(DEFAULTS) - {'name'}
+    if unknown:
+        raise ValueError(f"{name}: unknown fields {', '.join(sorted(unknown))}")
+    for field in ('size', 'frames'):
+        if not isinstance(variant[field], int) or variant[field] < 1:
+            raise ValueError(f"{name}: {field} must be a positive integer")
+    if variant['size'] > ATLAS_WIDTH:
+        raise ValueError(f"{name}: size {variant['size']} exceeds the atlas width {ATLAS_WIDTH}")
+    if variant['face'] not in FACES:
+        raise ValueError(f"{name}: face must be one of {', '.join(FACES)}")
+    for field in COLOURS:
+        colour = variant[field]
+        if len(colour) != 3 or not all(isinstance(c, int) and 0 <= c <= 255 for c in colour):
+            raise ValueError(f"{name}: {field} must be an [r, g, b] list")
+
+
+def load_spec(path):
+    """
+    Read a spec file and resolve every variant against the defaults.
+
+    Returns:
+        List of complete variant dicts, in file order
+
+    Raises:
+        ValueError: If the spec is malformed or names a variant twice
+    """
+    with open(path) as stream:
+        try:
+            spec = json.load(stream)
+        except json.JSONDecodeError as error:
+            raise ValueError(f"{path}: {error}") from None
+    defaults = dict(DEFAULTS, **spec.get('defaults', {}))
+    variants = []
+    seen = set()
+    for entry in spec.get('variants', []):
+        variant = dict(defaults, **entry)
+        _check_variant(variant)
+        if variant['name'] in seen:
+            raise ValueError(f"variant {variant['name']!r} is defined twice")
+        seen.add(variant['name'])
+        variants.append(variant)
+    return variants
+
+
+def spec_hash(variant):
+    """Digest of everything that affects a variant's pixels"""
+    text = json.dumps(dict(variant, renderer=RENDERER_VERSION), sort_keys=True)
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
+def _draw_frame(variant, frame):
+    size = variant['size']
+    scale = size / DESIGN_SIZE
+
+    def p(value):
+        return round(value * scale)
+
+    def pt(x, y):
+        return p(x), p(y)
+
+    def width(value):
+        return max(1, p(value))
+
+    phase = 2 * math.pi * frame / variant['frames']
+    glow = (1 - math.cos(phase)) / 4
+    eyes = [round(e + (b - e) * glow) for e, b in zip(variant['eyes'], variant['body'])]
+
+    sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+    center_x = DESIGN_SIZE // 2
+    center_y = DESIGN_SIZE // 2 + 5 + round(variant['bob'] * math.sin(phase))
+    radius = 35
+
+    # Body with vertical segment lines for texture
+    pygame.draw.circle(sprite, variant['body'], pt(center_x, center_y), p(radius))
+    pygame.draw.circle(sprite, variant['outline'], pt(center_x, center_y), p(radius), width(3))
+    for x_offset in (-15, -5, 5, 15):
+        half = int((radius ** 2 - x_offset ** 2) ** 0.5)
+        pygame.draw.line(sprite, variant['outline'],
+                         pt(center_x + x_offset, center_y - half),
+                         pt(center_x + x_offset, center_y + half), width(2))
+
+    # Stem
+    stem = (p(center_x - 4), p(center_y - radius - 12), width(8), width(12))
+    pygame.draw.rect(sprite, variant['stem'], stem)
+    pygame.draw.rect(sprite, variant['stem_outline'], stem, width(2))
+
+    # Face
+    eye_y = center_y - 8
+    mouth_y = center_y + 10
+    face = variant['face']
+    if face == 'surprised':
+        for x in (center_x - 14, center_x + 14):
+            pygame.draw.circle(sprite, eyes, pt(x, eye_y + 4), p(5))
+            pygame.draw.circle(sprite, BLACK, pt(x, eye_y + 4), p(5), width(1))
+        pygame.draw.ellipse(sprite, BLACK, (p(center_x - 6), p(mouth_y), width(12), width(14)))
+        return sprite
+
+    for eye in ([(center_x - 18, eye_y + 8), (center_x - 10, eye_y), (center_x - 10, eye_y + 8)],
+                [(center_x + 10, eye_y + 8), (center_x + 18, eye_y), (center_x + 18, eye_y + 8)]):
+        points = [pt(x, y) for x, y in eye]
+        pygame.draw.polygon(sprite, eyes, points)
+        pygame.draw.aalines(sprite, BLACK, True, points, 2)
+
+    # Parabolic mouth with teeth along it; a smile turns both upside down
+    mouth_width = 30
+    sign = 1 if face == 'grin' else -1
+    if sign < 0:
+        mouth_y += 8
+    mouth = [(center_x - mouth_width // 2 + mouth_width * i // 10, mouth_y + sign * (((i - 5) ** 2) // 3))
+             for i in range(11)]
+    pygame.draw.lines(sprite, BLACK, False, [pt(x, y) for x, y in mouth], width(3))
+    for x, y in mouth[:-1:2]:
+        pygame.draw.polygon(sprite, BLACK, [pt(x - 2, y), pt(x, y - sign * 5), pt(x + 2, y)])
+    return sprite
+
+
+def render_variant(variant):
+    """
+    Draw every animation frame of a variant.
+
+    Returns:
+        List of SRCALPHA surfaces, one per frame
+    """
+    return [_draw_frame(variant, frame) for frame in range(variant['frames'])]
+
+
+def _render_bytes(variant):
+    # Surfaces don't pickle; pool workers send raw RGBA rows back instead
+    return [pygame.image.tobytes(frame, 'RGBA') for frame in render_variant(variant)]
+
+
+def pack_layout(variants):
+    """
+    Place every frame on shelves, tallest variants first.
+
+    Returns:
+        ({name: [(x, y, w, h), ...]}, (atlas width, atlas height))
+    """
+    rects = {}
+    x = y = shelf = 0
+    for variant in sorted(variants, key=lambda v: (-v['size'], v['name'])):
+        size = variant['size']
+        frames = []
+        for _ in range(variant['frames']):
+            if x + size > ATLAS_WIDTH:
+                x, y, shelf = 0, y + shelf + PADDING, 0
+            frames.append((x, y, size, size))
+            x += size + PADDING
+            shelf = max(shelf, size)
+        rects[variant['name']] = frames
+    return rects, (ATLAS_WIDTH, max(1, y + shelf))
+
+
+def _file_digest(path):
+    with open(path, 'rb') as stream:
+        return hashlib.sha256(stream.read()).hexdigest()
+
+
+def load_previous(atlas_path, metadata_path):
+    """
+    Read the frames of an earlier run back out of its atlas.
+
+    Returns:
+        {name: (hash, [surfaces])}, empty if the output is missing, unreadable
+        or the atlas does not match its metadata (an interrupted run)
+    """
+    try:
+        with open(metadata_path) as stream:
+            metadata = json.load(stream)
+        if metadata.get('atlas_sha256') != _file_digest(atlas_path):
+            return {}
+        atlas = pygame.image.load(atlas_path)
+    except (OSError, ValueError, pygame.error):
+        return {}
+    return {name: (entry['hash'], [atlas.subsurface(rect).copy() for rect in entry['frames']])
+            for name, entry in metadata.get('sprites', {}).items()}
+
+
+def _write_atomic(path, write):
+    root, ext = os.path.splitext(path)
+    partial = f"{root}.partial{ext}"
+    write(partial)
+    os.replace(partial, path)
+
+
+def generate(spec_path, atlas_path, metadata_path, workers=None, force=False):
+    """
+    Render the variants that changed and rebuild the atlas and metadata.
+
+    Args:
+        spec_path: Spec file
+        atlas_path: Atlas PNG to write
+        metadata_path: Metadata JSON to write
+        workers: Process count (default: all cores); 1 renders in-process
+        force: Redraw every variant even if its hash is unchanged
+
+    Returns:
+        Names of the variants drawn by this call
+
+    Raises:
+        ValueError: If the spec is invalid
+    """
+    variants = load_spec(spec_path)
+    hashes = {variant['name']: spec_hash(variant) for variant in variants}
+    previous = {} if force else load_previous(atlas_path, metadata_path)
+    frames = {name: surfaces for name, (digest, surfaces) in previous.items()
+              if hashes.get(name) == digest}
+    pending = [variant for variant in variants if variant['name'] not in frames]
+    if not pending and set(previous) == set(hashes):
+        return []
+
+    if workers == 1 or len(pending) == 1:
+        for variant in pending:
+            frames[variant['name']] = render_variant(variant)
+    elif pending:
+        # Fresh interpreters, as in sweep.py: forked SDL state is unsafe
+        context = multiprocessing.get_context('spawn')
+        workers = min(workers or os.cpu_count() or 1, len(pending))
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            for variant, rendered in zip(pending, executor.map(_render_bytes, pending)):
+                size = (variant['size'], variant['size'])
+                frames[variant['name']] = [pygame.image.frombytes(data, size, 'RGBA') for data in rendered]
+
+    rects, atlas_size = pack_layout(variants)
+    atlas = pygame.Surface(atlas_size, pygame.SRCALPHA)
+    atlas.blits([(surface, rect[:2]) for name in rects for surface, rect in zip(frames[name], rects[name])],
+                doreturn=False)
+    _write_atomic(atlas_path, lambda path: pygame.image.save(atlas, path))
+
+    metadata = {
+        'renderer': RENDERER_VERSION,
+        'atlas': os.path.basename(atlas_path),
+        'atlas_size': list(atlas_size),
+        'atlas_sha256': _file_digest(atlas_path),
+        'sprites': {variant['name']: {'hash': hashes[variant['name']],
+                                      'frames': [list(rect) for rect in rects[variant['name']]],
+                                      'spec': variant}
+                    for variant in variants},
+    }
+
+    def write_metadata(path):
+        with open(path, 'w') as stream:
+            json.dump(metadata, stream, indent=1)
+            stream.write('\n')
+    _write_atomic(metadata_path, write_metadata)
+    return [variant['name'] for variant in pending]
+
+
+def export_frame(atlas_path, metadata_path, name, output, frame=0):
+    """
+    Save one atlas frame as a standalone PNG.
+
+    Raises:
+        KeyError: If the metadata has no such sprite
+    """
+    with open(metadata_path) as stream:
+        rect = json.load(stream)['sprites'][name]['frames'][frame]
+    pygame.image.save(pygame.image.load(atlas_path).subsurface(rect), output)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render sprite variants into an atlas")
+    parser.add_argument('--spec', default='assets/sprite_spec.json', help="variant spec (JSON)")
+    parser.add_argument('--atlas', default='assets/sprite_atlas.png', help="atlas PNG to write")
+    parser.add_argument('--metadata', default='assets/sprite_atlas.json', help="atlas metadata to write")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes (default: all cores)")
+    parser.add_argument('--force', action='store_true', help="redraw every variant")
+    parser.add_argument('--export', action='append', default=[], metavar='NAME=PATH',
+                        help="also save the first frame of NAME as PATH (repeatable)")
+    args = parser.parse_args(argv)
+
+    try:
+        drawn = generate(args.spec, args.atlas, args.metadata, args.workers, args.force)
+    except ValueError as error:
+        parser.error(str(error))
+    print(f"Drew {len(drawn)} variants{': ' + ', '.join(drawn) if drawn else ''}; atlas in {args.atlas}")
+    for text in args.export:
+        name, sep, path = text.partition('=')
+        if not sep:
+            parser.error(f"expected NAME=PATH: {text!r}")
+        try:
+            export_frame(args.atlas, args.metadata, name, path)
+        except KeyError:
+            parser.error(f"no sprite named {name!r} in {args.metadata}")
+        print(f"Exported {name} to {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""
+Shared cache of scaled and flipped sprite surfaces.
+
+Entities look their images up here instead of calling pygame.transform on
+every spawn or turn, so each (source image, size, flip) combination is
+computed once and shared by every instance. Entries are keyed weakly on the
+source surface: once nothing else holds a source image (a finished Game, a
+reloaded asset), its scaled and flipped copies are freed with it.
+"""
+import weakref
+
+import pygame
+
+
+class SpriteCache:
+    def __init__(self):
+        # source -> {(size, flip): surface}; a value of None stands for the
+        # source itself, since a strong reference to the key would pin it
+        self._surfaces = weakref.WeakKeyDictionary()
+
+    def __len__(self):
+        return sum(len(versions) for versions in self._surfaces.values())
+
+    def get(self, image, size, flip=False):
+        """
+        Get image scaled to size, mirrored horizontally if flip is set.
+
+        Args:
+            image: Source pygame Surface
+            size: (width, height) tuple
+            flip: True for the left-facing version
+
+        Returns:
+            Cached pygame Surface
+        """
+        versions = self._surfaces.get(image)
+        if versions is None:
+            versions = self._surfaces[image] = {}
+        key = (size, flip)
+        if key in versions:
+            surface = versions[key]
+            return image if surface is None else surface
+        if flip:
+            surface = pygame.transform.flip(self.get(image, size), True, False)
+        else:
+            surface = pygame.transform.scale(image, size)
+        versions[key] = surface
+        return surface
+
+    def put(self, image, size, surface, flip=False):
+        """Register an already scaled (and flipped) version of image, e.g. one from the asset pack"""
+        versions = self._surfaces.get(image)
+        if versions is None:
+            versions = self._surfaces[image] = {}
+        versions[size, flip] = None if surface is image else surface
+
+    def pair(self, image, size):
+        """
+        Get both orientations of a sprite.
+
+        Returns:
+            Tuple of (right-facing, left-facing) surfaces
+        """
+        return self.get(image, size), self.get(image, size, flip=True)
+
+    def clear(self):
+        self._surfaces.clear()
+
+
+# Cache shared by all entities
+sprite_cache = SpriteCache()
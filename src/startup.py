@@ -0,0 +1,46 @@
+"""
+Startup phase timing.
+
+Launch code calls lap(phase) as each step of startup finishes; the time since
+the previous lap is charged to that phase, the same convention as
+FrameProfiler. The report covers everything from the timer's start (taken
+as early as main.py can, before its imports) to the first presented frame.
+"""
+import time
+
+
+class StartupTimer:
+    def __init__(self, start=None):
+        """
+        Args:
+            start: perf_counter() value startup is measured from (default: now)
+        """
+        self.start = time.perf_counter() if start is None else start
+        self.last = self.start
+        self.phases = []  # (phase, seconds) in the order they finished
+
+    def lap(self, phase):
+        """Charge the time since the previous lap to phase"""
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last))
+        self.last = now
+
+    @property
+    def total(self):
+        """Seconds from the start to the latest lap"""
+        return self.last - self.start
+
+    def report(self):
+        """
+        Format the phases as a table with each one's share of the total.
+
+        Returns:
+            Multi-line string
+        """
+        total = self.total
+        lines = [f"{'phase':<14}{'ms':>9}{'%':>6}"]
+        for phase, seconds in self.phases:
+            share = 100 * seconds / total if total > 0 else 0.0
+            lines.append(f"{phase:<14}{seconds * 1000:9.1f}{share:6.1f}")
+        lines.append(f"{'total':<14}{total * 1000:9.1f}")
+        return "\n".join(lines)
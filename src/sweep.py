@@ -0,0 +1,247 @@
+"""
+Monte Carlo balancing sweeps.
+
+Plays one headless game for every combination of a parameter grid and a set
+of seeds, fanned out over a process pool, and streams one CSV row per game
+as results arrive. Rows already in the output file are skipped, so an
+interrupted sweep picks up where it stopped when rerun with the same
+arguments. A summary CSV with per-combination averages is written at the end.
+Workers only import the pygame-free simulation core.
+
+    python src/sweep.py --param MAX_ENEMIES=3,5,8 --param SHOOT_COOLDOWN=20,30 \\
+        --seeds 0-99 --output sweep.csv
+"""
+import argparse
+import csv
+import itertools
+import multiprocessing
+import os
+import statistics
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from simulation import Simulation
+from inputs import BotInput, ScriptedInput
+
+# Simulation class attributes a sweep may override. The wave pool is not one
+# of them: it is sized from SHOOT_COOLDOWN and grows, so no fire rate is capped
+TUNABLE = (
+    'MAX_ENEMIES', 'MIN_SPAWN_INTERVAL', 'MAX_SPAWN_INTERVAL',
+    'MIN_SPAWN_DISTANCE', 'SHOOT_COOLDOWN', 'INVULNERABLE_DURATION',
+)
+RESULT_FIELDS = ('survival_frames', 'kills', 'damage_taken', 'game_over')
+INPUTS = ('bot', 'demo')
+
+
+def parse_param(text):
+    """
+    Parse NAME=v1,v2,... into (name, [ints]).
+
+    Raises:
+        ValueError: If the name is not tunable or a value is not an integer
+    """
+    name, sep, values = text.partition('=')
+    name = name.strip().upper()
+    if not sep or name not in TUNABLE:
+        raise ValueError(f"expected NAME=v1,v2,... with NAME one of {', '.join(TUNABLE)}: {text!r}")
+    return name, [int(value) for value in values.split(',') if value.strip()]
+
+
+def parse_seeds(text):
+    """Parse '100' (seeds 0-99), '10-19' (inclusive range) or '1,5,9' into a list"""
+    if ',' in text:
+        return [int(seed) for seed in text.split(',')]
+    if '-' in text.lstrip('-'):
+        start, end = text.split('-', 1)
+        return list(range(int(start), int(end) + 1))
+    return list(range(int(text)))
+
+
+def grid(params):
+    """Expand [(name, values), ...] into one dict per combination, in order"""
+    names = [name for name, _ in params]
+    return [dict(zip(names, combo)) for combo in itertools.product(*(values for _, values in params))]
+
+
+def make_game(params, seed):
+    """Headless Simulation with the params dict applied as class attribute overrides"""
+    return type('SweepGame', (Simulation,), dict(params))(seed=seed)
+
+
+def play(params, seed, frames, input_name='bot'):
+    """
+    Play one headless game until game over or the frame limit.
+
+    Args:
+        params: Dict of Simulation attribute overrides
+        seed: Game seed
+        frames: Frame limit
+        input_name: 'bot' (BotInput) or 'demo' (ScriptedInput.demo)
+
+    Returns:
+        Dict with the params, the seed and RESULT_FIELDS
+    """
+    game = make_game(params, seed)
+    source = BotInput(game) if input_name == 'bot' else ScriptedInput.demo()
+    starting_health = game.player_health
+    survival = 0
+    for frame in range(frames):
+        keys, events = source.poll(frame)
+        game.step(keys, events)
+        if game.state == 'playing':
+            survival += 1
+        elif game.state == 'gameOver':
+            break
+    return dict(params, seed=seed,
+                survival_frames=survival,
+                kills=game.kills,
+                damage_taken=starting_health - game.player_health,
+                game_over=int(game.state == 'gameOver'))
+
+
+def _run_key(row, names):
+    return tuple(int(row[name]) for name in names) + (int(row['seed']),)
+
+
+def _complete(row):
+    # An interrupted write can stop anywhere, even right after a comma,
+    # which leaves an empty last field rather than a missing one
+    try:
+        for value in row.values():
+            int(value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def completed_runs(path, fieldnames):
+    """
+    Keys of the runs already recorded in an output file.
+
+    Raises:
+        ValueError: If the file was written by a sweep over different parameters
+    """
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return set()
+    with open(path, newline='') as stream:
+        reader = csv.DictReader(stream)
+        if reader.fieldnames != fieldnames:
+            raise ValueError(f"{path} has columns {reader.fieldnames}, expected {fieldnames}")
+        names = fieldnames[:fieldnames.index('seed')]
+        # A run cut off mid-line has missing fields; it is simply replayed
+        return {_run_key(row, names) for row in reader if _complete(row)}
+
+
+def summarize(path, names):
+    """
+    Average the per-game rows of an output file by parameter combination.
+
+    Returns:
+        List of dicts, one per combination, in sorted order
+    """
+    groups = {}
+    with open(path, newline='') as stream:
+        for row in csv.DictReader(stream):
+            if not _complete(row):
+                continue
+            groups.setdefault(tuple(int(row[name]) for name in names), []).append(row)
+    summary = []
+    for combo in sorted(groups):
+        rows = groups[combo]
+        survival = [int(row['survival_frames']) for row in rows]
+        summary.append(dict(
+            zip(names, combo),
+            runs=len(rows),
+            survival_mean=round(statistics.fmean(survival), 2),
+            survival_median=statistics.median(survival),
+            survival_min=min(survival),
+            kills_mean=round(statistics.fmean(int(row['kills']) for row in rows), 2),
+            damage_mean=round(statistics.fmean(int(row['damage_taken']) for row in rows), 3),
+            game_over_rate=round(statistics.fmean(int(row['game_over']) for row in rows), 3),
+        ))
+    return summary
+
+
+def run_sweep(params, seeds, output, frames=36000, input_name='bot', workers=None, summary_path=None):
+    """
+    Play every (combination, seed) pair not yet in output and append the results.
+
+    Args:
+        params: List of (name, values) from parse_param
+        seeds: List of seeds
+        output: Per-game CSV, created or resumed
+        frames: Frame limit per game
+        input_name: 'bot' or 'demo'
+        workers: Process count (default: all cores)
+        summary_path: Summary CSV (default: output with a _summary suffix)
+
+    Returns:
+        Number of games played by this call
+    """
+    names = [name for name, _ in params]
+    fieldnames = names + ['seed'] + list(RESULT_FIELDS)
+    done = completed_runs(output, fieldnames)
+    pending = [(combo, seed) for combo in grid(params) for seed in seeds
+               if tuple(combo[name] for name in names) + (seed,) not in done]
+
+    new_file = not os.path.exists(output) or os.path.getsize(output) == 0
+    if not new_file:
+        with open(output, 'rb') as stream:
+            stream.seek(-1, os.SEEK_END)
+            cut_off = stream.read(1) != b'\n'
+    with open(output, 'a', newline='') as stream:
+        if not new_file and cut_off:
+            # End the partial row an interruption left behind
+            stream.write('\n')
+        writer = csv.DictWriter(stream, fieldnames=fieldnames)
+        if new_file:
+            writer.writeheader()
+        if pending:
+            # Fresh interpreters: a parent that imported pygame may hold SDL
+            # state, which does not survive a fork
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+                futures = [executor.submit(play, combo, seed, frames, input_name) for combo, seed in pending]
+                for future in as_completed(futures):
+                    writer.writerow(future.result())
+                    stream.flush()
+
+    if summary_path is None:
+        root, ext = os.path.splitext(output)
+        summary_path = f"{root}_summary{ext or '.csv'}"
+    summary = summarize(output, names)
+    with open(summary_path, 'w', newline='') as stream:
+        writer = csv.DictWriter(stream, fieldnames=list(summary[0]) if summary else names)
+        writer.writeheader()
+        writer.writerows(summary)
+    return len(pending)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run headless balancing sweeps over a parameter grid")
+    parser.add_argument('--param', action='append', default=[], metavar='NAME=V1,V2',
+                        help=f"values to try for one of {', '.join(TUNABLE)} (repeatable)")
+    parser.add_argument('--seeds', default='20',
+                        help="seed count (N = 0..N-1), inclusive range A-B, or list A,B,C")
+    parser.add_argument('--frames', type=int, default=36000,
+                        help="frame limit per game (default 10 minutes at 60 FPS)")
+    parser.add_argument('--input', choices=INPUTS, default='bot',
+                        help="reactive bot or the scripted demo loop")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes (default: all cores)")
+    parser.add_argument('--output', default='sweep.csv', help="per-game results CSV (resumed if present)")
+    parser.add_argument('--summary', default=None, help="summary CSV (default: OUTPUT_summary.csv)")
+    args = parser.parse_args(argv)
+
+    try:
+        params = [parse_param(text) for text in args.param]
+        played = run_sweep(params, parse_seeds(args.seeds), args.output, args.frames,
+                           args.input, args.workers, args.summary)
+    except ValueError as error:
+        parser.error(str(error))
+    print(f"Played {played} games; results in {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
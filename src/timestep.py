@@ -0,0 +1,48 @@
+"""
+Fixed-timestep accumulator.
+
+Real time is fed in once per rendered frame and paid out as whole simulation
+ticks; what is left over becomes the interpolation factor used to draw
+between the last two simulated states. The game speed therefore depends only
+on the tick rate, not on how long drawing takes.
+"""
+
+
+class FixedTimestep:
+    def __init__(self, rate, max_frame_time=0.25, scale=1):
+        """
+        Args:
+            rate: Simulation ticks per second
+            max_frame_time: Longest real-time gap credited in one frame; a
+                stall (window drag, breakpoint) skips time instead of making
+                the simulation race to catch up
+            scale: Game seconds per real second (fast-forward multiplier)
+        """
+        self.rate = rate
+        self.dt = 1.0 / rate
+        self.max_frame_time = max_frame_time
+        self.scale = scale
+        self.accumulator = 0.0
+
+    def advance(self, elapsed):
+        """
+        Credit real time and take out the ticks it pays for.
+
+        Args:
+            elapsed: Seconds since the previous call
+
+        Returns:
+            Number of simulation ticks to run this frame
+        """
+        self.accumulator += min(max(elapsed, 0.0), self.max_frame_time) * self.scale
+        ticks = int(self.accumulator // self.dt)
+        self.accumulator -= ticks * self.dt
+        return ticks
+
+    @property
+    def alpha(self):
+        """Fraction of a tick left over, in [0, 1): how far to draw past the previous state"""
+        return min(self.accumulator / self.dt, 1.0)
+
+    def reset(self):
+        self.accumulator = 0.0
@@ -0,0 +1,96 @@
+import os
+
+import pytest
+import pygame
+from unittest.mock import patch
+
+from assetpack import AssetPack, build_pack, open_pack
+from main import Game
+from sprites import sprite_cache
+
+
+@pytest.fixture
+def pygame_init():
+    """Initialize pygame for tests"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+@pytest.fixture
+def loose_assets(tmp_path):
+    """Write an asymmetric opaque PNG and a translucent one, as Game.ASSETS-style entries"""
+    sprite = pygame.Surface((100, 80))
+    sprite.fill((0, 0, 255))
+    sprite.fill((255, 0, 0), pygame.Rect(0, 0, 50, 80))
+    heart = pygame.Surface((32, 32), pygame.SRCALPHA)
+    pygame.draw.circle(heart, (255, 0, 0, 255), (16, 16), 10)
+    pygame.image.save(sprite, str(tmp_path / 'sprite.png'))
+    pygame.image.save(heart, str(tmp_path / 'heart.png'))
+    return [
+        ('player', str(tmp_path / 'sprite.png'), (50, 50)),
+        ('enemy', str(tmp_path / 'sprite.png'), (50, 50)),
+        ('pumpkin', str(tmp_path / 'missing.png'), (50, 50)),
+        ('heart', str(tmp_path / 'heart.png'), (30, 30)),
+    ]
+
+
+class TestAssetPack:
+    """Test suite for the pre-decoded, memory-mapped asset pack"""
+
+    def test_round_trip_matches_scaled_sources(self, pygame_init, loose_assets, tmp_path):
+        """Test packed images equal the scaled and flipped source pixels"""
+        path = str(tmp_path / 'assets.pack')
+
+        assert build_pack(loose_assets, path) == ['player', 'enemy', 'heart']
+
+        pack = AssetPack(path)
+        scaled = pygame.transform.scale(pygame.image.load(loose_assets[0][1]), (50, 50))
+        right, left = pack.surface('player'), pack.surface('player', flip=True)
+        assert right.get_size() == (50, 50)
+        assert right.get_at((0, 25)) == scaled.get_at((0, 25))
+        assert left.get_at((0, 25)) == scaled.get_at((49, 25))
+        heart = pack.surface('heart')
+        assert heart.get_flags() & pygame.SRCALPHA
+        assert heart.get_at((0, 0)).a == 0
+        assert 'pumpkin' not in pack
+
+    def test_invalid_pack_is_rejected(self, tmp_path):
+        """Test truncated or foreign files raise ValueError and open_pack gives None"""
+        for name, data in (('empty', b''), ('foreign', b'PNG\0' * 8), ('short', b'KSAP\x01\0\x09\0')):
+            path = tmp_path / name
+            path.write_bytes(data)
+            with pytest.raises(ValueError):
+                AssetPack(str(path))
+            assert open_pack(str(path)) is None
+        assert open_pack(str(tmp_path / 'nothing.pack')) is None
+
+    def test_changed_source_is_stale(self, pygame_init, loose_assets, tmp_path):
+        """Test a PNG modified after packing no longer counts as fresh"""
+        path = str(tmp_path / 'assets.pack')
+        build_pack(loose_assets, path)
+        pack = AssetPack(path)
+        source = loose_assets[0][1]
+        assert pack.is_fresh('player', source)
+
+        os.utime(source, ns=(0, 0))
+
+        assert not pack.is_fresh('player', source)
+        assert pack.is_fresh('player', str(tmp_path / 'shipped-without-pngs.png'))
+
+    def test_game_loads_without_decoding(self, pygame_init, loose_assets, tmp_path):
+        """Test the game takes packed images and their cached flips without loading PNGs"""
+        path = str(tmp_path / 'assets.pack')
+        build_pack(loose_assets, path)
+        packed_game = type('PackedGame', (Game,), {'ASSETS': loose_assets, 'ASSET_PACK': path})
+
+        with patch('pygame.image.load', side_effect=AssertionError("decoded a PNG")):
+            with patch('assets.pygame.image.load', side_effect=pygame.error("no file")):
+                game = packed_game(headless=True, seed=1)
+
+        assert game.kiro_image.get_size() == (50, 50)
+        assert game.heart_image.get_size() == (30, 30)
+        flipped = sprite_cache.get(game.kiro_image, (50, 50), flip=True)
+        assert flipped.get_at((0, 25))[:3] == (0, 0, 255)
+        # Missing from the pack and from disk: the usual fallback applies
+        assert game.pumpkin_image is game.enemy_image
@@ -0,0 +1,52 @@
+import pytest
+import pygame
+
+from assets import convert_surface, load_image, blit_report
+
+
+@pytest.fixture
+def pygame_init():
+    """Initialize pygame for tests"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+class TestAssets:
+    """Test suite for display-format asset loading"""
+
+    def test_headless_opaque_surface_matches_target(self, pygame_init):
+        """Test opaque surfaces convert to the target format without a display"""
+        target = pygame.Surface((100, 100), depth=32)
+        surface = pygame.Surface((10, 10), depth=24)
+
+        converted = convert_surface(surface, target)
+
+        assert converted.get_bitsize() == target.get_bitsize()
+        assert converted.get_masks() == target.get_masks()
+
+    def test_headless_alpha_surface_is_kept(self, pygame_init):
+        """Test per-pixel alpha surfaces fall back to the loaded surface without a display"""
+        surface = pygame.Surface((10, 10), pygame.SRCALPHA)
+
+        assert convert_surface(surface, pygame.Surface((100, 100))) is surface
+
+    def test_load_image_converts_loaded_file(self, pygame_init, tmp_path):
+        """Test load_image reads a file and returns a surface of the same size"""
+        path = tmp_path / 'sprite.png'
+        pygame.image.save(pygame.Surface((12, 8)), str(path))
+
+        image = load_image(str(path), pygame.Surface((100, 100)))
+
+        assert image.get_size() == (12, 8)
+
+    def test_blit_report_skips_missing_assets(self, pygame_init, tmp_path):
+        """Test the blit report measures existing assets and skips missing ones"""
+        path = tmp_path / 'sprite.png'
+        pygame.image.save(pygame.Surface((12, 8)), str(path))
+        assets = [('sprite', str(path), (50, 50)), ('missing', str(tmp_path / 'nope.png'), (50, 50))]
+
+        results = blit_report(assets, pygame.Surface((800, 600)), duration=0.01)
+
+        assert [name for name, _, _ in results] == ['sprite']
+        assert all(rate > 0 for _, raw, converted in results for rate in (raw, converted))
@@ -0,0 +1,48 @@
+import pytest
+import pygame
+
+from bench_game import BENCHMARKS, Scene, compare, run_benchmarks
+
+
+@pytest.fixture
+def pygame_init():
+    """Initialize pygame for tests"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+class TestBenchmarks:
+    """Test suite for the game benchmark harness"""
+
+    def test_scene_restores_identical_state(self, pygame_init):
+        """Test every measurement starts from the same entities"""
+        scene = Scene(20)
+        game = scene.restore()
+        before = [tuple(enemy.rect) for enemy in game.enemies]
+        game.update({pygame.K_LEFT: False, pygame.K_RIGHT: False, pygame.K_a: False,
+                     pygame.K_d: False, pygame.K_SPACE: False, pygame.K_UP: False, pygame.K_w: False})
+
+        game = scene.restore()
+
+        assert len(game.enemies) == 20
+        assert len(game.sonic_waves) == 20
+        assert [tuple(enemy.rect) for enemy in game.enemies] == before
+
+    def test_run_benchmarks_covers_every_count(self, pygame_init):
+        """Test results hold every benchmark at every requested count"""
+        results = run_benchmarks(counts=(1, 10), min_time=0.0, max_repeat=1)
+
+        assert set(results) == set(BENCHMARKS)
+        for name in BENCHMARKS:
+            assert set(results[name]) == {'1', '10'}
+            assert results[name]['10']['seconds'] > 0
+
+    def test_compare_flags_slowdowns_over_threshold(self):
+        """Test only results slower than the threshold are regressions"""
+        baseline = {'update': {'10': {'seconds': 1.0}, '100': {'seconds': 1.0}}}
+        results = {'update': {'10': {'seconds': 1.05}, '100': {'seconds': 1.5}, '1000': {'seconds': 9.0}}}
+
+        rows = compare(results, baseline, threshold=0.10)
+
+        assert [(count, regressed) for _, count, _, _, _, regressed in rows] == [('10', False), ('100', True)]
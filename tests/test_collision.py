@@ -0,0 +1,90 @@
+import random
+
+import pytest
+import pygame
+
+from main import SonicWave
+from collision import WaveHit, find_wave_hits, split_hits, find_wave_hits_batch
+
+
+def random_scene(seed, count):
+    rng = random.Random(seed)
+    waves = [SonicWave(rng.uniform(-20, 820), rng.uniform(350, 550), 1) for _ in range(count)]
+    rects = [pygame.Rect(rng.randint(0, 750), rng.randint(350, 500), 50, 50) for _ in range(count)]
+    return waves, rects
+
+
+def brute_force_hits(waves, rects):
+    return [
+        WaveHit(w, e)
+        for w, wave in enumerate(waves)
+        for e, rect in enumerate(rects)
+        if wave.collides_with(rect)
+    ]
+
+
+class TestBroadphase:
+    """Test suite for the sonic wave broadphase"""
+
+    def test_no_entities_means_no_hits(self):
+        """Test empty inputs produce no hit events"""
+        assert find_wave_hits([], [pygame.Rect(0, 0, 50, 50)]) == []
+        assert find_wave_hits([SonicWave(10, 10, 1)], []) == []
+
+    def test_matches_brute_force(self):
+        """Test the sweep finds exactly the pairs an all-pairs check finds"""
+        waves, rects = random_scene(42, 200)
+
+        assert find_wave_hits(waves, rects) == brute_force_hits(waves, rects)
+
+    def test_edge_touching_is_not_a_hit(self):
+        """Test a circle exactly touching the rect edge does not collide"""
+        rect = pygame.Rect(100, 100, 50, 50)
+        touching = SonicWave(150 + 15, 125, 1)
+        overlapping = SonicWave(150 + 14, 125, 1)
+
+        assert find_wave_hits([touching, overlapping], [rect]) == [WaveHit(1, 0)]
+
+    def test_split_hits_collapses_pairs(self):
+        """Test one wave hitting two enemies removes the wave once and both enemies"""
+        hits = [WaveHit(0, 1), WaveHit(0, 2), WaveHit(3, 2)]
+
+        assert split_hits(hits) == ({0, 3}, {1, 2})
+
+
+class TestBatchKernel:
+    """Test suite for the vectorized circle-rect kernel"""
+
+    @pytest.fixture(autouse=True)
+    def require_numpy(self):
+        pytest.importorskip("numpy")
+
+    def test_batch_matches_scalar(self):
+        """Test the batch kernel finds exactly the pairs collides_with finds"""
+        waves, rects = random_scene(7, 300)
+
+        assert find_wave_hits_batch(waves, rects) == brute_force_hits(waves, rects)
+
+    def test_batch_edge_semantics(self):
+        """Test exact-radius contact, including corners, is not a hit"""
+        rect = pygame.Rect(100, 100, 50, 50)
+        waves = [
+            SonicWave(165, 125, 1),   # touching right edge
+            SonicWave(164, 125, 1),   # overlapping right edge
+            SonicWave(159, 162, 1),   # 9-12-15 triangle to the bottom-right corner
+            SonicWave(125, 125, 1),   # centre inside
+        ]
+
+        assert find_wave_hits_batch(waves, [rect]) == brute_force_hits(waves, [rect])
+        assert [hit.wave_index for hit in find_wave_hits_batch(waves, [rect])] == [1, 3]
+
+    def test_chunking_does_not_change_result(self):
+        """Test processing waves in small chunks gives the same hits"""
+        from collision import circle_rect_hits, wave_arrays, rect_arrays
+
+        waves, rects = random_scene(3, 100)
+        full = circle_rect_hits(*wave_arrays(waves), *rect_arrays(rects))
+        chunked = circle_rect_hits(*wave_arrays(waves), *rect_arrays(rects), chunk=7)
+
+        assert list(full[0]) == list(chunked[0])
+        assert list(full[1]) == list(chunked[1])
@@ -0,0 +1,134 @@
+import random
+
+import pytest
+import pygame
+
+np = pytest.importorskip("numpy")
+
+from main import Enemy, SCREEN_WIDTH
+from enemy_engine import EnemyEngine, round_half_away, step_enemies
+
+
+@pytest.fixture
+def pygame_init():
+    """Initialize pygame for tests"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+@pytest.fixture
+def mock_image():
+    """Create a mock pygame surface for testing"""
+    surface = pygame.Surface((50, 50))
+    surface.fill((255, 0, 255))
+    return surface
+
+
+def assert_matches(engine, enemies):
+    assert len(engine) == len(enemies)
+    for i, enemy in enumerate(enemies):
+        assert engine.x[i] == enemy.rect.x
+        assert engine.y[i] == enemy.rect.y
+        assert engine.vel_y[i] == enemy.vel_y
+        assert engine.move_direction[i] == enemy.move_direction
+        assert engine.direction_timer[i] == enemy.direction_timer
+        assert engine.direction_change_interval[i] == enemy.direction_change_interval
+        assert engine.boundary_timer[i] == enemy.boundary_timer
+        assert engine.on_ground[i] == enemy.on_ground
+        assert engine.facing_right[i] == enemy.facing_right
+
+
+class TestEnemyEngine:
+    """Test suite for the vectorized enemy backend"""
+
+    def test_round_half_away_matches_pygame_rect(self, pygame_init):
+        """Test float-to-int rounding matches pygame.Rect assignment"""
+        values = [-2.5, -1.5, -0.6, -0.5, -0.4999, 0.4999, 0.5, 1.5, 2.5, 9.4]
+        rect = pygame.Rect(0, 0, 1, 1)
+        expected = []
+        for value in values:
+            rect.y = value
+            expected.append(rect.y)
+
+        assert list(round_half_away(np.array(values))) == expected
+
+    def test_step_matches_enemy_update(self, pygame_init, mock_image):
+        """Test vectorized step reproduces Enemy.update given the same random draws"""
+        ground_y = 500
+        object_rng = random.Random(99)
+        engine_rng = random.Random(99)
+        enemies = [Enemy(x, 200 + (x % 7) * 40, mock_image, object_rng)
+                   for x in range(0, SCREEN_WIDTH, 37)]
+        engine = EnemyEngine.from_enemies(enemies)
+        engine_rng.setstate(object_rng.getstate())
+
+        for _ in range(600):
+            for enemy in enemies:
+                enemy.update(ground_y)
+            engine.step(ground_y, engine_rng)
+
+        assert_matches(engine, enemies)
+
+    def test_spawn_draws_like_enemy_constructor(self, pygame_init, mock_image):
+        """Test spawn consumes random draws in the same order as Enemy.__init__"""
+        enemy = Enemy(300, 400, mock_image, random.Random(7))
+        engine = EnemyEngine()
+
+        engine.spawn(300, 400, random.Random(7))
+
+        assert_matches(engine, [enemy])
+
+    def test_engine_grows_past_capacity(self):
+        """Test spawning beyond the initial capacity keeps existing enemies"""
+        engine = EnemyEngine(capacity=2)
+        rng = random.Random(0)
+        for x in range(10):
+            engine.spawn(x * 10, 100, rng)
+
+        assert len(engine) == 10
+        assert list(engine.x) == [x * 10 for x in range(10)]
+
+    def test_remove_keeps_survivors_in_order(self):
+        """Test removal compacts the arrays without reordering survivors"""
+        engine = EnemyEngine()
+        rng = random.Random(0)
+        for x in (100, 200, 300, 400):
+            engine.spawn(x, 100, rng)
+
+        engine.remove(np.array([False, True, False, True]))
+
+        assert list(engine.x) == [100, 300]
+
+    def test_numpy_generator_step_keeps_enemies_on_screen(self):
+        """Test the vectorized random path keeps enemies inside the screen"""
+        engine = EnemyEngine()
+        rng = np.random.default_rng(0)
+        spawn_rng = random.Random(0)
+        for x in range(0, SCREEN_WIDTH - 50, 10):
+            engine.spawn(x, 450, spawn_rng)
+
+        for _ in range(300):
+            engine.step(500, rng)
+
+        assert engine.x.min() >= 0
+        assert engine.x.max() <= SCREEN_WIDTH - 50
+        assert (engine.y + 50 <= 500).all()
+
+    def test_step_enemies_on_a_grid_matches_the_engine(self):
+        """Test stepping 2-d arrays matches an engine holding the same enemies in C order"""
+        engine = EnemyEngine()
+        spawn_rng = random.Random(0)
+        for x in range(0, 600, 25):
+            engine.spawn(x, 450, spawn_rng)
+        # Column-major storage, like VecGame's slot arrays
+        grid = {name: np.asfortranarray(getattr(engine, name).reshape(4, 6)) for name, _ in engine.FIELDS}
+        engine_rng = np.random.default_rng(3)
+        grid_rng = np.random.default_rng(3)
+
+        for _ in range(200):
+            engine.step(500, engine_rng)
+            step_enemies(grid, 500, grid_rng)
+
+        for name, _ in engine.FIELDS:
+            assert (grid[name].ravel() == getattr(engine, name)).all(), name
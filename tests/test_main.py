@@ -1,8 +1,11 @@
+import random
+
 import pytest
 import pygame
 from unittest.mock import Mock, patch
 
-from main import Player, Enemy, Game, SCREEN_WIDTH, SCREEN_HEIGHT, GRAVITY, JUMP_POWER, MOVE_SPEED, SPOOKY_GREEN
+from main import Player, Enemy, Game, SonicWave, KeyState, ScriptedInput, SCREEN_WIDTH, SCREEN_HEIGHT, SPOOKY_GREEN
+from constants import GRAVITY, JUMP_POWER, MOVE_SPEED
 
 
 @pytest.fixture
@@ -567,3 +570,167 @@ class TestGame:
         assert game.player_health == 3
         assert game.invulnerable == False
         assert game.invulnerable_timer == 0
+
+    @patch('pygame.display.set_mode')
+    @patch('pygame.image.load')
+    def test_wave_hit_removes_wave_and_enemy(self, mock_load, mock_display, pygame_init):
+        """Test a colliding wave and enemy are both removed while others survive"""
+        mock_surface = pygame.Surface((50, 50))
+        mock_load.return_value = mock_surface
+        mock_display.return_value = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+        game = Game()
+        hit_enemy = Enemy(300, 300, mock_surface)
+        safe_enemy = Enemy(600, 300, mock_surface)
+        hit_wave = SonicWave(320, 320, 1)
+        safe_wave = SonicWave(100, 100, 1)
+        game.enemies = [hit_enemy, safe_enemy]
+        game.sonic_waves = [hit_wave, safe_wave]
+
+        hits = game.resolve_wave_collisions()
+
+        assert len(hits) == 1
+        assert game.enemies == [safe_enemy]
+        assert game.sonic_waves == [safe_wave]
+
+
+class TestHeadless:
+    """Test suite for headless simulation mode"""
+
+    @patch('pygame.display.set_mode')
+    @patch('pygame.image.load')
+    def test_headless_game_does_not_open_window(self, mock_load, mock_display, pygame_init):
+        """Test headless game renders to an offscreen surface instead of a window"""
+        mock_load.return_value = pygame.Surface((50, 50))
+
+        game = Game(headless=True)
+
+        mock_display.assert_not_called()
+        assert game.screen.get_size() == (SCREEN_WIDTH, SCREEN_HEIGHT)
+
+    def test_scripted_input_taps_and_holds(self, pygame_init):
+        """Test scripted input emits KEYDOWN/KEYUP for taps and reports held keys"""
+        script = ScriptedInput([(3, (pygame.K_LEFT,), (pygame.K_x,))])
+
+        keys, events = script.poll(0)
+        assert keys[pygame.K_LEFT] == True
+        assert keys[pygame.K_RIGHT] == False
+        assert [(e.type, e.key) for e in events] == [(pygame.KEYDOWN, pygame.K_x)]
+
+        _, events = script.poll(1)
+        assert events == []
+
+        _, events = script.poll(2)
+        assert [(e.type, e.key) for e in events] == [(pygame.KEYUP, pygame.K_x)]
+
+        # Script loops after the last step
+        _, events = script.poll(3)
+        assert [(e.type, e.key) for e in events] == [(pygame.KEYDOWN, pygame.K_x)]
+
+    @patch('pygame.display.set_mode')
+    @patch('pygame.image.load')
+    def test_run_headless_steps_simulation(self, mock_load, mock_display, pygame_init):
+        """Test run_headless advances the game and reports simulated frames"""
+        mock_load.return_value = pygame.Surface((50, 50))
+        game = Game(headless=True)
+
+        result = game.run_headless(200)
+
+        assert result['frames'] == 200
+        assert result['fps'] > 0
+        assert game.state == 'playing'
+
+    @patch('pygame.display.set_mode')
+    @patch('pygame.image.load')
+    def test_update_uses_injected_keys(self, mock_load, mock_display, pygame_init):
+        """Test update reads movement from the given key state"""
+        mock_load.return_value = pygame.Surface((50, 50))
+        game = Game(headless=True)
+        game.state = 'playing'
+        initial_x = game.player.rect.x
+
+        game.update(KeyState({pygame.K_RIGHT}))
+
+        assert game.player.rect.x == initial_x + MOVE_SPEED
+
+
+class TestDeterminism:
+    """Test suite for seeded, reproducible runs"""
+
+    @staticmethod
+    def trace(seed, frames):
+        with patch('pygame.image.load') as mock_load:
+            mock_load.return_value = pygame.Surface((50, 50))
+            game = Game(headless=True, seed=seed)
+        script = ScriptedInput.demo()
+        states = []
+        for frame in range(frames):
+            keys, events = script.poll(frame)
+            game.handle_events(events)
+            game.update(keys)
+            states.append((
+                game.state, game.player_health, tuple(game.player.rect),
+                tuple(tuple(enemy.rect) for enemy in game.enemies),
+                tuple((wave.x, wave.y) for wave in game.sonic_waves),
+            ))
+        return states
+
+    def test_same_seed_gives_identical_trace(self, pygame_init):
+        """Test a seed plus an input script reproduces every frame"""
+        assert self.trace(42, 600) == self.trace(42, 600)
+
+    def test_different_seeds_diverge(self, pygame_init):
+        """Test different seeds produce different runs"""
+        assert self.trace(1, 600) != self.trace(2, 600)
+
+    def test_enemy_uses_injected_rng(self, pygame_init, mock_image):
+        """Test enemy AI draws from the generator it was given"""
+        first = Enemy(300, 200, mock_image, random.Random(5))
+        second = Enemy(300, 200, mock_image, random.Random(5))
+
+        assert first.move_direction == second.move_direction
+        assert first.direction_change_interval == second.direction_change_interval
+
+
+class TestInterpolation:
+    """Test suite for drawing between simulation ticks"""
+
+    def test_player_draws_between_previous_and_current_position(self, pygame_init, mock_image):
+        """Test alpha picks a point between the last two ticks"""
+        player = Player(100, 100, mock_image)
+        player.update(KeyState({pygame.K_RIGHT}), 1000)
+        screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+        assert player.draw(screen, 0.0).topleft == (100, 100)
+        assert player.draw(screen, 1.0).topleft == player.rect.topleft
+        assert player.draw(screen, 0.5).x == round(100 + MOVE_SPEED * 0.5)
+
+    def test_new_entities_do_not_interpolate(self, pygame_init, mock_image):
+        """Test a freshly created or recycled entity draws where it is"""
+        enemy = Enemy(200, 300, mock_image)
+        wave = SonicWave(50, 60, 1)
+        screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+        assert enemy.draw(screen, 0.0).topleft == (200, 300)
+        assert wave.draw(screen, 0.0).center == (50, 60)
+
+    def test_wave_draws_between_ticks(self, pygame_init):
+        """Test sonic waves interpolate their horizontal position"""
+        wave = SonicWave(100, 60, 1)
+        wave.update()
+        screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+        assert wave.draw(screen, 0.5).center == (100 + wave.speed // 2, 60)
+
+    @patch('pygame.display.set_mode')
+    @patch('pygame.image.load')
+    def test_step_matches_handle_events_then_update(self, mock_load, mock_display, pygame_init):
+        """Test one step consumes its events and advances the simulation once"""
+        mock_load.return_value = pygame.Surface((50, 50))
+        game = Game(headless=True, seed=3)
+
+        game.step(KeyState(), [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)])
+        assert game.state == 'playing'
+
+        game.step(KeyState(), [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_x)])
+        assert len(game.sonic_waves) == 1
@@ -0,0 +1,145 @@
+import pytest
+import pygame
+from unittest.mock import patch
+
+from main import Game, KeyState, ScriptedInput, parse_args
+from pipeline import FrameSnapshot, InputMailbox, SimulationThread, SnapshotBuffer
+
+
+@pytest.fixture
+def pygame_init():
+    """Initialize pygame for tests"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+@pytest.fixture
+def game(pygame_init):
+    """Headless game on the start screen"""
+    with patch('pygame.image.load') as mock_load:
+        mock_load.return_value = pygame.Surface((50, 50))
+        game = Game(headless=True, seed=1)
+    return game
+
+
+class TestPipeline:
+    """Test suite for the pipelined simulation/render mode"""
+
+    def test_buffer_keeps_only_the_newest_snapshots(self):
+        """Test the buffer is bounded and latest() returns the newest entry"""
+        buffer = SnapshotBuffer(slots=2)
+        assert buffer.latest() is None
+
+        for tick in range(5):
+            buffer.publish(FrameSnapshot(tick, 0.0, 'start', None, (), (), 3, False, None, None))
+
+        assert buffer.latest().tick == 4
+        assert len(buffer.slots) == 2
+
+    def test_mailbox_delivers_each_event_once(self):
+        """Test events go to one tick while held keys persist"""
+        mailbox = InputMailbox()
+        keys = KeyState({pygame.K_LEFT})
+        event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_x)
+        mailbox.post(keys, [event])
+
+        assert mailbox.take() == (keys, [event])
+        assert mailbox.take() == (keys, [])
+
+    def test_snapshot_is_detached_from_live_state(self, game):
+        """Test later ticks do not change an already captured snapshot"""
+        game.state = 'playing'
+        game.step(KeyState(), [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_x)])
+        snapshot = game.snapshot()
+
+        for _ in range(5):
+            game.step(KeyState({pygame.K_RIGHT}), [])
+
+        assert snapshot.tick == 1
+        assert snapshot.waves[0][0] != game.sonic_waves[0].x
+        assert snapshot.player[1] != game.player.rect.x
+
+    def test_draw_snapshot_matches_direct_draw(self, game):
+        """Test rendering a snapshot at alpha 1 gives the same pixels as draw()"""
+        game.state = 'playing'
+        game.step(KeyState(), [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_x)])
+        game.draw()
+        expected = pygame.image.tobytes(game.screen, 'RGB')
+
+        game.screen.fill((0, 0, 0))
+        game.draw_snapshot(game.snapshot(), 1.0)
+
+        assert pygame.image.tobytes(game.screen, 'RGB') == expected
+
+    def test_rewinding_snapshot_is_not_interpolated(self, pygame_init):
+        """Test a snapshot taken while R is held draws at its own positions whatever the alpha"""
+        with patch('pygame.image.load') as mock_load:
+            mock_load.return_value = pygame.Surface((50, 50))
+            game = Game(headless=True, seed=1, rewind_seconds=10)
+        script = ScriptedInput.demo()
+        for frame in range(200):
+            game.step(*script.poll(frame))
+        game.step(KeyState({pygame.K_r}), [])
+        snapshot = game.snapshot()
+        assert snapshot.rewinding
+
+        game.draw_snapshot(snapshot, 1.0)
+        expected = pygame.image.tobytes(game.screen, 'RGB')
+        game.draw_snapshot(snapshot, 0.0)
+
+        assert pygame.image.tobytes(game.screen, 'RGB') == expected
+
+    def test_simulation_thread_runs_ticks_from_posted_input(self, game):
+        """Test the worker consumes posted input and publishes snapshots"""
+        mailbox = InputMailbox()
+        buffer = SnapshotBuffer()
+        simulation = SimulationThread(game, mailbox, buffer)
+        mailbox.post(KeyState(), [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)])
+        simulation.start()
+        try:
+            snapshot = buffer.wait(lambda s: s.state == 'playing' and s.tick >= 3, timeout=5)
+        finally:
+            simulation.stop()
+            simulation.join(timeout=5)
+
+        assert snapshot.state == 'playing'
+        assert not simulation.is_alive()
+
+    def test_draw_snapshot_shows_the_turbo_label(self, game):
+        """Test a snapshot taken in turbo draws the same label as draw()"""
+        game.state = 'playing'
+        game.turbo = 4
+        game.turbo_rate = 3.5
+        game.step(KeyState(), [])
+        game.draw()
+        expected = pygame.image.tobytes(game.screen, 'RGB')
+
+        game.screen.fill((0, 0, 0))
+        game.draw_snapshot(game.snapshot(), 1.0)
+
+        assert game.snapshot().turbo == (4, 3.5)
+        assert pygame.image.tobytes(game.screen, 'RGB') == expected
+
+    def test_simulation_thread_budgets_unlimited_turbo(self, game):
+        """Test unlimited turbo runs budgeted batches and measures the speed reached"""
+        game.turbo = 0
+        game.TURBO_FRAME_BUDGET = 0.0
+        mailbox = InputMailbox()
+        buffer = SnapshotBuffer()
+        simulation = SimulationThread(game, mailbox, buffer)
+        mailbox.post(KeyState(), [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)])
+        simulation.start()
+        try:
+            snapshot = buffer.wait(lambda s: s.state == 'playing' and s.tick >= 30, timeout=5)
+        finally:
+            simulation.stop()
+            simulation.join(timeout=5)
+
+        assert snapshot.turbo[0] == 0
+        assert game.turbo_rate != 1.0
+
+    def test_pipelined_rejects_dirty_rects(self):
+        """Test --pipelined with --dirty-rects is refused instead of ignoring one of them"""
+        with pytest.raises(SystemExit):
+            parse_args(['--pipelined', '--dirty-rects'])
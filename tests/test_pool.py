@@ -0,0 +1,84 @@
+import pytest
+
+from main import SonicWave
+from pool import EntityPool
+
+
+class TestEntityPool:
+    """Test suite for the fixed-capacity entity pool"""
+
+    def test_acquire_resets_recycled_object(self):
+        """Test acquire hands out a preallocated object re-initialized with args"""
+        pool = EntityPool(SonicWave, 2)
+
+        wave = pool.acquire(10, 20, -1)
+
+        assert wave in pool.objects
+        assert (wave.x, wave.y, wave.direction) == (10, 20, -1)
+        assert len(pool) == 1
+
+    def test_exhausted_pool_returns_none(self):
+        """Test acquiring past capacity fails instead of allocating"""
+        pool = EntityPool(SonicWave, 1)
+        pool.acquire(0, 0, 1)
+
+        assert pool.acquire(0, 0, 1) is None
+
+    def test_growable_pool_extends_when_exhausted(self):
+        """Test a growable pool allocates more slots instead of refusing, keeping old handles valid"""
+        pool = EntityPool(SonicWave, 2, grow=True)
+        first = pool.acquire(0, 0, 1)
+        handle = pool.handle(first)
+
+        waves = [pool.acquire(i, 0, 1) for i in range(5)]
+
+        assert None not in waves
+        assert pool.capacity == 8
+        assert len({wave.pool_slot for wave in waves + [first]}) == 6
+        assert pool.resolve(handle) is first
+
+    def test_released_slot_is_reused(self):
+        """Test releasing an object puts its slot back on the free list"""
+        pool = EntityPool(SonicWave, 1)
+        wave = pool.acquire(0, 0, 1)
+        pool.release(wave)
+
+        assert pool.acquire(5, 5, 1) is wave
+
+    def test_handle_goes_stale_after_release(self):
+        """Test generation counters detect references to recycled objects"""
+        pool = EntityPool(SonicWave, 1)
+        wave = pool.acquire(0, 0, 1)
+        handle = pool.handle(wave)
+        assert pool.resolve(handle) is wave
+
+        pool.release(wave)
+        pool.acquire(1, 1, 1)
+
+        assert pool.resolve(handle) is None
+
+    def test_remove_indices_swap_removes(self):
+        """Test removal fills holes with the last entries and releases removed objects"""
+        pool = EntityPool(SonicWave, 5)
+        live = [pool.acquire(x, 0, 1) for x in range(5)]
+        a, b, c, d, e = live
+
+        pool.remove_indices(live, [0, 3])
+
+        assert live == [e, b, c]
+        assert len(pool) == 3
+
+    def test_unowned_objects_are_ignored(self):
+        """Test objects created outside the pool can be removed without corrupting it"""
+        pool = EntityPool(SonicWave, 1)
+        live = [SonicWave(0, 0, 1)]
+
+        pool.remove_indices(live, [0])
+
+        assert live == []
+        assert len(pool) == 0
+
+    def test_slots_prevent_instance_dict(self):
+        """Test pooled entities do not carry a per-instance __dict__"""
+        with pytest.raises(AttributeError):
+            SonicWave(0, 0, 1).__dict__
@@ -0,0 +1,98 @@
+import json
+
+import pytest
+import pygame
+from unittest.mock import patch
+
+from main import Game, KeyState, SCREEN_WIDTH
+from profiler import FrameProfiler, PHASES, percentile
+
+
+@pytest.fixture
+def pygame_init():
+    """Initialize pygame for tests"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+@pytest.fixture
+def game(pygame_init):
+    """Headless game in the playing state"""
+    with patch('pygame.image.load') as mock_load:
+        mock_load.return_value = pygame.Surface((50, 50))
+        game = Game(headless=True, seed=1)
+    game.state = 'playing'
+    return game
+
+
+class TestFrameProfiler:
+    """Test suite for the per-phase frame profiler"""
+
+    def test_percentile_nearest_rank(self):
+        """Test percentiles pick the nearest-rank sample"""
+        values = list(range(1, 101))
+
+        assert percentile(values, 0.50) == 50
+        assert percentile(values, 0.95) == 95
+        assert percentile(values, 0.99) == 99
+        assert percentile([], 0.5) == 0.0
+
+    def test_rolling_window_is_bounded(self):
+        """Test only the most recent frames count towards the percentiles"""
+        profiler = FrameProfiler(window=10, enabled=True)
+        for _ in range(25):
+            profiler.begin_frame()
+            profiler.lap('player')
+            profiler.end_frame()
+
+        assert len(profiler.samples['player']) == 10
+        assert profiler.frame == 25
+
+    def test_game_frame_records_every_update_phase(self, game):
+        """Test an update charges time to each simulation phase"""
+        game.profiler = FrameProfiler(enabled=True)
+        game.profiler.begin_frame()
+        game.update(KeyState())
+        game.profiler.end_frame()
+
+        for phase in ('player', 'spawn', 'enemies', 'waves', 'collision'):
+            assert game.profiler.samples[phase][0] > 0
+
+    def test_disabled_profiler_records_nothing(self, game):
+        """Test a disabled profiler is never lapped during update"""
+        with patch.object(FrameProfiler, 'lap') as lap:
+            game.update(KeyState())
+
+        lap.assert_not_called()
+
+    def test_f3_toggles_profiler(self, game):
+        """Test the F3 hotkey switches profiling on and off"""
+        f3 = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F3)
+
+        game.handle_events([f3])
+        assert game.profiler.enabled
+        game.handle_events([f3])
+        assert not game.profiler.enabled
+
+    def test_jsonl_export(self, game, tmp_path):
+        """Test per-frame timings are written as JSON Lines"""
+        path = tmp_path / 'frames.jsonl'
+        game.profiler = FrameProfiler(enabled=True, jsonl_path=str(path))
+
+        game.run_headless(5)
+        game.profiler.close()
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [record['frame'] for record in records] == list(range(5))
+        assert set(PHASES) <= set(records[0])
+
+    def test_overlay_drawn_in_top_right(self, game):
+        """Test the overlay sits in the top-right corner of the screen"""
+        game.profiler = FrameProfiler(enabled=True)
+
+        drawn = game.draw_state()
+
+        assert drawn[-1].right == SCREEN_WIDTH - 10
+        assert drawn[-1].top == 10
+
@@ -0,0 +1,207 @@
+import pytest
+import pygame
+from unittest.mock import patch
+
+from main import Game, BLACK_900, SCREEN_WIDTH, SCREEN_HEIGHT
+from renderer import DirtyRectRenderer, ScreenCache, SpriteBatch
+
+
+@pytest.fixture
+def pygame_init():
+    """Initialize pygame for tests"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+@pytest.fixture
+def dirty_game(pygame_init):
+    """Headless game using dirty-rect rendering"""
+    with patch('pygame.image.load') as mock_load:
+        mock_load.return_value = pygame.Surface((50, 50))
+        game = Game(headless=True, dirty_rects=True)
+    return game
+
+
+class TestDirtyRectRenderer:
+    """Test suite for dirty-rect rendering"""
+
+    def test_erase_restores_background(self, pygame_init):
+        """Test erase copies the background over last frame's rects only"""
+        screen = pygame.Surface((100, 100))
+        screen.fill((255, 0, 0))
+        background = pygame.Surface((100, 100))
+        background.fill((0, 0, 255))
+        renderer = DirtyRectRenderer(screen, background)
+        renderer.reset('playing', [pygame.Rect(10, 10, 20, 20)])
+
+        renderer.erase()
+
+        assert screen.get_at((15, 15))[:3] == (0, 0, 255)
+        assert screen.get_at((50, 50))[:3] == (255, 0, 0)
+
+    def test_commit_returns_old_and_new_rects(self, pygame_init):
+        """Test the dirty list covers where sprites were and where they are now"""
+        renderer = DirtyRectRenderer(pygame.Surface((10, 10)), pygame.Surface((10, 10)))
+        old = pygame.Rect(0, 0, 5, 5)
+        new = pygame.Rect(3, 3, 5, 5)
+        renderer.reset('playing', [old])
+
+        assert renderer.commit([new]) == [old, new]
+        assert renderer.previous == [new]
+
+    def test_moving_player_leaves_no_trail(self, dirty_game):
+        """Test the area a sprite moved away from is restored to the background"""
+        game = dirty_game
+        game.state = 'playing'
+        game.draw()
+        old_rect = game.player.rect.copy()
+
+        game.player.rect.x += 200
+        game.draw()
+
+        assert game.screen.get_at(old_rect.center)[:3] == BLACK_900
+
+    def test_static_screen_is_drawn_once(self, dirty_game):
+        """Test the start screen is not redrawn while nothing changes"""
+        game = dirty_game
+        with patch.object(game, 'draw_start_screen') as draw_start:
+            game.draw()
+            game.draw()
+            game.draw()
+
+        assert draw_start.call_count == 1
+
+    def test_state_change_triggers_full_redraw(self, dirty_game):
+        """Test switching states redraws the whole scene"""
+        game = dirty_game
+        game.draw()
+        game.state = 'playing'
+
+        game.draw()
+
+        # Start screen text is gone, replaced by the cached background
+        assert game.dirty_renderer.state == 'playing'
+        assert game.screen.get_at((SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3))[:3] == BLACK_900
+
+
+class TestScreenCache:
+    """Test suite for pre-rendered static screens"""
+
+    def test_same_text_reuses_surface(self, pygame_init):
+        """Test an unchanged screen is composed only once"""
+        cache = ScreenCache()
+        font = pygame.font.Font(None, 36)
+        lines = ((font, "HELLO", (255, 255, 255), (50, 50)),)
+
+        first = cache.get('start', (100, 100), lines)
+
+        assert cache.get('start', (100, 100), lines) is first
+
+    def test_changed_text_or_size_rebuilds(self, pygame_init):
+        """Test the cached screen is rebuilt when its text or resolution changes"""
+        cache = ScreenCache()
+        font = pygame.font.Font(None, 36)
+        lines = ((font, "HELLO", (255, 255, 255), (50, 50)),)
+        first = cache.get('start', (100, 100), lines)
+
+        changed_text = cache.get('start', (100, 100), ((font, "BYE", (255, 255, 255), (50, 50)),))
+        changed_size = cache.get('start', (200, 100), ((font, "BYE", (255, 255, 255), (50, 50)),))
+
+        assert changed_text is not first
+        assert changed_size is not changed_text
+        assert changed_size.get_size() == (200, 100)
+
+    def test_overlay_fill_is_translucent(self, pygame_init):
+        """Test the game over backdrop keeps its overlay alpha"""
+        cache = ScreenCache()
+
+        overlay = cache.get('gameOver', (100, 100), (), fill=BLACK_900 + (180,))
+
+        assert overlay.get_at((0, 0)) == BLACK_900 + (180,)
+
+    def test_backdrop_screen_is_opaque(self, pygame_init):
+        """Test a screen with a backdrop is composed without per-pixel alpha"""
+        cache = ScreenCache()
+        backdrop = lambda surface: surface.fill((10, 20, 30))
+
+        screen = cache.get('start', (100, 100), (), backdrop=backdrop)
+
+        assert not screen.get_flags() & pygame.SRCALPHA
+        assert screen.get_at((0, 0))[:3] == (10, 20, 30)
+        assert cache.get('start', (100, 100), (), backdrop=backdrop) is screen
+
+    def test_game_screens_are_cached_across_frames(self, dirty_game):
+        """Test repeated game over frames blit the same pre-rendered overlay"""
+        game = dirty_game
+        game.draw_game_over_screen()
+        overlay = game.screen_cache._screens['gameOver'][1]
+
+        game.draw_game_over_screen()
+
+        assert game.screen_cache._screens['gameOver'][1] is overlay
+
+
+class TestSpriteBatch:
+    """Test suite for batched sprite blits"""
+
+    def test_groups_by_surface_in_first_added_order(self, pygame_init):
+        """Test sprites sharing a surface are submitted together, groups in first-added order"""
+        red, blue = pygame.Surface((10, 10)), pygame.Surface((10, 10))
+        red.fill((255, 0, 0))
+        blue.fill((0, 0, 255))
+        target = pygame.Surface((40, 10))
+        batch = SpriteBatch()
+        batch.add(red, (0, 0))
+        batch.extend([(blue, (5, 0)), (red, (10, 0)), (blue, (30, 0))])
+
+        assert len(batch) == 4
+        drawn = batch.draw(target)
+
+        assert [rect.x for rect in drawn] == [0, 10, 5, 30]
+        # The second red sprite went down before the first blue one covered it
+        assert target.get_at((12, 0))[:3] == (0, 0, 255)
+        assert len(batch) == 0
+        assert batch.draw(target) == []
+
+    def test_rects_are_clipped_like_blit(self, pygame_init):
+        """Test returned rects match what individual blits report"""
+        sprite = pygame.Surface((10, 10))
+        target = pygame.Surface((20, 20))
+        positions = [(-5, -5), (15, 15), (30, 30), (4, 6)]
+        batch = SpriteBatch()
+        batch.extend((sprite, position) for position in positions)
+
+        assert batch.draw(target) == [target.blit(sprite, position) for position in positions]
+
+    def test_game_frame_matches_individual_blits(self, dirty_game):
+        """Test a batched frame of separate sprites is pixel-identical to drawing each on its own"""
+        game = dirty_game
+        game.dirty_renderer = None
+        game.state = 'playing'
+        for i, x in enumerate(range(0, 700, 55)):
+            enemy = game.Enemy(x, game.ground_y - 50 - i % 3 * 10, game.pumpkin_image if i % 2 else game.enemy_image)
+            enemy.set_facing(i % 3 == 0)
+            game.enemies.append(enemy)
+        game.draw()
+        batched = pygame.image.tobytes(game.screen, 'RGB')
+
+        game.draw_background(game.screen)
+        for sprite in [game.player] + game.enemies:
+            sprite.draw(game.screen)
+        for i in range(game.player_health):
+            game.screen.blit(game.heart_image, (10 + i * 40, 10))
+
+        assert pygame.image.tobytes(game.screen, 'RGB') == batched
+
+    def test_dirty_frames_report_sprite_rects(self, dirty_game):
+        """Test the dirty-rect renderer still learns where every sprite and heart landed"""
+        game = dirty_game
+        game.state = 'playing'
+        game.enemies.append(game.enemy_pool.acquire(300, 200, game.pumpkin_image, game.rng.ai))
+
+        drawn = game.draw_state()
+
+        assert game.player.rect.topleft in [rect.topleft for rect in drawn]
+        assert (300, 200) in [rect.topleft for rect in drawn]
+        assert len(drawn) == 2 + game.player_health
@@ -0,0 +1,86 @@
+import pytest
+import pygame
+from unittest.mock import patch
+
+from main import Game, KeyState, ScriptedInput
+from replay import InputRecorder, InputReplay, HEADER
+
+
+@pytest.fixture
+def pygame_init():
+    """Initialize pygame for tests"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def make_game(seed):
+    with patch('pygame.image.load') as mock_load:
+        mock_load.return_value = pygame.Surface((50, 50))
+        return Game(headless=True, seed=seed)
+
+
+def snapshot(game):
+    return (
+        game.state, game.player_health, tuple(game.player.rect),
+        tuple(tuple(enemy.rect) for enemy in game.enemies),
+        tuple((wave.x, wave.y) for wave in game.sonic_waves),
+    )
+
+
+class TestReplay:
+    """Test suite for input recording and replay"""
+
+    def test_round_trip_preserves_keys_and_events(self, pygame_init, tmp_path):
+        """Test recorded frames come back with the same held keys and events in order"""
+        path = tmp_path / 'session.ksr'
+        frames = [
+            ({pygame.K_LEFT}, [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_x)]),
+            ({pygame.K_LEFT}, [pygame.event.Event(pygame.KEYUP, key=pygame.K_x),
+                               pygame.event.Event(pygame.KEYDOWN, key=pygame.K_z)]),
+            (set(), [pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(5, 5))]),
+        ]
+        with InputRecorder(path, seed=9) as recorder:
+            for held, events in frames:
+                recorder.record(KeyState(held), events)
+
+        with InputReplay(path) as replay:
+            assert replay.seed == 9
+            for held, events in frames:
+                keys, replayed = replay.poll()
+                assert keys[pygame.K_LEFT] == (pygame.K_LEFT in held)
+                assert [(e.type, getattr(e, 'key', None)) for e in replayed] == \
+                       [(e.type, getattr(e, 'key', None)) for e in events]
+            assert replay.poll() is None
+
+    def test_identical_frames_are_run_length_encoded(self, pygame_init, tmp_path):
+        """Test a long idle stretch costs a single run"""
+        path = tmp_path / 'idle.ksr'
+        with InputRecorder(path, seed=0) as recorder:
+            for _ in range(100000):
+                recorder.record(KeyState({pygame.K_RIGHT}), [])
+
+        assert path.stat().st_size <= HEADER.size + 5
+
+    def test_replay_reproduces_session(self, pygame_init, tmp_path):
+        """Test replaying a recording with its seed reproduces the final game state"""
+        path = tmp_path / 'bot.ksr'
+        original = make_game(seed=11)
+        with InputRecorder(path, original.rng.seed) as recorder:
+            original.run_headless(2000, ScriptedInput.demo(), recorder=recorder)
+
+        with InputReplay(path) as replay:
+            replayed = make_game(seed=replay.seed)
+            result = replayed.run_headless(input_source=replay)
+
+        assert result['frames'] == 2000
+        assert snapshot(replayed) == snapshot(original)
+
+    def test_rejects_foreign_files(self, tmp_path):
+        """Test files without the replay header are refused"""
+        path = tmp_path / 'bogus.ksr'
+        path.write_bytes(b'not a replay at all')
+
+        with pytest.raises(ValueError):
+            InputReplay(path)
+
@@ -0,0 +1,184 @@
+import pytest
+import pygame
+from unittest.mock import patch
+
+from main import Game, KeyState, ScriptedInput
+from replay import InputRecorder, InputReplay, decode_keys, encode_keys
+from rewind import RewindBuffer
+
+
+@pytest.fixture
+def pygame_init():
+    """Initialize pygame for tests"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def make_game(seed=3, rewind_seconds=10):
+    with patch('pygame.image.load') as mock_load:
+        mock_load.return_value = pygame.Surface((50, 50))
+        return Game(headless=True, seed=seed, rewind_seconds=rewind_seconds)
+
+
+def blobs(count):
+    """Byte strings of varying length that change a little each frame"""
+    return [bytes((i * 7 + j) % 256 for j in range(40 + i % 5)) + b'\0' * 100 for i in range(count)]
+
+
+class TestRewindBuffer:
+    """Test suite for the delta-compressed rewind history"""
+
+    def test_step_back_returns_earlier_frames_in_reverse(self):
+        """Test stepping back reproduces every earlier frame exactly"""
+        frames = blobs(25)
+        buffer = RewindBuffer(100, keyframe_interval=4)
+        for frame in frames:
+            buffer.push(frame)
+
+        restored = [buffer.step_back() for _ in range(24)]
+
+        assert restored == frames[-2::-1]
+        assert buffer.step_back() is None
+
+    def test_frame_reconstructs_from_keyframes(self):
+        """Test any held frame can be rebuilt from its keyframe"""
+        frames = blobs(25)
+        buffer = RewindBuffer(100, keyframe_interval=4)
+        for frame in frames:
+            buffer.push(frame)
+
+        assert [buffer.frame(i) for i in range(25)] == frames
+        assert buffer.frame(-1) == frames[-1]
+
+    def test_memory_stays_bounded(self):
+        """Test long sessions keep between capacity and capacity plus one keyframe group"""
+        frames = blobs(1000)
+        buffer = RewindBuffer(100, keyframe_interval=10)
+        for frame in frames:
+            buffer.push(frame)
+
+        assert 100 <= len(buffer) < 110
+        assert buffer.frame(0) == frames[-len(buffer)]
+        assert buffer.entries[0][0] is not None
+
+    def test_deltas_are_smaller_than_snapshots(self, pygame_init):
+        """Test a minute of play stays far below storing every snapshot"""
+        game = make_game(rewind_seconds=60)
+        script = ScriptedInput.demo()
+        game.state = 'playing'
+        game.invulnerable_duration = 10 ** 6
+        game.invulnerable = True
+        game.invulnerable_timer = 10 ** 6
+        for frame in range(1, 3600):
+            game.step(*script.poll(frame))
+
+        assert len(game.rewind) == 3599
+        assert game.rewind.nbytes < len(game.rewind) * len(game.save_state()) / 10
+
+
+class TestRewind:
+    """Test suite for rewinding a game with R"""
+
+    def play(self, game, frames):
+        script = ScriptedInput.demo()
+        states = []
+        for frame in range(frames):
+            game.step(*script.poll(frame))
+            states.append(game.save_state())
+        return states
+
+    def test_holding_r_runs_backwards(self, pygame_init):
+        """Test each tick with R held restores the previous frame"""
+        game = make_game()
+        states = self.play(game, 200)
+        assert game.state == 'playing'
+
+        for back in range(1, 31):
+            game.step(KeyState({pygame.K_r}), [])
+            assert game.save_state() == states[-1 - back]
+            assert game.rewinding
+
+    def test_play_resumes_after_rewind(self, pygame_init):
+        """Test releasing R continues from the rewound state like the original run"""
+        game = make_game()
+        script = ScriptedInput.demo()
+        for frame in range(150):
+            game.step(*script.poll(frame))
+        expected = []
+        for frame in range(150, 170):
+            game.step(*script.poll(frame))
+            expected.append(game.save_state())
+
+        for _ in range(20):
+            game.step(KeyState({pygame.K_r}), [])
+        resumed = []
+        for frame in range(150, 170):
+            game.step(*script.poll(frame))
+            resumed.append(game.save_state())
+
+        assert resumed == expected
+        assert not game.rewinding
+
+    def test_rewind_stops_at_oldest_frame(self, pygame_init):
+        """Test holding R past the start of history stays on the oldest frame"""
+        game = make_game(rewind_seconds=0.5)
+        self.play(game, 200)
+        oldest = game.rewind.frame(0)
+
+        for _ in range(100):
+            game.step(KeyState({pygame.K_r}), [])
+
+        assert game.save_state() == oldest
+
+    def test_new_game_clears_history(self, pygame_init):
+        """Test restarting cannot rewind into the previous game"""
+        game = make_game()
+        self.play(game, 100)
+
+        game.init_game()
+
+        assert len(game.rewind) == 0
+
+    def test_rewind_disabled_by_default(self, pygame_init):
+        """Test games without rewind_seconds ignore R"""
+        game = make_game(rewind_seconds=0)
+        self.play(game, 100)
+        before = game.save_state()
+
+        game.step(KeyState({pygame.K_r}), [])
+
+        assert game.rewind is None
+        assert game.save_state() != before
+
+    def test_replays_record_the_rewind_key(self):
+        """Test R survives the replay key encoding"""
+        keys = KeyState({pygame.K_r, pygame.K_LEFT})
+
+        decoded = decode_keys(encode_keys(keys))
+
+        assert decoded[pygame.K_r] and decoded[pygame.K_LEFT]
+
+    def test_replay_uses_the_recorded_rewind_length(self, pygame_init, tmp_path):
+        """Test a session that rewound past its history replays with the length stored in the file"""
+        path = tmp_path / 'rewound.ksr'
+        game = make_game(seed=5, rewind_seconds=2)
+        script = ScriptedInput.demo()
+        inputs = [script.poll(frame) for frame in range(300)]
+        # Hold R for longer than the 2 s of history, then play on
+        inputs += [(KeyState({pygame.K_r}), [])] * 200 + [script.poll(frame) for frame in range(300, 400)]
+        with InputRecorder(path, game.rng.seed, game.rewind_seconds) as recorder:
+            for keys, events in inputs:
+                recorder.record(keys, events)
+                game.step(keys, events)
+
+        with InputReplay(path) as replay:
+            assert replay.rewind_seconds == 2
+            replayed = make_game(seed=replay.seed, rewind_seconds=replay.rewind_seconds)
+            replayed.run_headless(input_source=replay)
+        with InputReplay(path) as replay:
+            longer = make_game(seed=replay.seed, rewind_seconds=10)
+            longer.run_headless(input_source=replay)
+
+        assert replayed.save_state() == game.save_state()
+        assert longer.save_state() != game.save_state()
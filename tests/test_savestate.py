@@ -0,0 +1,120 @@
+import pytest
+import pygame
+from unittest.mock import patch
+
+from main import Game, ScriptedInput
+
+
+@pytest.fixture
+def pygame_init():
+    """Initialize pygame for tests"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def make_game(seed):
+    with patch('pygame.image.load') as mock_load:
+        mock_load.return_value = pygame.Surface((50, 50))
+        return Game(headless=True, seed=seed)
+
+
+def play(game, script, start, frames):
+    """Step a game through frames of a script; returns the state after each frame"""
+    states = []
+    for frame in range(start, start + frames):
+        keys, events = script.poll(frame)
+        game.step(keys, events)
+        states.append(game.save_state())
+    return states
+
+
+class TestSaveState:
+    """Test suite for binary game snapshots"""
+
+    def test_restore_replays_identically(self, pygame_init):
+        """Test a restored game continues exactly like the original did"""
+        game = make_game(seed=4)
+        script = ScriptedInput.demo()
+        play(game, script, 0, 300)
+        assert game.enemies and game.state == 'playing'
+        blob = game.save_state()
+        expected = play(game, script, 300, 300)
+
+        game.load_state(blob)
+
+        assert play(game, script, 300, 300) == expected
+
+    def test_state_moves_between_games(self, pygame_init):
+        """Test a snapshot loaded into another game instance reproduces the run"""
+        game = make_game(seed=7)
+        script = ScriptedInput.demo()
+        play(game, script, 0, 250)
+        blob = game.save_state()
+        expected = play(game, script, 250, 200)
+
+        other = make_game(seed=123)
+        other.load_state(blob)
+
+        assert other.rng.seed == 7
+        assert play(other, script, 250, 200) == expected
+
+    def test_restored_entities_come_from_the_pools(self, pygame_init):
+        """Test restoring recycles pooled entities and keeps the pool counts right"""
+        game = make_game(seed=4)
+        play(game, ScriptedInput.demo(), 0, 300)
+        blob = game.save_state()
+
+        game.load_state(blob)
+
+        assert len(game.enemy_pool) == len(game.enemies)
+        assert len(game.wave_pool) == len(game.sonic_waves)
+        assert all(enemy in game.enemy_pool.objects for enemy in game.enemies)
+
+    def test_snapshot_is_compact(self, pygame_init):
+        """Test a snapshot is a few kilobytes, dominated by the RNG state"""
+        game = make_game(seed=4)
+        play(game, ScriptedInput.demo(), 0, 300)
+
+        assert len(game.save_state()) < 6 * 1024
+
+    def test_rejects_invalid_snapshots(self, pygame_init):
+        """Test bad data raises ValueError instead of corrupting the game"""
+        game = make_game(seed=4)
+        blob = game.save_state()
+
+        with pytest.raises(ValueError):
+            game.load_state(b'nope')
+        with pytest.raises(ValueError):
+            game.load_state(b'XXXX' + blob[4:])
+        game.state = 'playing'
+        with pytest.raises(ValueError):
+            game.load_state(blob[:40])
+        assert game.state == 'playing'
+
+    def test_rejects_more_enemies_than_the_pool_holds(self, pygame_init):
+        """Test a snapshot with too many enemies leaves a smaller game unchanged"""
+        with patch.object(Game, 'MAX_ENEMIES', 6):
+            source = make_game(seed=4)
+        source.state = 'playing'
+        for x in range(0, 600, 100):
+            source.enemies.append(source.enemy_pool.acquire(x, 400, source.sprite_images()[2], source.rng.ai))
+        blob = source.save_state()
+
+        game = make_game(seed=9)
+        play(game, ScriptedInput.demo(), 0, 200)
+        before = game.save_state()
+
+        with pytest.raises(ValueError):
+            game.load_state(blob)
+        assert game.save_state() == before
+
+    def test_rejects_trailing_bytes(self, pygame_init):
+        """Test a snapshot with extra data after the last wave is refused"""
+        game = make_game(seed=4)
+        blob = game.save_state()
+        game.state = 'playing'
+
+        with pytest.raises(ValueError):
+            game.load_state(blob + b'\0')
+        assert game.state == 'playing'
@@ -0,0 +1,124 @@
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import pygame
+from unittest.mock import patch
+
+import keycodes
+from main import Game, ScriptedInput
+from rect import Rect, round_half_away
+from simulation import Simulation
+
+SRC = Path(__file__).resolve().parent.parent / 'src'
+
+
+@pytest.fixture
+def pygame_init():
+    """Initialize pygame for tests"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+class TestRect:
+    """Test suite for the pure-Python Rect"""
+
+    def test_rounding_matches_pygame(self):
+        """Test float coordinates round like pygame.Rect assignment"""
+        rect = pygame.Rect(0, 0, 1, 1)
+        for value in (0.5, 1.5, 2.5, -0.5, -1.5, 0.49999, 2.6, -2.6, -0.3, 7.0, 400.2999999):
+            rect.y = value
+            assert round_half_away(value) == rect.y
+
+    def test_colliderect_matches_pygame(self):
+        """Test overlap tests agree with pygame.Rect, including touching and empty rects"""
+        rng = random.Random(3)
+        for _ in range(2000):
+            a = [rng.randint(0, 60), rng.randint(0, 60), rng.randint(0, 30), rng.randint(0, 30)]
+            b = [rng.randint(0, 60), rng.randint(0, 60), rng.randint(0, 30), rng.randint(0, 30)]
+            assert Rect(*a).colliderect(Rect(*b)) == pygame.Rect(a).colliderect(pygame.Rect(b))
+
+    def test_derived_attributes_match_pygame(self):
+        """Test edges, centre and unpacking match pygame.Rect"""
+        ours = Rect(10, 20, 50, 31)
+        theirs = pygame.Rect(10, 20, 50, 31)
+
+        assert (ours.right, ours.bottom, ours.center, ours.topleft) == \
+               (theirs.right, theirs.bottom, theirs.center, theirs.topleft)
+        assert tuple(ours) == tuple(theirs)
+        ours.bottom = 500
+        theirs.bottom = 500
+        assert ours == theirs
+
+
+class TestKeycodes:
+    """Test suite for the pygame-free key and event codes"""
+
+    def test_codes_match_pygame(self):
+        """Test every code has the value of the pygame constant of the same name"""
+        names = [name for name in vars(keycodes) if name.isupper() or name.startswith('K_')]
+
+        assert names
+        for name in names:
+            assert getattr(keycodes, name) == getattr(pygame, name), name
+
+
+class TestSimulation:
+    """Test suite for running the game without the pygame front end"""
+
+    def test_core_imports_without_pygame(self):
+        """Test the simulation, input, replay and sweep modules never import pygame"""
+        code = ("import sys, simulation, inputs, replay, savestate, rewind, sweep; "
+                "sys.exit('pygame' in sys.modules)")
+        result = subprocess.run([sys.executable, '-c', code], cwd=SRC)
+
+        assert result.returncode == 0
+
+    def test_matches_pygame_front_end(self, pygame_init):
+        """Test the core and the full Game play a seeded session identically"""
+        core = Simulation(seed=11)
+        with patch('pygame.image.load') as mock_load:
+            mock_load.return_value = pygame.Surface((50, 50))
+            game = Game(headless=True, seed=11)
+        core_input, game_input = ScriptedInput.demo(), ScriptedInput.demo()
+
+        for frame in range(900):
+            core.step(*core_input.poll(frame))
+            game.step(*game_input.poll(frame))
+            assert tuple(core.player.rect) == tuple(game.player.rect)
+
+        assert core.state == game.state == 'playing'
+        assert [tuple(enemy.rect) for enemy in core.enemies] == [tuple(enemy.rect) for enemy in game.enemies]
+        assert core.save_state() == game.save_state()
+
+    def test_state_moves_between_core_and_front_end(self, pygame_init):
+        """Test a save state from a headless core loads into a drawable Game"""
+        core = Simulation(seed=4)
+        core.run_headless(600)
+        with patch('pygame.image.load') as mock_load:
+            mock_load.return_value = pygame.Surface((50, 50))
+            game = Game(headless=True, seed=0)
+
+        game.load_state(core.save_state())
+
+        assert game.save_state() == core.save_state()
+        assert all(enemy.sprite is game.pumpkin_image for enemy in game.enemies)
+        game.draw()
+
+    def test_wave_pool_fits_the_fire_rate(self):
+        """Test the wave pool is sized from the cooldown and firing at its cap still shoots"""
+        fast = type('FastFire', (Simulation,), {'SHOOT_COOLDOWN': 2})(seed=0)
+        assert Simulation(seed=0).wave_pool.capacity == Simulation.wave_capacity() == 5
+        assert fast.wave_pool.capacity == 53
+        fast.state = 'playing'
+        fast.shoot_cooldown_timer = 0
+        capacity = fast.wave_pool.capacity
+        fast.sonic_waves = [fast.wave_pool.acquire(400, 300, 1) for _ in range(capacity)]
+
+        fast.handle_events([keycodes.Event(keycodes.KEYDOWN, key=keycodes.K_x)])
+
+        assert len(fast.sonic_waves) == capacity + 1
+        assert fast.sonic_waves[-1].x == fast.player.rect.centerx
@@ -0,0 +1,113 @@
+import json
+from pathlib import Path
+
+import pytest
+import pygame
+
+from spritegen import generate, load_spec, pack_layout, render_variant, spec_hash, DEFAULTS, ATLAS_WIDTH
+
+ASSETS = Path(__file__).resolve().parent.parent / 'assets'
+
+
+def write_spec(path, variants, defaults=None):
+    path.write_text(json.dumps({'defaults': defaults or {}, 'variants': variants}))
+    return str(path)
+
+
+def atlas_frame(tmp_path, name, frame=0):
+    metadata = json.loads((tmp_path / 'atlas.json').read_text())
+    atlas = pygame.image.load(str(tmp_path / 'atlas.png'))
+    return pygame.image.tobytes(atlas.subsurface(metadata['sprites'][name]['frames'][frame]), 'RGBA')
+
+
+@pytest.fixture
+def outputs(tmp_path):
+    return str(tmp_path / 'atlas.png'), str(tmp_path / 'atlas.json')
+
+
+class TestSpriteGen:
+    """Test suite for the procedural sprite generator"""
+
+    def test_spec_resolves_defaults_and_rejects_mistakes(self, tmp_path):
+        """Test variants inherit defaults and invalid entries raise ValueError"""
+        spec = write_spec(tmp_path / 'spec.json', [{'name': 'a'}, {'name': 'b', 'size': 40}], {'frames': 2})
+
+        a, b = load_spec(spec)
+
+        assert a == dict(DEFAULTS, name='a', frames=2)
+        assert (b['size'], b['frames']) == (40, 2)
+        assert spec_hash(a) != spec_hash(b)
+        for variants in ([{'name': 'a'}, {'name': 'a'}], [{'name': 'a', 'face': 'wink'}],
+                         [{'name': 'a', 'frames': 0}], [{'name': 'a', 'colour': [1, 2, 3]}],
+                         [{'name': 'a', 'eyes': [300, 0, 0]}], [{'size': 10}]):
+            with pytest.raises(ValueError):
+                load_spec(write_spec(tmp_path / 'bad.json', variants))
+
+    def test_default_variant_matches_shipped_enemy(self):
+        """Test the default pumpkin at 100px is pixel-identical to assets/enemy.png"""
+        frame, = render_variant(dict(DEFAULTS, name='pumpkin'))
+        shipped = pygame.image.load(str(ASSETS / 'enemy.png'))
+
+        assert pygame.image.tobytes(frame, 'RGBA') == pygame.image.tobytes(shipped, 'RGBA')
+
+    def test_animation_starts_at_rest(self):
+        """Test frame 0 of an animation is the still sprite and later frames differ"""
+        still, = render_variant(dict(DEFAULTS, name='a'))
+        frames = render_variant(dict(DEFAULTS, name='a', frames=4))
+
+        assert pygame.image.tobytes(frames[0], 'RGBA') == pygame.image.tobytes(still, 'RGBA')
+        assert pygame.image.tobytes(frames[1], 'RGBA') != pygame.image.tobytes(still, 'RGBA')
+
+    def test_layout_keeps_frames_apart(self):
+        """Test packed frames stay inside the atlas and never overlap"""
+        variants = [dict(DEFAULTS, name=f"v{i}", size=size, frames=frames)
+                    for i, (size, frames) in enumerate([(100, 12), (50, 7), (64, 3), (100, 1)])]
+
+        rects, (width, height) = pack_layout(variants)
+
+        placed = [pygame.Rect(rect) for frames in rects.values() for rect in frames]
+        assert len(placed) == 23
+        assert all(rect.right <= width == ATLAS_WIDTH and rect.bottom <= height for rect in placed)
+        assert not any(a.colliderect(b) for i, a in enumerate(placed) for b in placed[i + 1:])
+
+    def test_rerun_only_draws_changed_variants(self, tmp_path, outputs):
+        """Test unchanged variants are reused from the atlas and edits redraw just themselves"""
+        variants = [{'name': 'a'}, {'name': 'b', 'face': 'smile', 'frames': 3}, {'name': 'c', 'size': 50}]
+        spec = write_spec(tmp_path / 'spec.json', variants)
+
+        assert generate(spec, *outputs, workers=1) == ['a', 'b', 'c']
+        before = atlas_frame(tmp_path, 'b', 2)
+        assert generate(spec, *outputs, workers=1) == []
+
+        variants[0]['body'] = [10, 20, 30]
+        variants[2]['frames'] = 2
+        spec = write_spec(tmp_path / 'spec.json', variants)
+        assert generate(spec, *outputs, workers=1) == ['a', 'c']
+        assert atlas_frame(tmp_path, 'b', 2) == before
+        assert len(json.loads((tmp_path / 'atlas.json').read_text())['sprites']['c']['frames']) == 2
+
+        # Dropping a variant rewrites the atlas without drawing anything
+        spec = write_spec(tmp_path / 'spec.json', variants[:2])
+        assert generate(spec, *outputs, workers=1) == []
+        assert set(json.loads((tmp_path / 'atlas.json').read_text())['sprites']) == {'a', 'b'}
+        assert atlas_frame(tmp_path, 'b', 2) == before
+
+    def test_mismatched_atlas_is_redrawn(self, tmp_path, outputs):
+        """Test an atlas that no longer matches its metadata is not trusted"""
+        spec = write_spec(tmp_path / 'spec.json', [{'name': 'a'}])
+        generate(spec, *outputs, workers=1)
+        pygame.image.save(pygame.Surface((4, 4)), outputs[0])
+
+        assert generate(spec, *outputs, workers=1) == ['a']
+
+    def test_process_pool_matches_in_process(self, tmp_path):
+        """Test variants rendered by pool workers equal those drawn in-process"""
+        spec = write_spec(tmp_path / 'spec.json', [{'name': 'a', 'frames': 2}, {'name': 'b', 'size': 30}])
+        pooled = (str(tmp_path / 'pooled.png'), str(tmp_path / 'pooled.json'))
+        local = (str(tmp_path / 'local.png'), str(tmp_path / 'local.json'))
+
+        assert generate(spec, *pooled, workers=2) == ['a', 'b']
+        generate(spec, *local, workers=1)
+
+        assert pygame.image.tobytes(pygame.image.load(pooled[0]), 'RGBA') == \
+               pygame.image.tobytes(pygame.image.load(local[0]), 'RGBA')
@@ -0,0 +1,93 @@
+import gc
+
+import pytest
+import pygame
+
+from main import Enemy, Player
+from sprites import SpriteCache, sprite_cache
+
+
+@pytest.fixture
+def pygame_init():
+    """Initialize pygame for tests"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+@pytest.fixture
+def source_image():
+    """Create an asymmetric surface so flips are observable"""
+    surface = pygame.Surface((100, 100))
+    surface.fill((0, 0, 255))
+    surface.fill((255, 0, 0), pygame.Rect(0, 0, 50, 100))
+    return surface
+
+
+class TestSpriteCache:
+    """Test suite for the shared sprite cache"""
+
+    def test_same_key_returns_same_surface(self, pygame_init, source_image):
+        """Test repeated lookups reuse the cached surface"""
+        cache = SpriteCache()
+
+        first = cache.get(source_image, (50, 50))
+
+        assert cache.get(source_image, (50, 50)) is first
+        assert first.get_size() == (50, 50)
+
+    def test_flipped_sprite_is_mirrored(self, pygame_init, source_image):
+        """Test the flipped entry mirrors the scaled sprite horizontally"""
+        cache = SpriteCache()
+
+        right, left = cache.pair(source_image, (50, 50))
+
+        assert right.get_at((0, 25))[:3] == (255, 0, 0)
+        assert left.get_at((0, 25))[:3] == (0, 0, 255)
+
+    def test_entries_are_freed_with_their_source(self, pygame_init):
+        """Test dropping the last reference to a source image empties its entries"""
+        cache = SpriteCache()
+        source = pygame.Surface((100, 100))
+        packed = pygame.Surface((50, 50))
+        cache.pair(source, (50, 50))
+        cache.put(packed, (50, 50), packed)
+        cache.put(packed, (50, 50), pygame.Surface((50, 50)), flip=True)
+        assert len(cache) == 4
+        assert cache.get(packed, (50, 50)) is packed
+
+        del source, packed
+        gc.collect()
+
+        assert len(cache) == 0
+
+    def test_enemies_share_sprites(self, pygame_init, source_image):
+        """Test enemies built from one image share both orientations"""
+        first = Enemy(100, 100, source_image)
+        second = Enemy(200, 100, source_image)
+
+        assert first.original_image is second.original_image
+        assert first.flipped_image is second.flipped_image
+
+    def test_turning_does_not_allocate(self, pygame_init, source_image):
+        """Test changing facing swaps in the cached surface instead of flipping"""
+        enemy = Enemy(300, 100, source_image)
+        cached = len(sprite_cache)
+
+        enemy.set_facing(False)
+        enemy.set_facing(True)
+        enemy.set_facing(False)
+
+        assert enemy.image is sprite_cache.get(source_image, (50, 50), flip=True)
+        assert len(sprite_cache) == cached
+
+    def test_player_uses_cached_flip(self, pygame_init, source_image):
+        """Test the player turns left using the cached flipped sprite"""
+        player = Player(100, 100, source_image)
+        keys = {pygame.K_LEFT: True, pygame.K_RIGHT: False,
+                pygame.K_SPACE: False, pygame.K_UP: False,
+                pygame.K_a: False, pygame.K_d: False, pygame.K_w: False}
+
+        player.update(keys, 500)
+
+        assert player.image is sprite_cache.get(source_image, (50, 50), flip=True)
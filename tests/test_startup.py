@@ -0,0 +1,74 @@
+import pygame
+import pytest
+from unittest.mock import patch
+
+from main import Game
+from startup import StartupTimer
+
+
+@pytest.fixture
+def pygame_quit():
+    """Start and end each test with every pygame subsystem shut down"""
+    pygame.quit()
+    yield
+    pygame.quit()
+
+
+def make_game(**kwargs):
+    with patch('pygame.image.load') as mock_load:
+        mock_load.return_value = pygame.Surface((50, 50))
+        return Game(headless=True, seed=1, **kwargs)
+
+
+class TestStartupTimer:
+    """Test suite for startup phase timing"""
+
+    def test_laps_add_up_to_total(self):
+        """Test each lap is charged the time since the previous one"""
+        timer = StartupTimer()
+        timer.lap('one')
+        timer.lap('two')
+
+        assert [phase for phase, _ in timer.phases] == ['one', 'two']
+        assert sum(seconds for _, seconds in timer.phases) == pytest.approx(timer.total)
+
+    def test_report_lists_phases(self):
+        """Test the report has a row per phase and the total"""
+        timer = StartupTimer(start=0.0)
+        timer.lap('imports')
+
+        lines = timer.report().splitlines()
+
+        assert lines[1].startswith('imports')
+        assert lines[-1].startswith('total')
+
+
+class TestLazyStartup:
+    """Test suite for starting only the pygame subsystems a session uses"""
+
+    def test_headless_game_starts_no_subsystems(self, pygame_quit):
+        """Test a headless game initializes neither video, audio nor fonts"""
+        game = make_game()
+
+        assert not pygame.display.get_init()
+        assert not pygame.mixer.get_init()
+        assert not pygame.font.get_init()
+        assert game.running
+
+    def test_fonts_created_on_first_draw(self, pygame_quit):
+        """Test the font module starts when text is first drawn"""
+        game = make_game()
+
+        game.draw()
+
+        assert pygame.font.get_init()
+        assert game.font_large is game.font_large
+
+    def test_game_records_startup_phases(self, pygame_quit):
+        """Test construction laps the shared timer for each phase"""
+        timer = StartupTimer()
+        timer.lap('imports')
+
+        make_game(startup=timer)
+
+        assert [phase for phase, _ in timer.phases] == ['imports', 'display', 'images', 'simulation']
@@ -0,0 +1,96 @@
+import csv
+
+import pytest
+import pygame
+
+from main import Game
+from inputs import BotInput
+from sweep import parse_param, parse_seeds, grid, make_game, play, run_sweep
+
+
+@pytest.fixture
+def pygame_init():
+    """Initialize pygame for tests"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def read_rows(path):
+    with open(path, newline='') as stream:
+        return list(csv.DictReader(stream))
+
+
+class TestSweep:
+    """Test suite for the balancing sweep runner"""
+
+    def test_parse_param_and_seeds(self):
+        """Test grid and seed arguments are parsed"""
+        assert parse_param('max_enemies=3,5') == ('MAX_ENEMIES', [3, 5])
+        assert parse_seeds('3') == [0, 1, 2]
+        assert parse_seeds('10-12') == [10, 11, 12]
+        assert parse_seeds('4,8') == [4, 8]
+        with pytest.raises(ValueError):
+            parse_param('GRAVITY=1')
+
+    def test_grid_expands_every_combination(self):
+        """Test the grid is the cartesian product of the parameter values"""
+        combos = grid([('MAX_ENEMIES', [3, 5]), ('SHOOT_COOLDOWN', [20, 30, 40])])
+
+        assert len(combos) == 6
+        assert combos[0] == {'MAX_ENEMIES': 3, 'SHOOT_COOLDOWN': 20}
+
+    def test_play_applies_overrides_and_is_deterministic(self, pygame_init):
+        """Test a game plays with the overridden tuning and reproduces per seed"""
+        first = play({'MAX_ENEMIES': 1, 'INVULNERABLE_DURATION': 1}, seed=3, frames=600, input_name='demo')
+        second = play({'MAX_ENEMIES': 1, 'INVULNERABLE_DURATION': 1}, seed=3, frames=600, input_name='demo')
+
+        assert first == second
+        assert first['MAX_ENEMIES'] == 1
+        assert 0 < first['survival_frames'] <= 600
+        assert Game.MAX_ENEMIES == 5
+
+    def test_fast_fire_is_not_capped_by_the_wave_pool(self):
+        """Test a swept cooldown resizes the wave pool and every shot the bot lands is fired"""
+        game = make_game({'SHOOT_COOLDOWN': 2}, seed=1)
+        bot = BotInput(game)
+        assert game.wave_pool.capacity > make_game({}, seed=1).wave_pool.capacity
+
+        most_alive = 0
+        for frame in range(600):
+            game.step(*bot.poll(frame))
+            most_alive = max(most_alive, len(game.sonic_waves))
+
+        # The old fixed pool held 16 waves
+        assert most_alive > 16
+
+    def test_sweep_resumes_without_replaying(self, tmp_path):
+        """Test a rerun only plays the games missing from the output file"""
+        output = tmp_path / 'sweep.csv'
+        params = [('MAX_ENEMIES', [2, 4])]
+
+        assert run_sweep(params, [0, 1], str(output), frames=120, workers=2) == 4
+        # Simulate an interruption that left a partial row behind
+        with open(output, 'a') as stream:
+            stream.write('2,2,1')
+        assert run_sweep(params, [0, 1, 2], str(output), frames=120, workers=2) == 2
+
+        rows = read_rows(output)
+        keys = [(row['MAX_ENEMIES'], row['seed']) for row in rows if row['game_over'] is not None]
+        assert sorted(keys) == sorted((str(m), str(s)) for m in (2, 4) for s in (0, 1, 2))
+        summary = read_rows(tmp_path / 'sweep_summary.csv')
+        assert [row['runs'] for row in summary] == ['3', '3']
+
+    def test_sweep_replays_a_row_cut_off_after_a_comma(self, tmp_path):
+        """Test a last line missing only its final field is replayed, not summarized"""
+        output = tmp_path / 'sweep.csv'
+        params = [('MAX_ENEMIES', [2])]
+        run_sweep(params, [0], str(output), frames=120, workers=1)
+        lines = output.read_text().splitlines()
+        # Drop the row's last value but keep the comma before it
+        output.write_text('\n'.join(lines[:-1] + [lines[-1][:lines[-1].rindex(',') + 1]]))
+
+        assert run_sweep(params, [0], str(output), frames=120, workers=1) == 1
+
+        summary = read_rows(tmp_path / 'sweep_summary.csv')
+        assert [row['runs'] for row in summary] == ['1']
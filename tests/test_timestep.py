@@ -0,0 +1,45 @@
+import pytest
+
+from timestep import FixedTimestep
+
+
+class TestFixedTimestep:
+    """Test suite for the fixed-timestep accumulator"""
+
+    def test_slow_frame_runs_several_ticks(self):
+        """Test a frame lasting several ticks pays them all out"""
+        timestep = FixedTimestep(60)
+
+        assert timestep.advance(3.5 / 60) == 3
+        assert timestep.alpha == pytest.approx(0.5)
+
+    def test_fast_frames_accumulate_into_one_tick(self):
+        """Test frames shorter than a tick run no tick until time adds up"""
+        timestep = FixedTimestep(60)
+
+        ticks = [timestep.advance(1 / 144) for _ in range(5)]
+
+        assert ticks == [0, 0, 1, 0, 1]
+        assert 0.0 <= timestep.alpha < 1.0
+
+    def test_tick_count_is_independent_of_frame_rate(self):
+        """Test one second of real time yields the tick rate however it is sliced"""
+        for fps in (30, 60, 144, 240):
+            timestep = FixedTimestep(60)
+            ticks = sum(timestep.advance(1 / fps) for _ in range(fps))
+            assert abs(ticks - 60) <= 1
+
+    def test_stall_is_clamped(self):
+        """Test a long stall credits at most max_frame_time"""
+        timestep = FixedTimestep(60, max_frame_time=0.25)
+
+        assert timestep.advance(5.0) == 15
+
+    def test_reset_drops_leftover_time(self):
+        """Test reset clears the accumulator"""
+        timestep = FixedTimestep(60)
+        timestep.advance(0.5 / 60)
+
+        timestep.reset()
+
+        assert timestep.alpha == 0.0
@@ -0,0 +1,104 @@
+import pytest
+import pygame
+from unittest.mock import patch
+
+from main import Game, KeyState
+from timestep import FixedTimestep
+
+
+@pytest.fixture
+def pygame_init():
+    """Initialize pygame for tests"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def make_game(seed=5, turbo=1):
+    with patch('pygame.image.load') as mock_load:
+        mock_load.return_value = pygame.Surface((50, 50))
+        return Game(headless=True, seed=seed, turbo=turbo)
+
+
+def key_down(key):
+    return pygame.event.Event(pygame.KEYDOWN, key=key)
+
+
+class TestTurbo:
+    """Test suite for fast-forward mode"""
+
+    def test_scale_multiplies_ticks(self):
+        """Test a 4x timestep pays out four ticks per real tick"""
+        timestep = FixedTimestep(60, scale=4)
+
+        assert [timestep.advance(1 / 60) for _ in range(3)] == [4, 4, 4]
+
+    def test_t_cycles_speeds(self, pygame_init):
+        """Test T steps through every turbo speed and wraps to normal"""
+        game = make_game()
+        seen = []
+        for _ in range(len(Game.TURBO_SPEEDS)):
+            game.handle_events([key_down(pygame.K_t)])
+            seen.append(game.turbo)
+
+        assert seen == [2, 4, 8, 0, 1]
+
+    def test_turbo_matches_normal_speed(self, pygame_init):
+        """Test fast-forwarded frames simulate exactly the ticks normal stepping would"""
+        keys = KeyState({pygame.K_RIGHT, pygame.K_UP})
+        turbo = make_game(turbo=8)
+        turbo.TURBO_FRAME_BUDGET = 60.0
+        timestep = FixedTimestep(Game.TICK_RATE)
+        ticks = turbo.run_frame(timestep, 1 / 60, keys, [key_down(pygame.K_SPACE)])
+        for _ in range(49):
+            ticks += turbo.run_frame(timestep, 1 / 60, keys, [])
+
+        normal = make_game()
+        normal.step(keys, [key_down(pygame.K_SPACE)])
+        for _ in range(ticks - 1):
+            normal.step(keys, [])
+
+        assert ticks == 400
+        assert turbo.ticks == normal.ticks
+        assert turbo.save_state() == normal.save_state()
+
+    def test_timers_count_every_tick(self, pygame_init):
+        """Test frame-counted timers advance once per simulated tick in turbo"""
+        game = make_game(turbo=4)
+        game.TURBO_FRAME_BUDGET = 60.0
+        timestep = FixedTimestep(Game.TICK_RATE)
+        game.run_frame(timestep, 1 / 60, KeyState(), [key_down(pygame.K_SPACE)])
+        game.run_frame(timestep, 1 / 60, KeyState(), [key_down(pygame.K_x)])
+
+        # Shot on the first of the four ticks; every one of them cools down
+        assert game.shoot_cooldown_timer == Game.SHOOT_COOLDOWN - 4
+
+    def test_budget_limits_ticks_per_frame(self, pygame_init):
+        """Test an exhausted frame budget drops the ticks still owed"""
+        game = make_game(turbo=0)
+        game.TURBO_FRAME_BUDGET = 0.0
+        timestep = FixedTimestep(Game.TICK_RATE)
+
+        assert game.run_frame(timestep, 1 / 60, KeyState(), []) == 1
+        assert timestep.accumulator == 0.0
+
+    def test_normal_speed_ignores_budget(self, pygame_init):
+        """Test 1x pays out every owed tick regardless of the turbo budget"""
+        game = make_game()
+        game.TURBO_FRAME_BUDGET = 0.0
+        timestep = FixedTimestep(Game.TICK_RATE)
+
+        assert game.run_frame(timestep, 3 / 60, KeyState(), []) == 3
+
+    def test_pipelined_alpha_follows_turbo_tick_length(self, pygame_init):
+        """Test pipelined interpolation measures time in ticks of the current speed"""
+        game = make_game()
+        snapshot = game.snapshot()
+        half_tick = snapshot.time + 0.5 / Game.TICK_RATE
+
+        assert game.snapshot_alpha(snapshot, half_tick) == pytest.approx(0.5)
+        game.turbo = 4
+        assert game.snapshot_alpha(snapshot, snapshot.time + 0.125 / Game.TICK_RATE) == pytest.approx(0.5)
+        assert game.snapshot_alpha(snapshot, half_tick) == 1.0
+        game.turbo = 0
+        assert game.snapshot_alpha(snapshot, snapshot.time) == 1.0
@@ -0,0 +1,168 @@
+import subprocess
+import sys
+
+import pytest
+import pygame
+
+np = pytest.importorskip("numpy")
+
+from main import Player, SonicWave, KeyState
+from vec_env import (
+    VecGame, MOVE_LEFT, MOVE_RIGHT, JUMP, SHOOT, OBS_SIZE, GROUND_Y, PLAYER_START_X,
+    MIN_SPAWN_DISTANCE, INVULNERABLE_FRAMES, PLAYER_OBS, MAX_ENEMIES,
+)
+
+
+@pytest.fixture
+def pygame_init():
+    """Initialize pygame for tests"""
+    pygame.init()
+    yield
+    pygame.quit()
+
+
+def no_spawns(env):
+    env.spawn_timer[:] = 10 ** 9
+    return env
+
+
+def place_enemy(env, game, slot, x, y):
+    env.enemy_alive[game, slot] = True
+    env.enemy_x[game, slot] = x
+    env.enemy_y[game, slot] = y
+    env.move_direction[game, slot] = 0
+    env.direction_timer[game, slot] = 0
+    env.direction_change_interval[game, slot] = 10 ** 9
+    env.boundary_timer[game, slot] = 0
+
+
+class TestVecGame:
+    """Test suite for the batched game environment"""
+
+    def test_vec_env_does_not_import_pygame(self):
+        """Test the batched environment runs without pygame"""
+        code = "import sys, vec_env; vec_env.VecGame(4).step([0] * 4); assert 'pygame' not in sys.modules"
+        result = subprocess.run([sys.executable, '-c', code], cwd='src', capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+
+    def test_step_returns_arrays_per_game(self):
+        """Test step returns observation, health and done arrays for every game"""
+        env = VecGame(8, seed=1)
+
+        obs, health, done = env.step(np.zeros(8, dtype=np.int64))
+
+        assert obs.shape == (8, OBS_SIZE)
+        assert obs.dtype == np.float32
+        assert health.tolist() == [3] * 8
+        assert not done.any()
+
+    def test_player_matches_player_update(self, pygame_init):
+        """Test player movement and jumping follow Player.update exactly"""
+        env = no_spawns(VecGame(1, seed=1))
+        player = Player(PLAYER_START_X, GROUND_Y - 50, pygame.Surface((50, 50)))
+        script = [0] * 3 + [MOVE_RIGHT] * 20 + [MOVE_RIGHT | JUMP] * 5 + [MOVE_LEFT] * 40 + [JUMP] * 60
+
+        for action in script:
+            keys = KeyState(key for bit, key in ((MOVE_LEFT, pygame.K_LEFT), (MOVE_RIGHT, pygame.K_RIGHT),
+                                                 (JUMP, pygame.K_SPACE)) if action & bit)
+            player.update(keys, GROUND_Y)
+            env.step(np.array([action]))
+            assert (env.player_x[0], env.player_y[0]) == (player.rect.x, player.rect.y)
+            assert env.player_vel_y[0] == player.vel_y
+            assert env.facing_right[0] == player.facing_right
+
+    def test_shots_fire_on_press_and_respect_cooldown(self):
+        """Test holding shoot fires once and a new press waits for the cooldown"""
+        env = no_spawns(VecGame(1, seed=1))
+        wave = SonicWave(PLAYER_START_X + 25, GROUND_Y - 25, 1)
+
+        env.step(np.array([SHOOT]))
+        wave.update()
+        env.step(np.array([SHOOT]))
+        wave.update()
+        env.step(np.array([0]))
+        env.step(np.array([SHOOT]))
+
+        assert env.wave_alive[0].sum() == 1
+        live = env.wave_alive[0].argmax()
+        assert env.wave_x[0, live] == wave.x + 2 * wave.speed
+        assert env.wave_y[0, live] == wave.y
+
+    def test_spawns_keep_their_distance_from_the_player(self):
+        """Test spawned enemies appear at least MIN_SPAWN_DISTANCE from the player"""
+        env = VecGame(500, seed=2)
+
+        env.step(np.zeros(500, dtype=np.int64))
+
+        assert env.enemy_alive.any(axis=1).all()
+        distance = np.abs(env.enemy_x - env.player_x[:, None])[env.enemy_alive]
+        # Enemies take their first step in the frame they spawn
+        assert (distance >= MIN_SPAWN_DISTANCE - 3).all()
+
+    def test_enemies_stay_on_screen_and_land(self):
+        """Test enemy AI keeps enemies on screen and on the ground"""
+        env = VecGame(64, seed=3)
+
+        for _ in range(600):
+            env.step(np.zeros(64, dtype=np.int64))
+
+        alive = env.enemy_alive
+        assert alive.any()
+        assert ((env.enemy_x >= 0) & (env.enemy_x <= 750))[alive].all()
+        assert (env.enemy_y + 50 <= GROUND_Y)[alive].all()
+
+    def test_wave_hit_removes_wave_and_enemy(self):
+        """Test a wave touching an enemy removes both"""
+        env = no_spawns(VecGame(2, seed=1))
+        place_enemy(env, 0, 0, PLAYER_START_X + 60, GROUND_Y - 50)
+        place_enemy(env, 1, 0, 600, GROUND_Y - 50)
+
+        for _ in range(3):
+            env.step(np.array([SHOOT, SHOOT]))
+
+        assert not env.enemy_alive[0].any() and not env.wave_alive[0].any()
+        assert env.enemy_alive[1, 0] and env.wave_alive[1].any()
+
+    def test_contact_damage_then_invulnerability(self):
+        """Test touching an enemy costs one heart and starts invulnerability"""
+        env = no_spawns(VecGame(1, seed=1))
+        place_enemy(env, 0, 0, PLAYER_START_X + 10, GROUND_Y - 50)
+
+        _, health, _ = env.step(np.array([0]))
+        assert health[0] == 2
+        assert env.invulnerable_timer[0] == INVULNERABLE_FRAMES
+
+        _, health, _ = env.step(np.array([0]))
+        assert health[0] == 2
+
+    def test_finished_games_reset_automatically(self):
+        """Test a game that loses its last heart reports done and starts over"""
+        env = no_spawns(VecGame(2, seed=1))
+        env.health[0] = 1
+        env.player_x[0] = 400
+        place_enemy(env, 0, 0, 410, GROUND_Y - 50)
+
+        obs, health, done = env.step(np.array([0, 0]))
+
+        assert done.tolist() == [True, False]
+        assert health[0] == 0
+        assert env.health[0] == 3
+        assert obs[0, 0] == PLAYER_START_X
+        assert not env.enemy_alive[0].any()
+
+    def test_observation_buffer_is_reused(self):
+        """Test observations are written into one array and dead slots read as zero"""
+        env = no_spawns(VecGame(2, seed=1))
+        place_enemy(env, 0, 0, 300, GROUND_Y - 50)
+        env.enemy_alive[1, 0] = False
+        env.enemy_x[1, 0] = 300
+        env.wave_x[1, 0] = -10
+
+        first, _, _ = env.step(np.zeros(2, dtype=np.int64))
+        second, _, _ = env.step(np.zeros(2, dtype=np.int64))
+
+        assert second is first
+        start = len(PLAYER_OBS)
+        assert second[0, start] == env.enemy_x[0, 0] == 300
+        assert not second[1, start:start + MAX_ENEMIES].any()
+        assert not np.signbit(second[1]).any() and not second[1, start:].any()